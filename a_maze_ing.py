@@ -1,23 +1,297 @@
 #!/usr/bin/env python3
 
-from typing import Tuple, cast
+import argparse
+import time
+from typing import List, Optional, Tuple, cast
+from config.constants import ALGORITHMS
+from config.limits import estimate_cost
 from config.parser import parse_config_file
-from config.validator import validate_config
+from config.types import ConfigDict
+from config.validator import (
+    is_large_maze,
+    is_streaming,
+    tiled_workers,
+    validate_business_rules,
+    validate_config,
+)
+from mazegen.batch import build_tasks, run_batch
+from mazegen.eller import save_eller_hex
+from mazegen.growing_tree import DEFAULT_POLICY
 from mazegen.maze import Maze
-from mazegen.maze_generator import MazeGenerator
+from mazegen.maze_generator import MazeGenerator, logo_42_cells
+from mazegen.profiling import Profiler
+from mazegen.solver import save_solution, shortest_path
+from mazegen.tiled import generate_tiled
 from render import AsciiRender, PygameRender
-import sys
+
+
+def parse_size(value: str) -> Tuple[int, int]:
+    """Parse a ``WIDTHxHEIGHT`` size such as ``20x15``."""
+    try:
+        width, height = (int(v) for v in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid size: {value}")
+    return width, height
+
+
+def parse_sizes(value: str) -> List[Tuple[int, int]]:
+    """Parse comma separated sizes such as ``10x10,30x30``."""
+    return [parse_size(v) for v in value.split(",")]
+
+
+def parse_pos(value: str) -> Tuple[int, int]:
+    """Parse an ``X,Y`` position."""
+    try:
+        x, y = (int(v) for v in value.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid position: {value}")
+    return x, y
+
+
+def parse_seeds(value: str) -> List[int]:
+    """Parse a seed list such as ``1,2,5`` or a range such as ``1-100``."""
+    seeds: List[int] = []
+    try:
+        for part in value.split(","):
+            if "-" in part:
+                first, last = (int(v) for v in part.split("-"))
+                seeds.extend(range(first, last + 1))
+            else:
+                seeds.append(int(part))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid seeds: {value}")
+    return seeds
+
+
+def parse_bools(value: str) -> List[bool]:
+    """Parse a list of booleans such as ``true,false``."""
+    flags = {"true": True, "false": False}
+    try:
+        return [flags[v.strip().lower()] for v in value.split(",")]
+    except KeyError:
+        raise argparse.ArgumentTypeError(f"Invalid booleans: {value}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="A-Maze-Ing")
+    parser.add_argument("config", nargs="?", help="configuration file")
+    parser.add_argument("--profile", nargs="?", const="", default=None,
+                        metavar="TRACE",
+                        help="print the time spent in every phase and "
+                        "optionally save a Chrome trace to TRACE")
+
+    large = parser.add_argument_group("large mazes")
+    large.add_argument("--large", action="store_true",
+                       help="generate and save without interactive display")
+    large.add_argument("--memory-limit", type=int, default=None,
+                       help="memory budget in MB (default: half the RAM)")
+    large.add_argument("--time-limit", type=int, default=None,
+                       help="time budget in seconds (default: 3600)")
+    large.add_argument("--tiled", action="store_true",
+                       help="generate in tiles on --workers processes")
+
+    batch = parser.add_argument_group("batch mode")
+    batch.add_argument("--batch", action="store_true",
+                       help="generate a grid of mazes on a process pool")
+    batch.add_argument("--sizes", type=parse_sizes, default=[(20, 15)],
+                       help="comma separated sizes, e.g. 10x10,30x30")
+    batch.add_argument("--algorithms", type=lambda v: v.split(","),
+                       default=["dfs"], help="comma separated algorithms")
+    batch.add_argument("--seeds", type=parse_seeds, default=[1],
+                       help="seeds, e.g. 1,2,3 or 1-100")
+    batch.add_argument("--perfect", type=parse_bools, default=[True],
+                       help="perfect flags, e.g. true,false")
+    batch.add_argument("--entry", type=parse_pos, default=(0, 0),
+                       help="entry position X,Y")
+    batch.add_argument("--exit", type=parse_pos, default=None,
+                       help="exit position X,Y (default bottom-right)")
+    batch.add_argument("--workers", type=int, default=None,
+                       help="worker processes for batch and tiled "
+                       "generation (default: CPU count)")
+    batch.add_argument("--chunksize", type=int, default=None,
+                       help="tasks sent to a worker at once")
+    batch.add_argument("--output-dir", default=None,
+                       help="directory where solved mazes are saved")
+
+    return parser.parse_args(argv)
+
+
+def run_batch_mode(args: argparse.Namespace) -> None:
+    """Generate every maze of the requested parameter grid."""
+    for algorithm in args.algorithms:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Invalid algorithm: {algorithm}. "
+                             f"Allowed values: {ALGORITHMS}")
+    for width, height in args.sizes:
+        for algorithm in args.algorithms:
+            validate_business_rules({
+                **apply_large_options({
+                    "width": width,
+                    "height": height,
+                    "entry": args.entry,
+                    "exit": args.exit or (width - 1, height - 1),
+                    "algorithm": algorithm,
+                    "stream": False,
+                }, args),
+                "tiled": False,
+            })
+
+    tasks = build_tasks(
+        sizes=args.sizes,
+        algorithms=args.algorithms,
+        seeds=args.seeds,
+        perfect=args.perfect,
+        entries=[args.entry],
+        exits=[args.exit],
+    )
+
+    print(f"-------Batch: {len(tasks)} mazes-------")
+    start = time.perf_counter()
+    failed = 0
+    for result in run_batch(tasks, workers=args.workers,
+                            chunksize=args.chunksize,
+                            output_dir=args.output_dir):
+        task = result.task
+        label = (f"{task.width}x{task.height} {task.algorithm} "
+                 f"seed={task.seed} perfect={task.perfect}")
+        if result.error is not None:
+            failed += 1
+            print(f"{label}: {result.error}")
+            continue
+        length = len(result.path) if result.path else 0
+        print(f"{label}: path={length} "
+              f"gen={result.generate_time * 1000:.2f}ms "
+              f"solve={result.solve_time * 1000:.2f}ms")
+
+    elapsed = time.perf_counter() - start
+    print(f"\n{len(tasks) - failed}/{len(tasks)} mazes in {elapsed:.2f}s")
+
+
+def apply_large_options(
+    config: ConfigDict,
+    args: argparse.Namespace,
+) -> ConfigDict:
+    """Override the large-maze settings of a config with CLI options."""
+    if args.large:
+        config["large"] = True
+    if args.memory_limit is not None:
+        config["memory_limit"] = args.memory_limit
+    if args.time_limit is not None:
+        config["time_limit"] = args.time_limit
+    if args.tiled:
+        config["tiled"] = True
+    if args.workers is not None:
+        config["workers"] = args.workers
+    return config
+
+
+def run_large_mode(
+    maze: Maze,
+    generator: MazeGenerator,
+    algorithm: str,
+    output_file: str,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    profiler: Optional[Profiler] = None,
+) -> None:
+    """Generate, solve and save a large maze without displaying it.
+
+    If ``workers`` is given, the maze is generated in tiles on that
+    many processes (see `mazegen.tiled`).
+    """
+    profiler = profiler or Profiler(enabled=False)
+    estimate = estimate_cost(maze.width, maze.height, algorithm,
+                             workers=workers)
+    print(f"-------Large maze: {maze.width}x{maze.height}-------")
+    print(f"Estimated: {estimate.memory / 2 ** 20:.0f} MB, "
+          f"{estimate.seconds:.0f}s")
+
+    start = time.perf_counter()
+    with profiler.phase("generate", maze):
+        if workers is not None:
+            generate_tiled(maze, algorithm, seed, workers,
+                           policy=generator.policy)
+        else:
+            generator.generate_maze(maze, algorithm)
+    generated = time.perf_counter()
+    with profiler.phase("solve", maze):
+        path = shortest_path(maze)
+    solved = time.perf_counter()
+
+    with profiler.phase("save", maze):
+        saved = save_solution(maze, path, output_file)
+    if not saved:
+        print("No path from entry to exit, nothing saved")
+        return
+
+    print(f"Generated in {generated - start:.2f}s, "
+          f"solved in {solved - generated:.2f}s, "
+          f"path length {len(path or [])}")
+    print(f"Saved to {output_file}")
+
+
+def run_streaming_mode(
+    width: int,
+    height: int,
+    entry: Tuple[int, int],
+    exit: Tuple[int, int],
+    seed: int,
+    output_file: str,
+    profiler: Optional[Profiler] = None,
+) -> None:
+    """Stream a large maze to the output file row by row."""
+    profiler = profiler or Profiler(enabled=False)
+    fixed = logo_42_cells(width, height)
+    if entry in fixed or exit in fixed:
+        print("The entry or the exit are on an invalid position")
+        return
+
+    print(f"-------Streaming maze: {width}x{height}-------")
+    start = time.perf_counter()
+    with profiler.phase("stream", cells=width * height):
+        save_eller_hex(output_file, width, height, seed, entry, exit,
+                       fixed)
+    print(f"Generated in {time.perf_counter() - start:.2f}s "
+          "(no solution line: the maze is never held in memory)")
+    print(f"Saved to {output_file}")
+
+
+def report_profile(profiler: Profiler, trace_file: Optional[str]) -> None:
+    """Print the profile summary and save the trace if requested."""
+    if not profiler.enabled or not profiler.records:
+        return
+    print(profiler.summary())
+    if trace_file:
+        try:
+            profiler.save_trace(trace_file)
+        except OSError as e:
+            print(f"Could not save the trace: {e}")
+            return
+        print(f"Trace saved to {trace_file}")
 
 
 def main() -> None:
     print("A-Maze-Ing\n")
+    profiler = Profiler(enabled=False)
+    trace_file: Optional[str] = None
     try:
-        if not (len(sys.argv) > 1):
+        args = parse_args()
+        if args.batch:
+            run_batch_mode(args)
+            return
+        if args.config is None:
             print("Invalid arguments, example -> "
                   "python3 a_maze_ing.py config.txt")
             return
-        config = parse_config_file(sys.argv[1])
-        validate_config(config)
+        profiler = Profiler(enabled=args.profile is not None)
+        trace_file = args.profile or None
+        with profiler.phase("parse"):
+            config = apply_large_options(parse_config_file(args.config),
+                                         args)
+        with profiler.phase("validate"):
+            validate_config(config)
+        large = is_large_maze(config)
 
         print("-------Config-------")
         print(config)
@@ -32,40 +306,63 @@ def main() -> None:
         display: str = cast(str, config["display"])
         perfect: bool = cast(bool, config["perfect"])
 
+        if is_streaming(config):
+            run_streaming_mode(width, height, entry, exit, seed,
+                               output_file, profiler)
+            return
+
         maze = Maze(
             width=width,
             height=height,
             entry=entry,
             exit=exit,
-            perfect=perfect
+            perfect=perfect,
+            compact=large,
+        )
+        generator = MazeGenerator(
+            seed,
+            policy=cast(str, config.get("policy", DEFAULT_POLICY)),
         )
-        generator = MazeGenerator(seed)
         try:
-            generator.set_logo_42(maze)
+            with profiler.phase("logo", maze):
+                generator.set_logo_42(maze)
         except Exception:
             print("The entry or the exit are on an invalid position")
             return
-        generator.generate_maze(maze, algorithm)
-
-        if display == "ascii":
-            AsciiRender(output_file).run(
-                maze,
-                generator=generator,
-                algorithm=algorithm,
-                apply_logo_42=True,
-                seed=seed,
-            )
-        else:
-            PygameRender(cell_size=32,
-                         output_file=output_file).draw_maze(
-                maze,
-                generator=generator,
-                algorithm=algorithm,
-                apply_logo_42=True,
-                seed=seed,
-            )
+
+        if large:
+            workers = tiled_workers(config)
+            run_large_mode(maze, generator, algorithm, output_file,
+                           seed, workers, profiler)
+            return
+
+        with profiler.phase("generate", maze):
+            generator.generate_maze(maze, algorithm)
+
+        # The interactive session solves, saves and redraws on demand,
+        # so its time is attributed to a single "render" phase
+        with profiler.phase("render", maze):
+            if display == "ascii":
+                AsciiRender(output_file).run(
+                    maze,
+                    generator=generator,
+                    algorithm=algorithm,
+                    apply_logo_42=True,
+                    seed=seed,
+                )
+            else:
+                PygameRender(cell_size=32,
+                             output_file=output_file).draw_maze(
+                    maze,
+                    generator=generator,
+                    algorithm=algorithm,
+                    apply_logo_42=True,
+                    seed=seed,
+                )
     except (ValueError, FileNotFoundError) as e:
         print(e)
+    finally:
+        report_profile(profiler, trace_file)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,16 @@
+"""
+Benchmark suite for the maze generators, solver, file output and
+renderers.
+
+Usage:
+    python -m benchmarks run [--full] [--filter TEXT] [--repeat N]
+                             [--output FILE]
+    python -m benchmarks compare BASELINE CURRENT [--threshold 0.1]
+"""
+
+__version__ = "1.0.0"
+
+from .cases import Case, build_cases
+from .runner import compare, environment, run_cases
+
+__all__ = ["Case", "build_cases", "compare", "environment", "run_cases"]
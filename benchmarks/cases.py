@@ -0,0 +1,204 @@
+"""
+cases.py
+Benchmark cases. Each case builds its input outside the timed region
+and returns the callable that is timed.
+"""
+
+import atexit
+import io
+import os
+import shutil
+import tempfile
+from contextlib import redirect_stdout
+from typing import Callable, List, NamedTuple, Tuple
+
+from mazegen.maze import Maze
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solver import SOLVERS, save_solution, shortest_path
+
+Size = Tuple[int, int]
+
+# Size ladders; the full ladder adds the large sizes
+QUICK_SIZES: List[Size] = [(10, 10), (30, 30), (100, 100)]
+FULL_SIZES: List[Size] = QUICK_SIZES + [(300, 300), (1000, 1000)]
+
+# Renderers are only timed on sizes that can be displayed
+RENDER_SIZES: List[Size] = [(10, 10), (30, 30), (60, 60)]
+
+# "backtracking" is an alias of "dfs"
+GENERATORS = [
+    "dfs", "prim", "growing_tree", "kruskal", "eller",
+    "binary_tree", "sidewinder",
+]
+
+SEED = 42
+
+
+class Case(NamedTuple):
+    """One benchmark.
+
+    Attributes:
+        name (str): Unique name, ``group/variant/size``.
+        group (str): Benchmark group (generate, solve, io, render).
+        setup (Callable[[], Callable[[], object]]): Builds the input
+            and returns the function to time. Called before every
+            repetition, so timed functions may mutate their input.
+    """
+
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], object]]
+
+
+def _size_name(size: Size) -> str:
+    """Format a size as ``WxH``."""
+    return f"{size[0]}x{size[1]}"
+
+
+def _new_maze(size: Size, perfect: bool = True) -> Tuple[Maze, MazeGenerator]:
+    """Create an empty maze with the '42' logo and its generator."""
+    width, height = size
+    maze = Maze(width, height, perfect=perfect, seed=SEED,
+                entry=(0, 0), exit=(width - 1, height - 1),
+                compact=width * height > 10_000)
+    generator = MazeGenerator(SEED)
+    if width >= 9 and height >= 7:
+        generator.set_logo_42(maze)
+    return maze, generator
+
+
+def _generated_maze(size: Size) -> Maze:
+    """Create a generated perfect DFS maze."""
+    maze, generator = _new_maze(size)
+    generator.generate_maze(maze, "dfs")
+    return maze
+
+
+def _generate_case(algorithm: str, size: Size, perfect: bool) -> Case:
+    kind = "perfect" if perfect else "imperfect"
+
+    def setup() -> Callable[[], object]:
+        maze, generator = _new_maze(size, perfect)
+        return lambda: generator.generate_maze(maze, algorithm)
+
+    return Case(f"generate/{algorithm}/{kind}/{_size_name(size)}",
+                "generate", setup)
+
+
+def _solve_case(method: str, size: Size) -> Case:
+    def setup() -> Callable[[], object]:
+        maze = _generated_maze(size)
+        return lambda: shortest_path(maze, method)
+
+    return Case(f"solve/{method}/{_size_name(size)}", "solve", setup)
+
+
+def _io_cases(size: Size, directory: str) -> List[Case]:
+    file_path = os.path.join(directory, f"maze_{_size_name(size)}.txt")
+
+    def setup_hex() -> Callable[[], object]:
+        maze = _generated_maze(size)
+        return lambda: maze.save_hex(file_path)
+
+    def setup_solution() -> Callable[[], object]:
+        maze = _generated_maze(size)
+        path = shortest_path(maze)
+        return lambda: save_solution(maze, path, file_path)
+
+    return [
+        Case(f"io/save_hex/{_size_name(size)}", "io", setup_hex),
+        Case(f"io/save_solution/{_size_name(size)}", "io", setup_solution),
+    ]
+
+
+def _ascii_case(size: Size) -> Case:
+    from render.ascii import AsciiRender
+
+    def setup() -> Callable[[], object]:
+        maze = _generated_maze(size)
+        renderer = AsciiRender(os.devnull)
+        path = shortest_path(maze)
+
+        def frame() -> None:
+            with redirect_stdout(io.StringIO()):
+                renderer.draw_maze(maze, path=path)
+
+        return frame
+
+    return Case(f"render/ascii/{_size_name(size)}", "render", setup)
+
+
+def _pygame_cases(size: Size) -> List[Case]:
+    import pygame
+    from render.graphic import PygameRender
+
+    def new_frame() -> Tuple[PygameRender, pygame.Surface, Maze]:
+        pygame.init()
+        maze = _generated_maze(size)
+        renderer = PygameRender(cell_size=16)
+        renderer.show_path = True
+        renderer.path_anim_index = maze.width * maze.height
+        screen = pygame.Surface((
+            renderer.margin * 2 + maze.width * renderer.cell_size,
+            renderer.margin * 2 + maze.height * renderer.cell_size
+            + renderer.menu_height,
+        ))
+        return renderer, screen, maze
+
+    def setup_full() -> Callable[[], object]:
+        renderer, screen, maze = new_frame()
+        return lambda: renderer.render_frame(screen, maze)
+
+    def setup_steady() -> Callable[[], object]:
+        # Caches warm, path complete: the frame of an idle window
+        renderer, screen, maze = new_frame()
+        renderer.render_frame(screen, maze)
+        return lambda: renderer.render_frame(screen, maze)
+
+    return [
+        Case(f"render/pygame/{_size_name(size)}", "render", setup_full),
+        Case(f"render/pygame_steady/{_size_name(size)}", "render",
+             setup_steady),
+    ]
+
+
+def build_cases(full: bool = False) -> Tuple[List[Case], List[str]]:
+    """Build the list of benchmark cases.
+
+    Args:
+        full (bool, optional): Use the full size ladder.
+            Defaults to False.
+
+    Returns:
+        Tuple[List[Case], List[str]]: Cases, and the reasons why some
+        groups were skipped (e.g. a missing optional dependency).
+    """
+    sizes = FULL_SIZES if full else QUICK_SIZES
+    cases: List[Case] = []
+    skipped: List[str] = []
+
+    for algorithm in GENERATORS:
+        for size in sizes:
+            cases.append(_generate_case(algorithm, size, True))
+            cases.append(_generate_case(algorithm, size, False))
+
+    for method in SOLVERS:
+        for size in sizes:
+            cases.append(_solve_case(method, size))
+
+    directory = tempfile.mkdtemp(prefix="maze-bench-")
+    atexit.register(shutil.rmtree, directory, True)
+    for size in sizes:
+        cases.extend(_io_cases(size, directory))
+
+    # Offscreen rendering: no window, set before pygame is imported
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    try:
+        cases.extend(_ascii_case(size) for size in RENDER_SIZES)
+        for size in RENDER_SIZES:
+            cases.extend(_pygame_cases(size))
+    except ImportError as e:
+        skipped.append(f"render: {e}")
+
+    return cases, skipped
@@ -0,0 +1,254 @@
+"""
+runner.py
+Run benchmark cases, save the results as JSON and compare two runs.
+"""
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+from .cases import Case, build_cases
+
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.10
+
+Results = Dict[str, Any]
+
+
+def _module_version(name: str) -> Optional[str]:
+    """Return the version of an optional module, None if missing."""
+    try:
+        module = __import__(name)
+    except ImportError:
+        return None
+    return str(getattr(module, "__version__", "unknown"))
+
+
+def _git_commit() -> Optional[str]:
+    """Return the current git commit, None outside a repository."""
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, timeout=10,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def environment() -> Dict[str, Any]:
+    """
+    Describe the machine and software the benchmarks run on.
+
+    Returns:
+        Dict[str, Any]: Environment metadata.
+    """
+    return {
+        "timestamp": datetime.datetime.now(
+            datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "numpy": _module_version("numpy"),
+        "pygame": _module_version("pygame"),
+        "commit": _git_commit(),
+    }
+
+
+def time_case(case: Case, repeat: int) -> List[float]:
+    """
+    Time a case, with a fresh setup and no garbage collection in
+    every repetition.
+
+    Args:
+        case (Case): Case to run.
+        repeat (int): Number of repetitions.
+
+    Returns:
+        List[float]: Duration of every repetition in seconds.
+    """
+    times: List[float] = []
+    for _ in range(repeat):
+        func = case.setup()
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return times
+
+
+def run_cases(
+    cases: List[Case],
+    repeat: int = DEFAULT_REPEAT,
+    verbose: bool = True,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run benchmark cases.
+
+    Args:
+        cases (List[Case]): Cases to run.
+        repeat (int, optional): Repetitions per case.
+            Defaults to `DEFAULT_REPEAT`.
+        verbose (bool, optional): Print each result as it is done.
+            Defaults to True.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Statistics (seconds) per case name.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for case in cases:
+        times = time_case(case, repeat)
+        results[case.name] = {
+            "group": case.group,
+            "min": min(times),
+            "median": statistics.median(times),
+            "mean": statistics.mean(times),
+            "times": times,
+        }
+        if verbose:
+            print(f"{case.name:<45} {min(times) * 1000:10.3f} ms")
+    return results
+
+
+def compare(
+    baseline: Results,
+    current: Results,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[str]:
+    """
+    Compare two benchmark runs on their best times.
+
+    Args:
+        baseline (Results): Stored baseline run.
+        current (Results): New run.
+        threshold (float, optional): Relative slowdown reported as a
+            regression. Defaults to `DEFAULT_THRESHOLD`.
+
+    Returns:
+        List[str]: Names of the regressed cases.
+    """
+    regressions: List[str] = []
+    old = baseline["results"]
+    new = current["results"]
+
+    print(f"{'case':<45} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name in sorted(old.keys() & new.keys()):
+        before = old[name]["min"]
+        after = new[name]["min"]
+        change = after / before - 1 if before > 0 else 0.0
+        flag = ""
+        if change > threshold:
+            flag = "REGRESSION"
+            regressions.append(name)
+        elif change < -threshold:
+            flag = "faster"
+        print(f"{name:<45} {before * 1000:10.3f}ms {after * 1000:10.3f}ms "
+              f"{change:+8.1%} {flag}")
+
+    for name in sorted(old.keys() - new.keys()):
+        print(f"{name:<45} missing from the current run")
+
+    if baseline["environment"] != current["environment"]:
+        changed = sorted(
+            key for key in current["environment"]
+            if key not in ("timestamp", "commit")
+            and baseline["environment"].get(key)
+            != current["environment"][key]
+        )
+        if changed:
+            print(f"\nWarning: environments differ ({', '.join(changed)})")
+
+    print(f"\n{len(regressions)} regressions over {threshold:.0%}")
+    return regressions
+
+
+def _load(file_path: str) -> Results:
+    """Load a results file."""
+    with open(file_path, "r") as file:
+        data: Results = json.load(file)
+    if "results" not in data or "environment" not in data:
+        raise ValueError(f"{file_path} is not a benchmark results file")
+    return data
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point.
+
+    Returns:
+        int: 0 on success, 1 if `compare` found regressions.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the maze generators, solver, I/O "
+                    "and renderers.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmarks")
+    run.add_argument("--full", action="store_true",
+                     help="add the large sizes to the size ladder")
+    run.add_argument("--filter", default=None,
+                     help="only run cases whose name contains this text")
+    run.add_argument("--repeat", type=int, default=DEFAULT_REPEAT,
+                     help=f"repetitions per case (default: {DEFAULT_REPEAT})")
+    run.add_argument("--output", default=None,
+                     help="JSON file where the results are written")
+
+    cmp = commands.add_parser("compare",
+                              help="compare a run against a baseline")
+    cmp.add_argument("baseline", help="baseline results file")
+    cmp.add_argument("current", help="new results file")
+    cmp.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                     help="relative slowdown flagged as a regression "
+                          f"(default: {DEFAULT_THRESHOLD})")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        try:
+            regressions = compare(_load(args.baseline), _load(args.current),
+                                  args.threshold)
+        except (OSError, ValueError) as e:
+            print(e)
+            return 1
+        return 1 if regressions else 0
+
+    cases, skipped = build_cases(args.full)
+    if args.filter:
+        cases = [case for case in cases if args.filter in case.name]
+    for reason in skipped:
+        print(f"Skipped {reason}")
+
+    results = {
+        "environment": environment(),
+        "settings": {"full": args.full, "repeat": args.repeat,
+                     "filter": args.filter, "skipped": skipped},
+        "results": run_cases(cases, args.repeat),
+    }
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"\nResults written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,7 +6,13 @@ Package manager for config
 __version__ = "1.0.0"
 
 from .parser import parse_config_file
-from .validator import validate_config
+from .validator import (
+    validate_config,
+    is_large_maze,
+    is_streaming,
+    tiled_workers,
+)
+from .limits import Estimate, estimate_cost, check_budget
 from .types import ConfigDict, ConfigValue
 from .constants import (
     REQUIRED_KEYS,
@@ -19,7 +25,9 @@ from .constants import (
     MAX_HEIGHT
 )
 
-__all__ = ["parse_config_file", "validate_config",
+__all__ = ["parse_config_file", "validate_config", "is_large_maze",
+           "is_streaming", "tiled_workers",
+           "Estimate", "estimate_cost", "check_budget",
            "ConfigDict", "ConfigValue", "REQUIRED_KEYS",
            "POSITIVE_INT", "BOOL", "TUPLES", "ALGORITHMS",
            "DISPLAYS", "MAX_HEIGHT", "MAX_WIDTH"]
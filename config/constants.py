@@ -14,11 +14,21 @@ REQUIRED_KEYS = {
     "display",
     "seed",
 }
-ALGORITHMS = {"backtracking", "dfs", "prim", "kruskal"}
+ALGORITHMS = {
+    "backtracking", "dfs", "prim", "growing_tree", "kruskal", "eller",
+    "binary_tree", "sidewinder",
+}
 DISPLAYS = {"ascii", "graphic"}
 POSITIVE_INT = {"width", "height", "seed"}
 BOOL = {"perfect"}
 TUPLES = {"entry", "exit"}
 
+OPTIONAL_BOOL = {"large", "stream", "tiled"}
+OPTIONAL_POSITIVE_INT = {"memory_limit", "time_limit", "workers"}
+# Cell-selection policy of the growing_tree algorithm
+OPTIONAL_POLICY = "policy"
+
+# Largest maze handled in interactive mode; bigger mazes
+# switch to large-maze mode
 MAX_WIDTH = 30
 MAX_HEIGHT = 30
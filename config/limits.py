@@ -0,0 +1,206 @@
+"""
+limits.py
+Memory and time budget estimates used instead of a size cap
+for large mazes.
+"""
+
+import os
+from typing import Dict, NamedTuple, Optional
+
+# Rough costs measured as peak RSS on CPython 3.11 (one core, NumPy
+# available) for 2000x2000 mazes, rounded up
+PROCESS_BYTES = 64 * 2 ** 20
+STORAGE_BYTES_PER_CELL = 2
+GRID_BYTES_PER_CELL = 100
+SOLVER_BYTES_PER_CELL = 6
+SOLVER_SECONDS_PER_CELL = 3e-6
+# Solver output per path cell: a list of (x, y) tuples, then the
+# direction string written with the maze
+PATH_BYTES_PER_STEP = 125
+# Multiplier on the per-cell memory, for allocator slack and
+# variation between seeds
+MEMORY_SAFETY_MARGIN = 1.2
+
+ALGORITHM_BYTES_PER_CELL: Dict[str, int] = {
+    "backtracking": 6,
+    "dfs": 6,
+    "prim": 5,
+    "growing_tree": 5,
+    "kruskal": 25,
+    "eller": 0,
+    "binary_tree": 36,
+    "sidewinder": 62,
+}
+# Expected length of the solution as a fraction of the cells;
+# depth-first mazes have long winding paths (measured 5-12%)
+PATH_FRACTION: Dict[str, float] = {
+    "backtracking": 0.15,
+    "dfs": 0.15,
+    "prim": 0.02,
+    # The newest-cell policy gives depth-first paths
+    "growing_tree": 0.15,
+    "kruskal": 0.02,
+    "eller": 0.02,
+    "binary_tree": 0.02,
+    "sidewinder": 0.02,
+}
+ALGORITHM_SECONDS_PER_CELL: Dict[str, float] = {
+    "backtracking": 4e-6,
+    "dfs": 4e-6,
+    "prim": 8e-6,
+    "growing_tree": 9e-6,
+    "kruskal": 12e-6,
+    "eller": 3e-6,
+    # Pure-Python fallback; about ten times faster with NumPy
+    "binary_tree": 2e-6,
+    "sidewinder": 3e-6,
+}
+
+# Algorithms that can write the maze row by row without keeping it
+STREAMING_ALGORITHMS = {"eller"}
+STREAMING_BYTES_PER_COLUMN = 100
+
+DEFAULT_TIME_LIMIT = 3600
+FALLBACK_MEMORY = 4 * 2 ** 30
+
+
+class Estimate(NamedTuple):
+    """Estimated cost of generating and solving a maze.
+
+    Attributes:
+        memory (int): Peak memory in bytes.
+        seconds (float): Wall-clock time in seconds.
+    """
+
+    memory: int
+    seconds: float
+
+
+def default_memory_limit() -> int:
+    """
+    Return the default memory budget: half of the physical memory.
+
+    Returns:
+        int: Memory budget in bytes.
+    """
+    try:
+        total = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (AttributeError, ValueError, OSError):
+        return FALLBACK_MEMORY
+    return total // 2 if total > 0 else FALLBACK_MEMORY
+
+
+def estimate_cost(
+    width: int,
+    height: int,
+    algorithm: str,
+    compact: bool = True,
+    streaming: bool = False,
+    workers: Optional[int] = None,
+) -> Estimate:
+    """
+    Estimate the memory and time needed to generate and solve a maze.
+
+    Args:
+        width (int): Maze width.
+        height (int): Maze height.
+        algorithm (str): Generation algorithm.
+        compact (bool, optional): Whether cell views are never stored.
+            Defaults to True.
+        streaming (bool, optional): Whether rows are written as they
+            are generated, without keeping or solving the maze. Only
+            for `STREAMING_ALGORITHMS`. Defaults to False.
+        workers (Optional[int]): Worker processes of tiled
+            generation, None if not tiled. Generation time is split
+            between them, at the cost of a shared copy of the maze.
+
+    Returns:
+        Estimate: Peak memory (including the interpreter) and total
+        time.
+
+    Raises:
+        ValueError: If the algorithm has no cost model.
+    """
+    if algorithm not in ALGORITHM_BYTES_PER_CELL:
+        raise ValueError(f"No cost estimate for algorithm: {algorithm}")
+
+    cells = width * height
+    if streaming:
+        if algorithm not in STREAMING_ALGORITHMS:
+            raise ValueError(f"Algorithm {algorithm} cannot stream")
+        return Estimate(
+            PROCESS_BYTES + width * STREAMING_BYTES_PER_COLUMN,
+            cells * ALGORITHM_SECONDS_PER_CELL[algorithm],
+        )
+
+    solver = (SOLVER_BYTES_PER_CELL
+              + PATH_FRACTION[algorithm] * PATH_BYTES_PER_STEP)
+    per_cell = STORAGE_BYTES_PER_CELL + max(
+        ALGORITHM_BYTES_PER_CELL[algorithm], solver
+    )
+    if not compact:
+        per_cell += GRID_BYTES_PER_CELL
+    generation = ALGORITHM_SECONDS_PER_CELL[algorithm]
+    if workers is not None:
+        per_cell += STORAGE_BYTES_PER_CELL
+        generation /= max(1, workers)
+
+    seconds = cells * (generation + SOLVER_SECONDS_PER_CELL)
+    memory = PROCESS_BYTES + cells * per_cell * MEMORY_SAFETY_MARGIN
+    return Estimate(int(memory), seconds)
+
+
+def check_budget(
+    width: int,
+    height: int,
+    algorithm: str,
+    memory_limit: Optional[int] = None,
+    time_limit: Optional[float] = None,
+    streaming: bool = False,
+    workers: Optional[int] = None,
+) -> Estimate:
+    """
+    Check that a large maze fits the memory and time budget.
+
+    Args:
+        width (int): Maze width.
+        height (int): Maze height.
+        algorithm (str): Generation algorithm.
+        memory_limit (Optional[int]): Budget in bytes. Defaults to
+            half of the physical memory.
+        time_limit (Optional[float]): Budget in seconds. Defaults to
+            `DEFAULT_TIME_LIMIT`.
+        streaming (bool, optional): Whether rows are streamed to the
+            output. Defaults to False.
+        workers (Optional[int]): Worker processes of tiled
+            generation, None if not tiled.
+
+    Returns:
+        Estimate: The estimated cost.
+
+    Raises:
+        ValueError: If the estimate exceeds either budget.
+    """
+    if memory_limit is None:
+        memory_limit = default_memory_limit()
+    if time_limit is None:
+        time_limit = DEFAULT_TIME_LIMIT
+
+    estimate = estimate_cost(width, height, algorithm,
+                             streaming=streaming, workers=workers)
+
+    if estimate.memory > memory_limit:
+        raise ValueError(
+            f"A {width}x{height} maze needs about "
+            f"{estimate.memory / 2 ** 20:.0f} MB with {algorithm}, "
+            f"over the memory limit of {memory_limit / 2 ** 20:.0f} MB"
+        )
+
+    if estimate.seconds > time_limit:
+        raise ValueError(
+            f"A {width}x{height} maze takes about "
+            f"{estimate.seconds:.0f}s with {algorithm}, "
+            f"over the time limit of {time_limit:.0f}s"
+        )
+
+    return estimate
@@ -3,7 +3,9 @@ validator.py
 Contains functions to validate config file content.
 """
 
-from typing import Tuple, cast
+import os
+from typing import Optional, Tuple, cast
+from mazegen.growing_tree import parse_policy
 from .types import ConfigDict
 from .constants import (
     REQUIRED_KEYS,
@@ -13,8 +15,12 @@ from .constants import (
     ALGORITHMS,
     DISPLAYS,
     MAX_HEIGHT,
-    MAX_WIDTH
+    MAX_WIDTH,
+    OPTIONAL_BOOL,
+    OPTIONAL_POLICY,
+    OPTIONAL_POSITIVE_INT
 )
+from .limits import STREAMING_ALGORITHMS, check_budget
 
 
 def validate_positive_int(config: ConfigDict, key: str) -> None:
@@ -95,6 +101,26 @@ def validate_str(config: ConfigDict, key: str, allowed: set[str]) -> None:
         raise ValueError(f"Invalid {key}: {value}. Allowed values: {allowed}")
 
 
+def validate_policy(config: ConfigDict, key: str) -> None:
+    """
+    Validate that a config key contains a growing-tree policy.
+
+    Args:
+        config (ConfigDict): The configuration dictionary.
+        key (str): The key to validate in the config.
+
+    Raises:
+        ValueError: If the value is not a string or not a valid
+        policy ("newest", "random", "oldest" or "mixed:<ratio>").
+    """
+    value = config[key]
+
+    if not isinstance(value, str):
+        raise ValueError(f"{key.capitalize()} must be a string")
+
+    parse_policy(value)
+
+
 def validate_file(config: ConfigDict, key: str) -> None:
     """
     Validate that a config key contains a string ending with '.txt'.
@@ -140,19 +166,88 @@ def validate_basic_config(config: ConfigDict) -> None:
     for key in TUPLES:
         validate_tuples(config, key)
 
+    for key in OPTIONAL_BOOL & set(config.keys()):
+        validate_bool(config, key)
+
+    for key in OPTIONAL_POSITIVE_INT & set(config.keys()):
+        validate_positive_int(config, key)
+
+    if OPTIONAL_POLICY in config:
+        validate_policy(config, OPTIONAL_POLICY)
+
     validate_str(config, "algorithm", ALGORITHMS)
     validate_str(config, "display", DISPLAYS)
 
     validate_file(config, "output_file")
 
 
+def is_large_maze(config: ConfigDict) -> bool:
+    """
+    Check whether the configuration asks for large-maze mode.
+
+    Large-maze mode is enabled by `LARGE=true` or automatically
+    when the maze is bigger than `MAX_WIDTH` x `MAX_HEIGHT`.
+
+    Args:
+        config (ConfigDict): The configuration dictionary.
+
+    Returns:
+        bool: True if the maze must be handled in large-maze mode.
+    """
+    width: int = cast(int, config.get("width"))
+    height: int = cast(int, config.get("height"))
+
+    return (config.get("large") is True
+            or width > MAX_WIDTH or height > MAX_HEIGHT)
+
+
+def is_streaming(config: ConfigDict) -> bool:
+    """
+    Check whether a large maze is streamed straight to the output file.
+
+    Streaming is used in large-maze mode for perfect mazes made by
+    algorithms that can generate row by row, unless `STREAM=false`
+    is set.
+
+    Args:
+        config (ConfigDict): The configuration dictionary.
+
+    Returns:
+        bool: True if the maze is generated row by row.
+    """
+    return (is_large_maze(config)
+            and config.get("algorithm") in STREAMING_ALGORITHMS
+            and config.get("perfect") is not False
+            and config.get("stream") is not False
+            and config.get("tiled") is not True)
+
+
+def tiled_workers(config: ConfigDict) -> Optional[int]:
+    """
+    Return the worker processes of tiled generation, if enabled.
+
+    Tiled generation is used in large-maze mode with `TILED=true`,
+    on `WORKERS` processes (default: CPU count).
+
+    Args:
+        config (ConfigDict): The configuration dictionary.
+
+    Returns:
+        Optional[int]: Number of workers, or None if not tiled.
+    """
+    if not (is_large_maze(config) and config.get("tiled") is True):
+        return None
+    workers = cast(Optional[int], config.get("workers"))
+    return workers or os.cpu_count() or 1
+
+
 def validate_business_rules(config: ConfigDict) -> None:
     """
     Validate business-specific rules for the configuration.
 
     This function ensures that:
-    - The `width` does not exceed the maximum allowed (`MAX_WIDTH`).
-    - The `height` does not exceed the maximum allowed (`MAX_HEIGHT`).
+    - In large-maze mode, generating and solving the maze fits
+    the memory and time budget (see `is_large_maze`).
     - The `entry` and `exit` positions are different.
     - The `entry` and `exit` positions are within the
     bounds defined by `width` and `height`.
@@ -166,11 +261,13 @@ def validate_business_rules(config: ConfigDict) -> None:
             entry position in the maze.
             - 'exit': A tuple (x, y) representing the
             exit position in the maze.
+        It may contain 'algorithm' (default "dfs"), 'memory_limit'
+        (MB), 'time_limit' (seconds), 'tiled' and 'workers' for the
+        budget check.
 
     Raises:
         ValueError: If any of the business rules are violated:
-            - If `width` exceeds `MAX_WIDTH`.
-            - If `height` exceeds `MAX_HEIGHT`.
+            - If a large maze exceeds the memory or time budget.
             - If `entry` is the same as `exit`.
             - If `entry` or `exit` are out of bounds
             based on `width` and `height`.
@@ -180,13 +277,17 @@ def validate_business_rules(config: ConfigDict) -> None:
     entry: tuple[int, int] = cast(Tuple[int, int], config["entry"])
     exit: tuple[int, int] = cast(Tuple[int, int], config["exit"])
 
-    if width > MAX_WIDTH:
-        raise ValueError("Width must be no greater " +
-                         f"than {MAX_WIDTH}. Current value: {width}")
-
-    if height > MAX_HEIGHT:
-        raise ValueError("Height must be no greater " +
-                         f"than {MAX_HEIGHT}. Current value: {height}")
+    if is_large_maze(config):
+        memory_limit = cast(Optional[int], config.get("memory_limit"))
+        check_budget(
+            width,
+            height,
+            str(config.get("algorithm", "dfs")),
+            memory_limit * 2 ** 20 if memory_limit is not None else None,
+            cast(Optional[int], config.get("time_limit")),
+            is_streaming(config),
+            tiled_workers(config),
+        )
 
     if entry == exit:
         raise ValueError("Entry must be different from exit")
@@ -1,12 +1,35 @@
 from .maze_generator import MazeGenerator, InvalidEntryOrExit
 from .maze import Maze
 from .cell import Cell
-from .constants import WALL_MASKS
+from .mapped import MappedMaze
+from .binary import save_binary, load_binary
+from .batch import BatchTask, BatchResult, build_tasks, run_batch
+from .growing_tree import grow_tree, iter_grow_tree, parse_policy
+from .tiled import generate_tiled
+from .profiling import PhaseRecord, Profiler
+from .constants import WALL_MASKS, NORTH, EAST, SOUTH, WEST
 
 __all__ = ["Cell",
            "Maze",
            "WALL_MASKS",
+           "NORTH",
+           "EAST",
+           "SOUTH",
+           "WEST",
            'MazeGenerator',
            'InvalidEntryOrExit',
+           "MappedMaze",
+           "save_binary",
+           "load_binary",
+           "BatchTask",
+           "BatchResult",
+           "build_tasks",
+           "run_batch",
+           "grow_tree",
+           "iter_grow_tree",
+           "parse_policy",
+           "generate_tiled",
+           "PhaseRecord",
+           "Profiler",
            "Maze",
            "Cell"]
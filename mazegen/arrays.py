@@ -0,0 +1,256 @@
+"""NumPy interop and vectorised bulk operations on mazes.
+
+NumPy is optional: importing this module always works, and the
+functions raise ``ImportError`` when NumPy is not installed.
+"""
+
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+
+from .constants import (
+    ALL_WALLS,
+    DIR_MASKS,
+    EAST,
+    FLAG_FIXED,
+    FLAG_VISITED,
+    NORTH,
+    SOUTH,
+    WEST,
+)
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from .maze import Maze
+
+_N = DIR_MASKS[NORTH]
+_E = DIR_MASKS[EAST]
+_S = DIR_MASKS[SOUTH]
+_W = DIR_MASKS[WEST]
+
+
+def require_numpy() -> None:
+    """Fail with a clear message when NumPy is missing.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    if not HAS_NUMPY:
+        raise ImportError(
+            "This feature needs NumPy: pip install numpy"
+        )
+
+
+def buffers_to_numpy(maze: "Maze") -> Tuple[Any, Any]:
+    """Return the wall and flag buffers of a maze as 2D arrays.
+
+    For regular mazes both arrays are zero-copy, writable views of
+    the maze storage: writing to them changes the maze. Other
+    storages (e.g. mapped files) are decoded into new arrays.
+
+    Args:
+        maze (Maze): Source maze.
+
+    Returns:
+        Tuple[ndarray, ndarray]: ``(walls, flags)``, both ``uint8``
+        with shape ``(height, width)``. ``flags & FLAG_FIXED`` marks
+        the logo cells.
+    """
+    require_numpy()
+    shape = (maze.height, maze.width)
+    walls = maze._walls
+    flags = maze._flags
+
+    if isinstance(walls, bytearray) and isinstance(flags, bytearray):
+        return (
+            np.frombuffer(walls, dtype=np.uint8).reshape(shape),
+            np.frombuffer(flags, dtype=np.uint8).reshape(shape),
+        )
+
+    size = maze.width * maze.height
+    return (
+        np.fromiter(walls, dtype=np.uint8, count=size).reshape(shape),
+        np.fromiter(flags, dtype=np.uint8, count=size).reshape(shape),
+    )
+
+
+def _edit_walls(maze: "Maze") -> Tuple[Any, Any]:
+    """Return the walls of a maze as an array to modify in place.
+
+    Raises:
+        TypeError: If the storage is read-only (e.g. a `MappedMaze`
+            without copy-on-write), checked before any work is done.
+
+    Returns:
+        Tuple[ndarray, ndarray]: The walls, a view of the storage when
+        possible, and a copy of their original values for
+        `_commit_walls`.
+    """
+    storage = maze._walls
+    if not isinstance(storage, bytearray) and len(storage):
+        # Rewriting a cell with its own value raises if read-only
+        storage[0] = storage[0]
+    walls, _ = maze.to_numpy()
+    return walls, walls.copy()
+
+
+def _commit_walls(maze: "Maze", walls: Any, original: Any) -> int:
+    """Store the changed cells of an edited wall array in the maze.
+
+    Cells are written back when the array is a decoded copy, and
+    ``version`` is only increased if at least one cell changed, so
+    path and renderer caches survive a no-op.
+
+    Returns:
+        int: Number of cells that changed.
+    """
+    flat = walls.reshape(-1)
+    changed = np.flatnonzero(flat != original.reshape(-1))
+    if not len(changed):
+        return 0
+    if not isinstance(maze._walls, bytearray):
+        storage = maze._walls
+        for index in changed.tolist():
+            storage[index] = int(flat[index])
+    maze.version += 1
+    return len(changed)
+
+
+def from_numpy(
+    walls: Any,
+    fixed: Optional[Any] = None,
+    **kwargs: Any,
+) -> "Maze":
+    """Build a maze from a 2D array of wall bitmasks.
+
+    Args:
+        walls (ndarray): ``(height, width)`` array of values 0-15.
+        fixed (Optional[ndarray]): Boolean mask of fixed cells.
+        **kwargs: Extra ``Maze`` arguments (perfect, seed, entry,
+            exit, compact).
+
+    Returns:
+        Maze: New maze with a copy of the given walls.
+
+    Raises:
+        ValueError: If the arrays are not 2D or shapes differ.
+    """
+    from .maze import Maze
+
+    require_numpy()
+    walls = np.asarray(walls)
+    if walls.ndim != 2:
+        raise ValueError("Walls must be a 2D array")
+    height, width = walls.shape
+    if fixed is not None and np.shape(fixed) != walls.shape:
+        raise ValueError("Fixed mask must have the same shape as walls")
+
+    maze = Maze(width, height, **kwargs)
+    maze_walls, maze_flags = maze.to_numpy()
+    maze_walls[...] = walls.astype(np.uint8) & ALL_WALLS
+    if fixed is not None:
+        maze_flags[np.asarray(fixed, dtype=bool)] |= FLAG_FIXED | FLAG_VISITED
+    maze.version += 1
+    return maze
+
+
+def repair_walls(maze: "Maze") -> int:
+    """Make every shared wall agree on both of its sides.
+
+    A wall is kept closed if either neighbouring cell has it.
+
+    Args:
+        maze (Maze): Maze to repair in place.
+
+    Returns:
+        int: Number of walls that were inconsistent.
+
+    Raises:
+        TypeError: If the maze storage is read-only.
+    """
+    walls, original = _edit_walls(maze)
+
+    east = (walls[:, :-1] & _E) != 0
+    west = (walls[:, 1:] & _W) != 0
+    south = (walls[:-1, :] & _S) != 0
+    north = (walls[1:, :] & _N) != 0
+
+    broken = int(np.count_nonzero(east != west)
+                 + np.count_nonzero(south != north))
+
+    horizontal = east | west
+    vertical = south | north
+    walls[:, :-1][horizontal] |= _E
+    walls[:, 1:][horizontal] |= _W
+    walls[:-1, :][vertical] |= _S
+    walls[1:, :][vertical] |= _N
+    _commit_walls(maze, walls, original)
+
+    return broken
+
+
+def seal_border(maze: "Maze") -> None:
+    """Close every wall on the outer border of the maze.
+
+    Args:
+        maze (Maze): Maze to modify in place.
+
+    Raises:
+        TypeError: If the maze storage is read-only.
+    """
+    walls, original = _edit_walls(maze)
+    walls[0, :] |= _N
+    walls[-1, :] |= _S
+    walls[:, 0] |= _W
+    walls[:, -1] |= _E
+    _commit_walls(maze, walls, original)
+
+
+def count_open_edges(maze: "Maze") -> int:
+    """Count the open walls between neighbouring cells.
+
+    Args:
+        maze (Maze): Maze to inspect.
+
+    Returns:
+        int: Number of open east/south walls inside the grid.
+    """
+    walls, _ = maze.to_numpy()
+    return int(np.count_nonzero((walls[:, :-1] & _E) == 0)
+               + np.count_nonzero((walls[:-1, :] & _S) == 0))
+
+
+def fixed_mask(maze: "Maze") -> Any:
+    """Return a boolean mask of the fixed (logo) cells.
+
+    Args:
+        maze (Maze): Maze to inspect.
+
+    Returns:
+        ndarray: ``(height, width)`` boolean array.
+    """
+    _, flags = maze.to_numpy()
+    return (flags & FLAG_FIXED) != 0
+
+
+def mask_fixed(maze: "Maze") -> None:
+    """Close all walls of fixed cells, on both sides.
+
+    Args:
+        maze (Maze): Maze to modify in place.
+
+    Raises:
+        TypeError: If the maze storage is read-only.
+    """
+    walls, original = _edit_walls(maze)
+    fixed = fixed_mask(maze)
+
+    walls[fixed] = ALL_WALLS
+    walls[:, 1:][fixed[:, :-1]] |= _W
+    walls[:, :-1][fixed[:, 1:]] |= _E
+    walls[1:, :][fixed[:-1, :]] |= _N
+    walls[:-1, :][fixed[1:, :]] |= _S
+    _commit_walls(maze, walls, original)
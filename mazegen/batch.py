@@ -0,0 +1,236 @@
+"""Batch maze generation over a process pool."""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from .maze import Maze
+from .maze_generator import InvalidEntryOrExit, MazeGenerator
+from .solver import save_solution, shortest_path
+
+Pos = Tuple[int, int]
+
+
+class BatchTask(NamedTuple):
+    """Parameters of one maze in a batch.
+
+    Attributes:
+        width (int): Maze width.
+        height (int): Maze height.
+        algorithm (str): Generation algorithm.
+        seed (int): Random seed.
+        perfect (bool): Perfect maze flag.
+        entry (Pos): Entry position.
+        exit (Optional[Pos]): Exit position, bottom-right if None.
+        logo (bool): Embed the '42' logo.
+    """
+
+    width: int
+    height: int
+    algorithm: str
+    seed: int
+    perfect: bool = True
+    entry: Pos = (0, 0)
+    exit: Optional[Pos] = None
+    logo: bool = True
+
+
+class BatchResult(NamedTuple):
+    """Outcome of one batch task.
+
+    Attributes:
+        task (BatchTask): The task that was run.
+        path (Optional[List[Pos]]): Shortest path, None if unsolvable.
+        generate_time (float): Generation time in seconds.
+        solve_time (float): Solving time in seconds.
+        output_file (Optional[str]): Saved file, if any.
+        error (Optional[str]): Error message if the task failed.
+    """
+
+    task: BatchTask
+    path: Optional[List[Pos]]
+    generate_time: float
+    solve_time: float
+    output_file: Optional[str] = None
+    error: Optional[str] = None
+
+
+def build_tasks(
+    sizes: Iterable[Pos],
+    algorithms: Iterable[str],
+    seeds: Iterable[int],
+    perfect: Iterable[bool] = (True,),
+    entries: Iterable[Pos] = ((0, 0),),
+    exits: Iterable[Optional[Pos]] = (None,),
+    logo: bool = True,
+) -> List[BatchTask]:
+    """Expand a parameter grid into the list of all combinations.
+
+    Args:
+        sizes (Iterable[Pos]): (width, height) pairs.
+        algorithms (Iterable[str]): Algorithm names.
+        seeds (Iterable[int]): Seeds.
+        perfect (Iterable[bool], optional): Perfect flags.
+        entries (Iterable[Pos], optional): Entry positions.
+        exits (Iterable[Optional[Pos]], optional): Exit positions,
+            None meaning bottom-right.
+        logo (bool, optional): Embed the '42' logo. Defaults to True.
+
+    Returns:
+        List[BatchTask]: One task per combination.
+    """
+    return [
+        BatchTask(w, h, algorithm, seed, flag, entry, exit, logo)
+        for (w, h), algorithm, seed, flag, entry, exit in product(
+            sizes, algorithms, seeds, perfect, entries, exits
+        )
+    ]
+
+
+def task_file_name(task: BatchTask) -> str:
+    """Return the output file name used for a task.
+
+    Every field that changes the maze is part of the name, so the
+    tasks of a grid never overwrite each other.
+
+    Args:
+        task (BatchTask): Batch task.
+
+    Returns:
+        str: File name such as
+        ``maze_20x15_dfs_s7_perfect_e0-0_x19-14.txt``.
+    """
+    kind = "perfect" if task.perfect else "imperfect"
+    entry_x, entry_y = task.entry
+    exit_x, exit_y = task.exit or (task.width - 1, task.height - 1)
+    logo = "" if task.logo else "_nologo"
+    return (f"maze_{task.width}x{task.height}_{task.algorithm}"
+            f"_s{task.seed}_{kind}_e{entry_x}-{entry_y}"
+            f"_x{exit_x}-{exit_y}{logo}.txt")
+
+
+def run_task(
+    task: BatchTask,
+    output_dir: Optional[str] = None,
+) -> BatchResult:
+    """Generate and solve a single maze.
+
+    Never raises: any failure is reported in `BatchResult.error`, so
+    one bad task cannot abort a whole batch.
+
+    Args:
+        task (BatchTask): Task to run.
+        output_dir (Optional[str]): Directory where the maze and its
+            solution are saved. Nothing is written if None.
+
+    Returns:
+        BatchResult: Path, timings and output file of the task.
+    """
+    try:
+        return _run_task(task, output_dir)
+    except Exception as e:
+        return BatchResult(task, None, 0.0, 0.0,
+                           error=f"{type(e).__name__}: {e}")
+
+
+def _run_task(task: BatchTask, output_dir: Optional[str]) -> BatchResult:
+    """Body of `run_task`; may raise on unexpected failures."""
+    exit = task.exit or (task.width - 1, task.height - 1)
+    maze = Maze(
+        width=task.width,
+        height=task.height,
+        perfect=task.perfect,
+        seed=task.seed,
+        entry=task.entry,
+        exit=exit,
+    )
+    generator = MazeGenerator(task.seed)
+
+    start = time.perf_counter()
+    try:
+        if task.logo:
+            generator.set_logo_42(maze)
+        generator.generate_maze(maze, task.algorithm)
+    except InvalidEntryOrExit:
+        return BatchResult(task, None, 0.0, 0.0,
+                           error="Entry or exit overlaps the logo")
+    except ValueError as e:
+        return BatchResult(task, None, 0.0, 0.0, error=str(e))
+    generate_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    path = shortest_path(maze)
+    solve_time = time.perf_counter() - start
+
+    output_file = None
+    if output_dir is not None:
+        output_file = os.path.join(output_dir, task_file_name(task))
+        if not save_solution(maze, path, output_file):
+            output_file = None
+
+    return BatchResult(task, path, generate_time, solve_time, output_file)
+
+
+def _run_chunk(
+    tasks: List[BatchTask],
+    output_dir: Optional[str],
+) -> List[BatchResult]:
+    """Run a chunk of tasks inside one worker process."""
+    return [run_task(task, output_dir) for task in tasks]
+
+
+def run_batch(
+    tasks: Iterable[BatchTask],
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    output_dir: Optional[str] = None,
+) -> Iterator[BatchResult]:
+    """Run tasks on a process pool and stream results as they finish.
+
+    Tasks are submitted in chunks so that pickling and scheduling
+    costs are paid once per chunk rather than once per maze; the
+    worker processes are reused for every chunk.
+
+    Args:
+        tasks (Iterable[BatchTask]): Tasks to run.
+        workers (Optional[int]): Number of worker processes.
+            Defaults to the number of CPUs.
+        chunksize (Optional[int]): Tasks per submission. Defaults to
+            about four chunks per worker.
+        output_dir (Optional[str]): Directory for output files.
+
+    Yields:
+        BatchResult: Results in completion order. A chunk's results
+        are yielded together once the whole chunk is done; use
+        ``chunksize=1`` to get each result as soon as its maze is.
+    """
+    task_list = list(tasks)
+    if not task_list:
+        return
+
+    workers = workers or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, -(-len(task_list) // (workers * 4)))
+
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(_run_chunk, chunk, output_dir): chunk
+            for chunk in (
+                task_list[i:i + chunksize]
+                for i in range(0, len(task_list), chunksize)
+            )
+        }
+        for future in as_completed(futures):
+            try:
+                results = future.result()
+            except Exception as e:
+                # The worker itself failed (e.g. it was killed)
+                error = f"{type(e).__name__}: {e}"
+                results = [BatchResult(task, None, 0.0, 0.0, error=error)
+                           for task in futures[future]]
+            yield from results
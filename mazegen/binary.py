@@ -0,0 +1,207 @@
+"""Compact binary maze format.
+
+Layout (little-endian):
+    header      magic ``AMZB``, version, flags (bit 0 perfect,
+                bit 1 solution present), width, height, entry,
+                exit, seed, algorithm name (16 bytes, NUL padded)
+                and number of solution steps
+    walls       two cells per byte, even cell in the low nibble
+    fixed       one bit per cell, cell 0 in the lowest bit
+    solution    2-bit direction codes (N=0, E=1, S=2, W=3),
+                four steps per byte, first step in the lowest bits
+
+Every section is converted with whole-buffer operations
+(``bytes.translate``, slicing and big-integer conversions), so
+neither saving nor loading does any per-cell Python work.
+"""
+
+import struct
+from typing import Optional, Tuple
+
+from .constants import DIRECTIONS, FLAG_FIXED, FLAG_VISITED
+from .fileio import write_bytes
+from .maze import Maze
+
+MAGIC = b"AMZB"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sBBHIIIIIIq16sQ")
+
+_FLAG_PERFECT = 0b01
+_FLAG_SOLUTION = 0b10
+
+# Nibble packing: second cell of a pair goes to the high nibble
+_SHIFT_HIGH = bytes((v << 4) & 0xFF for v in range(256))
+_LOW_NIBBLE = bytes(v & 0x0F for v in range(256))
+_HIGH_NIBBLE = bytes(v >> 4 for v in range(256))
+
+# Fixed bitset: flag byte -> ASCII bit, and back
+_FIXED_TO_BIT = bytes(
+    ord("1") if v & FLAG_FIXED else ord("0") for v in range(256)
+)
+_BIT_TO_FIXED = bytes.maketrans(b"01", bytes((0, FLAG_FIXED | FLAG_VISITED)))
+
+# Solution: direction letters <-> base-4 digits / 2-bit codes
+_DIR_TO_DIGIT = bytes.maketrans(DIRECTIONS.encode("ascii"), b"0123")
+_HIGH_BIT = bytes.maketrans(b"01", b"\x00\x02")
+_LOW_BIT = bytes.maketrans(b"01", b"\x00\x01")
+_CODE_TO_DIR = bytes.maketrans(b"\x00\x01\x02\x03",
+                               DIRECTIONS.encode("ascii"))
+
+
+def _pack_nibbles(data: bytes) -> bytes:
+    """Pack a buffer of 4-bit values two per byte."""
+    if len(data) % 2:
+        data += b"\x00"
+    low = data[0::2]
+    high = data[1::2].translate(_SHIFT_HIGH)
+    value = int.from_bytes(low, "little") | int.from_bytes(high, "little")
+    return value.to_bytes(len(low), "little")
+
+
+def _unpack_nibbles(packed: bytes, size: int) -> bytearray:
+    """Expand two 4-bit values per byte into one value per byte."""
+    out = bytearray(len(packed) * 2)
+    out[0::2] = packed.translate(_LOW_NIBBLE)
+    out[1::2] = packed.translate(_HIGH_NIBBLE)
+    del out[size:]
+    return out
+
+
+def _pack_bits(flags: bytes) -> bytes:
+    """Pack the fixed flag of every cell into a bitset."""
+    if not flags:
+        return b""
+    bits = flags.translate(_FIXED_TO_BIT)[::-1]
+    return int(bits, 2).to_bytes((len(flags) + 7) // 8, "little")
+
+
+def _unpack_bits(bitset: bytes, size: int) -> bytearray:
+    """Expand a fixed-cell bitset into flag bytes."""
+    if not size:
+        return bytearray()
+    value = int.from_bytes(bitset, "little")
+    bits = format(value, f"0{size}b").encode("ascii")[::-1]
+    return bytearray(bits.translate(_BIT_TO_FIXED))
+
+
+def _pack_directions(solution: str) -> bytes:
+    """Pack a direction string as 2-bit codes."""
+    if not solution:
+        return b""
+    digits = solution.encode("ascii").translate(_DIR_TO_DIGIT)[::-1]
+    return int(digits, 4).to_bytes((len(solution) + 3) // 4, "little")
+
+
+def _unpack_directions(packed: bytes, steps: int) -> str:
+    """Expand 2-bit codes back into a direction string."""
+    if not steps:
+        return ""
+    value = int.from_bytes(packed, "little")
+    bits = format(value, f"0{steps * 2}b").encode("ascii")
+    high = bits[0::2].translate(_HIGH_BIT)
+    low = bits[1::2].translate(_LOW_BIT)
+    codes = (
+        int.from_bytes(high, "big") + int.from_bytes(low, "big")
+    ).to_bytes(steps, "big")
+    return codes.translate(_CODE_TO_DIR)[::-1].decode("ascii")
+
+
+def save_binary(
+    maze: Maze,
+    file_path: str,
+    solution: Optional[str] = None,
+    atomic: bool = False,
+) -> None:
+    """Save a maze in the compact binary format.
+
+    Args:
+        maze (Maze): Maze to save.
+        file_path (str): Output file path.
+        solution (Optional[str]): Direction string to store.
+        atomic (bool, optional): Replace the file atomically.
+            Defaults to False.
+
+    Raises:
+        ValueError: If the solution has characters other than NESW.
+    """
+    flags = _FLAG_PERFECT if maze.perfect else 0
+    if solution is not None:
+        flags |= _FLAG_SOLUTION
+    else:
+        solution = ""
+
+    if solution.strip(DIRECTIONS):
+        raise ValueError("Solution must only contain N, E, S and W")
+
+    header = _HEADER.pack(
+        MAGIC, VERSION, flags, 0,
+        maze.width, maze.height,
+        maze.entry[0], maze.entry[1],
+        maze.exit[0], maze.exit[1],
+        maze.seed,
+        maze.algorithm.encode("ascii")[:16],
+        len(solution),
+    )
+    write_bytes(
+        file_path,
+        b"".join((
+            header,
+            _pack_nibbles(bytes(maze._walls)),
+            _pack_bits(bytes(maze._flags)),
+            _pack_directions(solution),
+        )),
+        atomic,
+    )
+
+
+def load_binary(file_path: str) -> Tuple[Maze, Optional[str]]:
+    """Load a maze saved with ``save_binary``.
+
+    Args:
+        file_path (str): Input file path.
+
+    Returns:
+        Tuple[Maze, Optional[str]]: The maze and its stored solution,
+        or None if the file has no solution.
+
+    Raises:
+        ValueError: If the file is not a valid binary maze.
+    """
+    with open(file_path, "rb") as file:
+        data = file.read()
+
+    if len(data) < _HEADER.size:
+        raise ValueError("Invalid binary maze file: truncated header")
+
+    (magic, version, flags, _, width, height, entry_x, entry_y,
+     exit_x, exit_y, seed, algorithm, steps) = _HEADER.unpack_from(data)
+
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("Invalid binary maze file: bad magic or version")
+
+    size = width * height
+    walls_end = _HEADER.size + (size + 1) // 2
+    fixed_end = walls_end + (size + 7) // 8
+    solution_end = fixed_end + (steps + 3) // 4
+    if len(data) < solution_end:
+        raise ValueError("Invalid binary maze file: truncated data")
+
+    maze = Maze(
+        width=width,
+        height=height,
+        perfect=bool(flags & _FLAG_PERFECT),
+        seed=seed,
+        entry=(entry_x, entry_y),
+        exit=(exit_x, exit_y),
+    )
+    maze.algorithm = algorithm.rstrip(b"\x00").decode("ascii")
+    maze._walls = _unpack_nibbles(data[_HEADER.size:walls_end], size)
+    maze._flags = _unpack_bits(data[walls_end:fixed_end], size)
+    maze.version += 1
+
+    solution = None
+    if flags & _FLAG_SOLUTION:
+        solution = _unpack_directions(data[fixed_end:solution_end], steps)
+
+    return maze, solution
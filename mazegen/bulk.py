@@ -0,0 +1,394 @@
+"""Bulk binary-tree and sidewinder generators.
+
+Both algorithms decide every link from independent random bits, so
+all random draws are made up front (one ``getrandbits`` call per row)
+and, when NumPy is available, the walls are written with whole-grid
+array operations. The pure-Python fallback consumes the same random
+bits and produces identical mazes.
+
+The mazes are perfect but strongly biased: binary-tree mazes have
+open corridors along the north and west borders, sidewinder mazes
+along the north border.
+
+Fixed cells are never opened. Cells cut off from their natural
+parent by fixed cells are joined back with a union-find pass over
+the walls between the resulting trees.
+"""
+
+import random
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+from .arrays import HAS_NUMPY
+from .constants import (
+    ALL_WALLS,
+    DIR_MASKS,
+    EAST,
+    FLAG_FIXED,
+    FLAG_VISITED,
+    NORTH,
+    SOUTH,
+    WEST,
+)
+from .disjoint_set import DisjointSet
+from .maze import Maze
+
+_N = DIR_MASKS[NORTH]
+_E = DIR_MASKS[EAST]
+_S = DIR_MASKS[SOUTH]
+_W = DIR_MASKS[WEST]
+
+# Link bits: the cell is open towards its north / west neighbour
+_LINK_N = 1
+_LINK_W = 2
+
+# Bits per sidewinder pick, used to choose a cell inside a run
+_PICK_BITS = 16
+
+
+def _draw_rows(rng: random.Random, height: int, bits: int) -> List[bytes]:
+    """Draw ``bits`` random bits for every row, as little-endian bytes."""
+    size = (bits + 7) // 8
+    return [rng.getrandbits(bits).to_bytes(size, "little")
+            for _ in range(height)]
+
+
+def _use_numpy(maze: Maze, use_numpy: Optional[bool]) -> bool:
+    """Whether the vectorised path can and should be used."""
+    if use_numpy is None:
+        use_numpy = True
+    return (use_numpy and HAS_NUMPY
+            and isinstance(maze._walls, bytearray)
+            and isinstance(maze._flags, bytearray))
+
+
+def _fixup(
+    maze: Maze,
+    labels: Any,
+    edges: Any,
+    links: Any,
+) -> None:
+    """Join the trees of a forest with a union-find over candidate walls.
+
+    Args:
+        maze (Maze): Maze being generated.
+        labels: Root cell id of the tree of every cell (flat).
+        edges: Packed walls ``cell * 2 + k`` (k = 0 east, 1 south)
+            between free cells of different trees, in increasing
+            order.
+        links: Flat per-cell link bits, updated in place.
+    """
+    width = maze.width
+    roots: Dict[int, int] = {}
+    for edge in edges:
+        cell = int(edge) >> 1
+        for other in (cell, cell + (width if edge & 1 else 1)):
+            roots.setdefault(int(labels[other]), len(roots))
+
+    if len(roots) < 2:
+        return
+
+    sets = DisjointSet(len(roots))
+    for edge in edges:
+        cell = int(edge) >> 1
+        if edge & 1:
+            other, link = cell + width, _LINK_N
+        else:
+            other, link = cell + 1, _LINK_W
+        if sets.union(roots[int(labels[cell])], roots[int(labels[other])]):
+            links[other] |= link
+
+
+def _apply_python(maze: Maze, links: Any, fixed: Any) -> None:
+    """Write link bits into the wall and flag buffers, cell by cell."""
+    walls = maze._walls
+    flags = maze._flags
+    width = maze.width
+
+    for index in range(maze.width * maze.height):
+        link = links[index]
+        if link & _LINK_N:
+            walls[index] &= ~_N
+            walls[index - width] &= ~_S
+        if link & _LINK_W:
+            walls[index] &= ~_W
+            walls[index - 1] &= ~_E
+        if not fixed[index]:
+            flags[index] |= FLAG_VISITED
+
+
+def _python_edges(maze: Maze, labels: Any, fixed: Any) -> array:
+    """List walls between free cells of different trees, in order."""
+    width = maze.width
+    size = width * maze.height
+    edges = array("q")
+
+    for index in range(size):
+        if fixed[index]:
+            continue
+        label = labels[index]
+        if ((index + 1) % width and not fixed[index + 1]
+                and labels[index + 1] != label):
+            edges.append(index * 2)
+        if (index + width < size and not fixed[index + width]
+                and labels[index + width] != label):
+            edges.append(index * 2 + 1)
+
+    return edges
+
+
+def _numpy_bits(rows: List[bytes], width: int) -> Any:
+    """Unpack per-row random bytes into a ``(height, width)`` bool grid."""
+    import numpy as np
+
+    data = np.frombuffer(b"".join(rows), dtype=np.uint8)
+    bits = np.unpackbits(data, bitorder="little")
+    return bits.reshape(len(rows), -1)[:, :width].astype(bool)
+
+
+def _numpy_labels(parent: Any) -> Any:
+    """Resolve parent pointers to tree roots by pointer jumping."""
+    labels = parent
+    while True:
+        jumped = labels[labels]
+        if (jumped == labels).all():
+            return labels
+        labels = jumped
+
+
+def _numpy_finish(maze: Maze, free: Any, parent: Any, links: Any) -> None:
+    """Label the trees, join them and write the walls (NumPy path)."""
+    import numpy as np
+
+    height, width = free.shape
+    labels = _numpy_labels(parent.ravel()).reshape(height, width)
+
+    east = (free[:, :-1] & free[:, 1:]
+            & (labels[:, :-1] != labels[:, 1:]))
+    south = (free[:-1, :] & free[1:, :]
+             & (labels[:-1, :] != labels[1:, :]))
+    ys, xs = np.nonzero(east)
+    east_edges = (ys * width + xs) * 2
+    ys, xs = np.nonzero(south)
+    south_edges = (ys * width + xs) * 2 + 1
+    edges = np.sort(np.concatenate((east_edges, south_edges)))
+
+    flat_links = links.ravel()
+    _fixup(maze, labels.ravel(), edges.tolist(), flat_links)
+
+    walls, flags = maze.to_numpy()
+    open_n = (links & _LINK_N) != 0
+    open_w = (links & _LINK_W) != 0
+    walls[open_n] &= ALL_WALLS ^ _N
+    walls[:-1, :][open_n[1:, :]] &= ALL_WALLS ^ _S
+    walls[open_w] &= ALL_WALLS ^ _W
+    walls[:, :-1][open_w[:, 1:]] &= ALL_WALLS ^ _E
+    flags[free] |= FLAG_VISITED
+
+
+def _fixed_mask(maze: Maze) -> bytearray:
+    """Return one byte per cell, 1 for fixed cells."""
+    return bytearray(
+        1 if flag & FLAG_FIXED else 0 for flag in maze._flags
+    )
+
+
+def generate_binary_tree(
+    maze: Maze,
+    rng: random.Random,
+    use_numpy: Optional[bool] = None,
+) -> None:
+    """Generate a perfect maze with the binary-tree algorithm.
+
+    Every cell opens its north or west wall, chosen by one random
+    bit, or the only one available on the borders and next to fixed
+    cells.
+
+    Args:
+        maze (Maze): Maze with all walls closed to generate into.
+        rng (random.Random): Random source.
+        use_numpy (Optional[bool]): Use the vectorised path if NumPy
+            is available. Defaults to True.
+    """
+    width, height = maze.width, maze.height
+    rows = _draw_rows(rng, height, width)
+
+    if _use_numpy(maze, use_numpy):
+        _binary_tree_numpy(maze, rows)
+    else:
+        _binary_tree_python(maze, rows)
+    maze.version += 1
+
+
+def _binary_tree_numpy(maze: Maze, rows: List[bytes]) -> None:
+    """Vectorised binary-tree generation."""
+    import numpy as np
+
+    width, height = maze.width, maze.height
+    prefer_north = _numpy_bits(rows, width)
+    _, flags = maze.to_numpy()
+    free = (flags & FLAG_FIXED) == 0
+
+    can_n = np.zeros_like(free)
+    can_n[1:, :] = free[1:, :] & free[:-1, :]
+    can_w = np.zeros_like(free)
+    can_w[:, 1:] = free[:, 1:] & free[:, :-1]
+    go_n = can_n & (prefer_north | ~can_w)
+    go_w = can_w & ~go_n
+
+    parent = np.arange(width * height, dtype=np.int64).reshape(height, width)
+    parent[go_n] -= width
+    parent[go_w] -= 1
+
+    links = go_n * np.uint8(_LINK_N) | go_w * np.uint8(_LINK_W)
+    _numpy_finish(maze, free, parent, links.astype(np.uint8))
+
+
+def _binary_tree_python(maze: Maze, rows: List[bytes]) -> None:
+    """Pure-Python binary-tree generation."""
+    width = maze.width
+    fixed = _fixed_mask(maze)
+    links = bytearray(len(fixed))
+    labels = array("q", range(len(fixed)))
+
+    for y, bits in enumerate(rows):
+        for x in range(width):
+            index = y * width + x
+            if fixed[index]:
+                continue
+            can_n = y > 0 and not fixed[index - width]
+            can_w = x > 0 and not fixed[index - 1]
+            if can_n and (not can_w or (bits[x >> 3] >> (x & 7)) & 1):
+                links[index] = _LINK_N
+                labels[index] = labels[index - width]
+            elif can_w:
+                links[index] = _LINK_W
+                labels[index] = labels[index - 1]
+
+    _fixup(maze, labels, _python_edges(maze, labels, fixed), links)
+    _apply_python(maze, links, fixed)
+
+
+def generate_sidewinder(
+    maze: Maze,
+    rng: random.Random,
+    use_numpy: Optional[bool] = None,
+) -> None:
+    """Generate a perfect maze with the sidewinder algorithm.
+
+    The top row is one corridor. In every other row, random bits
+    split the row into runs of east-linked cells, and each run opens
+    the north wall of one of its cells, picked with another random
+    draw among the cells whose north neighbour is free.
+
+    Args:
+        maze (Maze): Maze with all walls closed to generate into.
+        rng (random.Random): Random source.
+        use_numpy (Optional[bool]): Use the vectorised path if NumPy
+            is available. Defaults to True.
+    """
+    width, height = maze.width, maze.height
+    east_rows = _draw_rows(rng, height, width)
+    pick_rows = _draw_rows(rng, height, width * _PICK_BITS)
+
+    if _use_numpy(maze, use_numpy):
+        _sidewinder_numpy(maze, east_rows, pick_rows)
+    else:
+        _sidewinder_python(maze, east_rows, pick_rows)
+    maze.version += 1
+
+
+def _sidewinder_numpy(
+    maze: Maze,
+    east_rows: List[bytes],
+    pick_rows: List[bytes],
+) -> None:
+    """Vectorised sidewinder generation."""
+    import numpy as np
+
+    width, height = maze.width, maze.height
+    size = width * height
+    _, flags = maze.to_numpy()
+    free = (flags & FLAG_FIXED) == 0
+
+    can_e = np.zeros_like(free)
+    can_e[:, :-1] = free[:, :-1] & free[:, 1:]
+    east = can_e & _numpy_bits(east_rows, width)
+    east[0] = can_e[0]
+
+    linked_w = np.zeros_like(free)
+    linked_w[:, 1:] = east[:, :-1]
+    run_start = (free & ~linked_w).ravel()
+    starts = np.flatnonzero(run_start)
+    ends = np.flatnonzero(free & ~east)
+
+    can_n = np.zeros_like(free)
+    can_n[1:, :] = free[1:, :] & free[:-1, :]
+    before = np.concatenate(([0], np.cumsum(can_n.ravel())))
+    count = before[ends + 1] - before[starts]
+    has_north = count > 0
+    # Only the picks of run ends are used; index the 16-bit view
+    # directly instead of widening every pick
+    picks = np.frombuffer(b"".join(pick_rows), dtype="<u2")[ends]
+    rank = picks % np.maximum(count, 1)
+    chosen = np.searchsorted(before, before[starts] + rank + 1) - 1
+    # Large temporaries are freed before the labelling pass
+    del before, picks, rank, count
+
+    run_parent = np.where(has_north, chosen - width, starts)
+    parent = np.arange(size, dtype=np.int64)
+    free_flat = free.ravel()
+    parent[free_flat] = run_parent[np.cumsum(run_start)[free_flat] - 1]
+    del run_parent, starts, ends
+
+    links = np.zeros(size, dtype=np.uint8)
+    links[linked_w.ravel()] |= _LINK_W
+    links[chosen[has_north]] |= _LINK_N
+    del chosen, has_north
+    _numpy_finish(maze, free, parent.reshape(height, width),
+                  links.reshape(height, width))
+
+
+def _sidewinder_python(
+    maze: Maze,
+    east_rows: List[bytes],
+    pick_rows: List[bytes],
+) -> None:
+    """Pure-Python sidewinder generation."""
+    width = maze.width
+    fixed = _fixed_mask(maze)
+    links = bytearray(len(fixed))
+    labels = array("q", range(len(fixed)))
+
+    for y, (bits, picks) in enumerate(zip(east_rows, pick_rows)):
+        base = y * width
+        start = -1
+        for x in range(width):
+            index = base + x
+            if fixed[index]:
+                continue
+            if start < 0:
+                start = x
+            if (x + 1 < width and not fixed[index + 1]
+                    and (y == 0 or (bits[x >> 3] >> (x & 7)) & 1)):
+                links[index + 1] |= _LINK_W
+                continue
+
+            run: Tuple[int, ...] = tuple(range(base + start, index + 1))
+            start = -1
+            candidates = [
+                cell for cell in run
+                if y > 0 and not fixed[cell - width]
+            ]
+            if candidates:
+                pick = picks[2 * x] | picks[2 * x + 1] << 8
+                cell = candidates[pick % len(candidates)]
+                links[cell] |= _LINK_N
+                label = labels[cell - width]
+            else:
+                label = run[0]
+            for cell in run:
+                labels[cell] = label
+
+    _fixup(maze, labels, _python_edges(maze, labels, fixed), links)
+    _apply_python(maze, links, fixed)
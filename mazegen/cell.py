@@ -2,15 +2,61 @@
 cell.py
 File that contains Cell class
 """
-from .constants import WALL_MASKS
+from typing import Iterator, Optional, Protocol
+
+from .constants import (
+    ALL_WALLS,
+    FLAG_FIXED,
+    FLAG_PATH,
+    FLAG_VISITED,
+    WALL_MASKS,
+)
+
+
+class ByteBuffer(Protocol):
+    """Indexable sequence of byte values, such as a bytearray."""
+
+    def __getitem__(self, index: int) -> int: ...
+
+    def __setitem__(self, index: int, value: int) -> None: ...
+
+    def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator[int]: ...
+
+
+class CellStorage(Protocol):
+    """Flat buffers that back one or more cells.
+
+    Attributes:
+        _walls (ByteBuffer): One wall bitmask per cell.
+        _flags (ByteBuffer): One flag byte per cell.
+        version (int): Mutation counter of the buffers.
+    """
+
+    _walls: ByteBuffer
+    _flags: ByteBuffer
+    version: int
+
+
+class _DetachedStorage:
+    """Single-cell storage used by cells created outside a maze."""
+
+    __slots__ = ("_walls", "_flags", "version")
+
+    def __init__(self) -> None:
+        self._walls: ByteBuffer = bytearray((ALL_WALLS,))
+        self._flags: ByteBuffer = bytearray(1)
+        self.version = 0
 
 
 class Cell:
     """
     Represents a single cell in a maze grid.
 
-    Each cell knows its position (x, y), which walls are present, and whether
-    it has been visited or is part of the solution path.
+    A cell is a lightweight view over the flat buffers of its maze:
+    walls and flags live in the maze storage at index ``y * width + x``,
+    so creating or dropping a Cell never copies any state.
 
     Walls are stored as a 4-bit integer (bitmask) with bits representing:
         0 (LSB) - North
@@ -21,26 +67,49 @@ class Cell:
     Attributes:
         x (int): X-coordinate (column) of the cell.
         y (int): Y-coordinate (row) of the cell.
-        __walls (int): Bitmask storing the presence of walls.
-        __visited (bool): True if the cell has
-        been visited during generation or solving.
-        __is_path (bool): True if the cell is part of the solution path.
+        _store (CellStorage): Buffers holding walls and flags.
+        _index (int): Position of the cell inside the buffers.
     """
 
-    def __init__(self, x: int, y: int) -> None:
+    __slots__ = ("x", "y", "_store", "_index")
+
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        store: Optional[CellStorage] = None,
+        index: int = 0,
+    ) -> None:
         """
-        Initialize a Cell at coordinates (x, y) with all walls present.
+        Initialize a Cell at coordinates (x, y).
+
+        Without a store the cell owns a private buffer and starts
+        with all walls present.
 
         Args:
             x (int): Column index of the cell.
             y (int): Row index of the cell.
+            store (Optional[CellStorage]): Maze storage to view.
+            index (int): Flat index of the cell inside the store.
         """
         self.x = x
         self.y = y
-        self.__walls = 0b1111
-        self.__visited = False
-        self.__is_path = False
-        self.__is_fixed = False
+        self._store: CellStorage = (
+            store if store is not None else _DetachedStorage()
+        )
+        self._index = index
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Cell):
+            return NotImplemented
+        return (self._store is other._store
+                and self._index == other._index)
+
+    def __hash__(self) -> int:
+        return hash((id(self._store), self._index))
+
+    def __repr__(self) -> str:
+        return f"Cell({self.x}, {self.y}, walls={self.to_hex()})"
 
     def set_as_fixed(self) -> None:
         """Mark the cell as fixed (non-modifiable).
@@ -49,7 +118,8 @@ class Cell:
         (e.g., logos) and should not be altered during maze
         generation or solving.
         """
-        self.__is_fixed = True
+        self._store._flags[self._index] |= FLAG_FIXED
+        self._store.version += 1
 
     def is_fixed(self) -> bool:
         """Check whether the cell is fixed.
@@ -57,7 +127,7 @@ class Cell:
         Returns:
             bool: True if the cell is fixed, False otherwise.
         """
-        return self.__is_fixed
+        return bool(self._store._flags[self._index] & FLAG_FIXED)
 
     def _get_mask(self, direction: str) -> int:
         """
@@ -85,7 +155,8 @@ class Cell:
             direction (str): One of 'N', 'E', 'S', 'W'.
         """
         mask = self._get_mask(direction)
-        self.__walls &= ~mask
+        self._store._walls[self._index] &= ~mask
+        self._store.version += 1
 
     def add_wall(self, direction: str) -> None:
         """
@@ -95,7 +166,8 @@ class Cell:
             direction (str): One of 'N', 'E', 'S', 'W'.
         """
         mask = self._get_mask(direction)
-        self.__walls |= mask
+        self._store._walls[self._index] |= mask
+        self._store.version += 1
 
     def has_wall(self, direction: str) -> bool:
         """
@@ -108,7 +180,7 @@ class Cell:
             bool: True if the wall is present, False otherwise.
         """
         mask = self._get_mask(direction)
-        return bool(self.__walls & mask)
+        return bool(self._store._walls[self._index] & mask)
 
     def is_closed(self) -> bool:
         """
@@ -117,7 +189,7 @@ class Cell:
         Returns:
             bool: True if all walls are present.
         """
-        return self.__walls == 0b1111
+        return self._store._walls[self._index] == ALL_WALLS
 
     def is_open(self) -> bool:
         """
@@ -126,7 +198,7 @@ class Cell:
         Returns:
             bool: True if no walls are present.
         """
-        return self.__walls == 0b0000
+        return self._store._walls[self._index] == 0b0000
 
     @property
     def walls(self) -> int:
@@ -136,7 +208,7 @@ class Cell:
         Returns:
             int: 4-bit integer representing the walls.
         """
-        return self.__walls
+        return self._store._walls[self._index]
 
     @property
     def visited(self) -> bool:
@@ -146,7 +218,7 @@ class Cell:
         Returns:
             bool
         """
-        return self.__visited
+        return bool(self._store._flags[self._index] & FLAG_VISITED)
 
     @visited.setter
     def visited(self, value: bool) -> None:
@@ -161,7 +233,7 @@ class Cell:
         """
         if not isinstance(value, bool):
             raise ValueError("Visited must be a boolean")
-        self.__visited = value
+        self._set_flag(FLAG_VISITED, value)
 
     @property
     def path(self) -> bool:
@@ -171,7 +243,7 @@ class Cell:
         Returns:
             bool
         """
-        return self.__is_path
+        return bool(self._store._flags[self._index] & FLAG_PATH)
 
     @path.setter
     def path(self, value: bool) -> None:
@@ -186,7 +258,20 @@ class Cell:
         """
         if not isinstance(value, bool):
             raise ValueError("Path must be a boolean")
-        self.__is_path = value
+        self._set_flag(FLAG_PATH, value)
+
+    def _set_flag(self, flag: int, value: bool) -> None:
+        """
+        Set or clear one flag bit of the cell.
+
+        Args:
+            flag (int): Flag bit to change.
+            value (bool): New state of the flag.
+        """
+        if value:
+            self._store._flags[self._index] |= flag
+        else:
+            self._store._flags[self._index] &= ~flag
 
     def to_hex(self) -> str:
         """
@@ -197,4 +282,4 @@ class Cell:
         Returns:
             str: Hexadecimal representation of the walls.
         """
-        return f"{self.__walls:X}"
+        return f"{self._store._walls[self._index]:X}"
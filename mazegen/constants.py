@@ -9,3 +9,30 @@ WALL_MASKS = {
     "S": 0b0100,
     "W": 0b1000
 }
+
+ALL_WALLS = 0b1111
+
+# Open areas (width, height) that a non-perfect maze may not contain
+FORBIDDEN_ROOMS = ((3, 3), (2, 4), (4, 2))
+
+# Per-cell flag bits stored in Maze._flags
+FLAG_VISITED = 0b001
+FLAG_PATH = 0b010
+FLAG_FIXED = 0b100
+
+# Integer direction indices, in wall-bit order
+NORTH = 0
+EAST = 1
+SOUTH = 2
+WEST = 3
+
+DIRECTIONS = "NESW"
+DIR_MASKS = (0b0001, 0b0010, 0b0100, 0b1000)
+OPPOSITE = (SOUTH, WEST, NORTH, EAST)
+OPPOSITE_MASKS = (0b0100, 0b1000, 0b0001, 0b0010)
+DIR_DX = (0, 1, 0, -1)
+DIR_DY = (-1, 0, 1, 0)
+
+# Maps a wall nibble (0-15) to its uppercase hex digit
+HEX_DIGITS = b"0123456789ABCDEF"
+HEX_ENCODE = bytes.maketrans(bytes(range(16)), HEX_DIGITS)
@@ -0,0 +1,71 @@
+"""
+disjoint_set.py
+File that contains DisjointSet class
+"""
+from array import array
+
+
+class DisjointSet:
+    """
+    Union-find over the integers ``0 .. size - 1``.
+
+    Parents and set sizes live in flat ``array('i')`` buffers.
+    ``find`` is iterative and uses path halving, so it never
+    recurses however deep a tree gets, and ``union`` attaches the
+    smaller set below the larger one.
+
+    Attributes:
+        _parent (array): Parent id of every element.
+        _size (array): Set size, valid for root elements only.
+    """
+
+    __slots__ = ("_parent", "_size")
+
+    def __init__(self, size: int) -> None:
+        """
+        Create ``size`` singleton sets.
+
+        Args:
+            size (int): Number of elements.
+        """
+        self._parent = array("i", range(size))
+        self._size = array("i", [1]) * size
+
+    def find(self, item: int) -> int:
+        """
+        Return the representative of the set containing ``item``.
+
+        Args:
+            item (int): Element id.
+
+        Returns:
+            int: Root element of the set.
+        """
+        parent = self._parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, item1: int, item2: int) -> bool:
+        """
+        Merge the sets containing two elements.
+
+        Args:
+            item1 (int): First element id.
+            item2 (int): Second element id.
+
+        Returns:
+            bool: True if the sets were different and got merged.
+        """
+        root1 = self.find(item1)
+        root2 = self.find(item2)
+        if root1 == root2:
+            return False
+
+        size = self._size
+        if size[root1] < size[root2]:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        size[root1] += size[root2]
+        return True
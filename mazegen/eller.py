@@ -0,0 +1,290 @@
+"""Streaming maze generation with Eller's algorithm.
+
+Eller's algorithm builds a perfect maze one row at a time and only
+needs to remember, for each column, which set the cell of the
+current row belongs to. Memory is O(width) whatever the height, so
+rows can be written out as soon as they are finished.
+"""
+
+import random
+from array import array
+from typing import Collection, Dict, Iterator, List, Optional, Set, Tuple
+
+from .constants import (
+    ALL_WALLS,
+    DIR_MASKS,
+    EAST,
+    HEX_ENCODE,
+    NORTH,
+    SOUTH,
+    WEST,
+)
+from .fileio import write_chunks
+
+Pos = Tuple[int, int]
+
+_N = DIR_MASKS[NORTH]
+_E = DIR_MASKS[EAST]
+_S = DIR_MASKS[SOUTH]
+_W = DIR_MASKS[WEST]
+
+
+def _fixed_rows(fixed: Collection[Pos]) -> Dict[int, Set[int]]:
+    """Group fixed positions by row."""
+    rows: Dict[int, Set[int]] = {}
+    for x, y in fixed:
+        rows.setdefault(y, set()).add(x)
+    return rows
+
+
+def _segments(width: int, row_fixed: Set[int]) -> List[Tuple[int, int]]:
+    """Return the runs ``[start, end)`` of free cells of a row."""
+    runs: List[Tuple[int, int]] = []
+    start = 0
+    for x in sorted(row_fixed) + [width]:
+        if x > start:
+            runs.append((start, x))
+        start = x + 1
+    return runs
+
+
+def _escape_rows(
+    width: int,
+    height: int,
+    fixed_by_row: Dict[int, Set[int]],
+) -> Dict[int, bytearray]:
+    """Flag the cells that can reach the bottom row without going up.
+
+    A run of free cells that cannot (its cells are "trapped", like
+    the inside of a cup) has to be connected from the row above.
+    Only rows around fixed cells are computed; in every other row
+    all cells can escape.
+
+    Returns:
+        Dict[int, bytearray]: Row -> 1 for each cell that can escape.
+    """
+    rows: Dict[int, bytearray] = {}
+    if not fixed_by_row:
+        return rows
+
+    no_fixed: Set[int] = set()
+    top = max(0, min(fixed_by_row) - 1)
+    below: Optional[bytearray] = None
+
+    for y in range(min(max(fixed_by_row), height - 1), top - 1, -1):
+        below_fixed = fixed_by_row.get(y + 1, no_fixed)
+        flags = bytearray(width)
+
+        for start, end in _segments(width, fixed_by_row.get(y, no_fixed)):
+            if y == height - 1 or any(
+                x not in below_fixed and (below is None or below[x])
+                for x in range(start, end)
+            ):
+                flags[start:end] = b"\x01" * (end - start)
+
+        rows[y] = flags
+        below = flags
+
+    return rows
+
+
+def iter_eller_rows(
+    width: int,
+    height: int,
+    rng: random.Random,
+    fixed: Optional[Collection[Pos]] = None,
+) -> Iterator[bytearray]:
+    """Generate a perfect maze row by row with Eller's algorithm.
+
+    Random decisions for a whole row are drawn at once with
+    ``getrandbits``, so the output only depends on the state of
+    ``rng``.
+
+    Fixed cells keep all their walls and are never joined. Since the
+    fixed cells are known in advance, the generator looks ahead for
+    regions that can only be entered from above and always connects
+    them, and a set that cannot go down is merged with a neighbouring
+    set first. Only free cells completely enclosed by fixed cells
+    stay unreachable.
+
+    Args:
+        width (int): Maze width.
+        height (int): Maze height.
+        rng (random.Random): Random source.
+        fixed (Optional[Collection[Pos]]): Positions of fixed cells.
+
+    Yields:
+        bytearray: Wall bitmasks of each row, top to bottom.
+
+    Raises:
+        ValueError: If the size is not positive.
+    """
+    if width <= 0 or height <= 0:
+        raise ValueError("Maze size must be positive")
+
+    fixed_by_row = _fixed_rows(fixed or ())
+    escape_rows = _escape_rows(width, height, fixed_by_row)
+    no_fixed: Set[int] = set()
+
+    # Set id of each cell of the current row, -1 for fixed cells
+    sets = array("q", [-1]) * width
+    # Columns connected to the row above
+    up = bytearray(width)
+    next_id = 0
+
+    for y in range(height):
+        last = y == height - 1
+        row_fixed = fixed_by_row.get(y, no_fixed)
+        below_fixed = fixed_by_row.get(y + 1, no_fixed)
+        below_escape = escape_rows.get(y + 1)
+
+        walls = bytearray((ALL_WALLS,)) * width
+        members: Dict[int, List[int]] = {}
+
+        for x in range(width):
+            if x in row_fixed:
+                sets[x] = -1
+                continue
+            if up[x]:
+                walls[x] &= ~_N
+            else:
+                sets[x] = next_id
+                next_id += 1
+            members.setdefault(sets[x], []).append(x)
+
+        def join(x: int) -> bool:
+            """Open the east wall of column x if it merges two sets."""
+            a = sets[x]
+            b = sets[x + 1]
+            if a < 0 or b < 0 or a == b:
+                return False
+            if len(members[a]) < len(members[b]):
+                a, b = b, a
+            for column in members[b]:
+                sets[column] = a
+            members[a].extend(members.pop(b))
+            walls[x] &= ~_E
+            walls[x + 1] &= ~_W
+            return True
+
+        def can_descend(x: int) -> bool:
+            """Whether going down from column x leads somewhere."""
+            return x not in below_fixed and (
+                below_escape is None or bool(below_escape[x])
+            )
+
+        bits = rng.getrandbits(width)
+        for x in range(width - 1):
+            if last or (bits >> x) & 1:
+                join(x)
+
+        if last:
+            yield walls
+            return
+
+        # Sets that cannot go down are merged sideways until they
+        # can, where possible.
+        merged = True
+        while merged:
+            merged = False
+            for set_id in list(members):
+                cells = members.get(set_id)
+                if cells is None or any(can_descend(x) for x in cells):
+                    continue
+                for x in cells:
+                    if (x + 1 < width and join(x)) or (x > 0 and join(x - 1)):
+                        merged = True
+                        break
+
+        up = bytearray(width)
+        bits = rng.getrandbits(width)
+        for cells in members.values():
+            candidates = [x for x in cells if can_descend(x)]
+            if not candidates:
+                continue
+            chosen = [x for x in candidates if (bits >> x) & 1]
+            if not chosen:
+                chosen = [candidates[rng.randrange(len(candidates))]]
+            for x in chosen:
+                up[x] = 1
+                walls[x] &= ~_S
+
+        # Trapped runs of the next row get exactly one way in
+        if below_escape is not None:
+            for start, end in _segments(width, below_fixed):
+                if below_escape[start]:
+                    continue
+                entrances = [
+                    x for x in range(start, end) if x not in row_fixed
+                ]
+                if entrances:
+                    x = entrances[rng.randrange(len(entrances))]
+                    up[x] = 1
+                    walls[x] &= ~_S
+
+        for x in range(width):
+            if not up[x]:
+                sets[x] = -1
+
+        yield walls
+
+
+def iter_eller_hex(
+    width: int,
+    height: int,
+    rng: random.Random,
+    fixed: Optional[Collection[Pos]] = None,
+) -> Iterator[bytes]:
+    """Generate a maze with Eller's algorithm as hex file rows.
+
+    Args:
+        width (int): Maze width.
+        height (int): Maze height.
+        rng (random.Random): Random source.
+        fixed (Optional[Collection[Pos]]): Positions of fixed cells.
+
+    Yields:
+        bytes: One line of hex digits per row, ending with a newline,
+        in the format written by ``Maze.save_hex``.
+    """
+    for walls in iter_eller_rows(width, height, rng, fixed):
+        yield bytes(walls).translate(HEX_ENCODE) + b"\n"
+
+
+def save_eller_hex(
+    file_path: str,
+    width: int,
+    height: int,
+    seed: int = 0,
+    entry: Pos = (0, 0),
+    exit: Optional[Pos] = None,
+    fixed: Optional[Collection[Pos]] = None,
+    atomic: bool = False,
+) -> None:
+    """Stream a perfect maze straight to a hex file.
+
+    The maze never exists in memory as a whole, so the file can be
+    far larger than RAM. The solution line is left empty since
+    solving needs the full maze.
+
+    Args:
+        file_path (str): Output file path.
+        width (int): Maze width.
+        height (int): Maze height.
+        seed (int, optional): Random seed, 0 for unseeded.
+            Defaults to 0.
+        entry (Pos, optional): Entry position. Defaults to (0, 0).
+        exit (Optional[Pos]): Exit position. Defaults to bottom-right.
+        fixed (Optional[Collection[Pos]]): Positions of fixed cells.
+        atomic (bool, optional): Replace the file atomically.
+            Defaults to False.
+    """
+    rng = random.Random(None if seed == 0 else seed)
+    exit = exit or (width - 1, height - 1)
+    footer = f"\n{entry[0]},{entry[1]}\n{exit[0]},{exit[1]}\n"
+
+    def chunks() -> Iterator[bytes]:
+        yield from iter_eller_hex(width, height, rng, fixed)
+        yield footer.encode("utf-8")
+
+    write_chunks(file_path, chunks(), atomic)
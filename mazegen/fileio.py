@@ -0,0 +1,57 @@
+"""Low-level file output helpers."""
+
+import os
+import tempfile
+from typing import Iterable
+
+
+def write_bytes(file_path: str, data: bytes, atomic: bool = False) -> None:
+    """Write a whole buffer to a file with a single write call.
+
+    In atomic mode the data goes to a temporary file in the same
+    directory which then replaces ``file_path``, so readers never see
+    a partially written file.
+
+    Args:
+        file_path (str): Output file path.
+        data (bytes): Content to write.
+        atomic (bool, optional): Write through a temporary file and
+            rename it. Defaults to False.
+    """
+    write_chunks(file_path, (data,), atomic)
+
+
+def write_chunks(
+    file_path: str,
+    chunks: Iterable[bytes],
+    atomic: bool = False,
+) -> None:
+    """Stream chunks to a file as they are produced.
+
+    Only one chunk is held at a time, so the output may be far
+    larger than memory. Atomic mode works as in ``write_bytes``.
+
+    Args:
+        file_path (str): Output file path.
+        chunks (Iterable[bytes]): Content to write, in order.
+        atomic (bool, optional): Write through a temporary file and
+            rename it. Defaults to False.
+    """
+    if not atomic:
+        with open(file_path, "wb") as file:
+            for chunk in chunks:
+                file.write(chunk)
+        return
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            for chunk in chunks:
+                file.write(chunk)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,381 @@
+"""Growing-tree maze generation with a pluggable selection policy.
+
+The growing-tree algorithm keeps a set of active cells. At each step
+it selects one of them and carves to a random unvisited neighbour,
+which becomes active; a cell without unvisited neighbours leaves the
+set. The selection policy sets the texture of the maze:
+
+* ``"newest"``: always the last added cell, i.e. depth-first search
+  (long winding corridors);
+* ``"random"``: a uniformly random cell, like Prim's algorithm (many
+  short dead ends);
+* ``"oldest"``: the first added cell (long straight corridors
+  radiating from the start);
+* ``"mixed:R"``: a random cell with probability R, else the newest.
+"""
+
+import random
+from array import array
+from typing import Iterator, NamedTuple, Sequence, Tuple
+
+from .constants import (
+    DIR_MASKS,
+    EAST,
+    FLAG_VISITED,
+    NORTH,
+    OPPOSITE_MASKS,
+    SOUTH,
+    WEST,
+)
+from .maze import Maze
+
+_N = DIR_MASKS[NORTH]
+_E = DIR_MASKS[EAST]
+_S = DIR_MASKS[SOUTH]
+_W = DIR_MASKS[WEST]
+
+NEWEST = "newest"
+RANDOM = "random"
+OLDEST = "oldest"
+MIXED = "mixed"
+POLICIES = (NEWEST, RANDOM, OLDEST, MIXED)
+DEFAULT_POLICY = "mixed:0.5"
+
+# Translation table from cell flags to the visited bitmap
+_VISITED_TABLE = bytes(
+    1 if flag & FLAG_VISITED else 0 for flag in range(256)
+)
+
+
+class Policy(NamedTuple):
+    """Parsed cell-selection policy.
+
+    Attributes:
+        kind (str): One of `POLICIES`.
+        ratio (float): Probability of picking a random cell, only
+            used by the mixed policy.
+    """
+
+    kind: str
+    ratio: float = 0.0
+
+
+def parse_policy(policy: str) -> Policy:
+    """Parse a policy name such as ``"newest"`` or ``"mixed:0.25"``.
+
+    Args:
+        policy (str): Policy name.
+
+    Returns:
+        Policy: The parsed policy.
+
+    Raises:
+        ValueError: If the policy is unknown or the ratio is not a
+            number between 0 and 1.
+    """
+    kind, _, ratio = policy.strip().lower().partition(":")
+
+    if kind != MIXED:
+        if kind not in POLICIES or ratio:
+            raise ValueError(
+                f"Invalid policy: {policy}. Allowed values: "
+                f"{NEWEST}, {RANDOM}, {OLDEST}, {MIXED}:<ratio>"
+            )
+        return Policy(kind)
+
+    try:
+        value = float(ratio)
+    except ValueError:
+        raise ValueError(f"Invalid mixed policy ratio: {ratio!r}") from None
+    if not 0.0 <= value <= 1.0:
+        raise ValueError("Mixed policy ratio must be between 0 and 1")
+    return Policy(MIXED, value)
+
+
+def border_masks(width: int, height: int) -> bytearray:
+    """Return the walls of every cell that lie on the maze border.
+
+    Args:
+        width (int): Maze width.
+        height (int): Maze height.
+
+    Returns:
+        bytearray: One wall bitmask per cell.
+    """
+    if width == 1:
+        row = bytearray((_W | _E,))
+    else:
+        row = bytearray((_W,)) + bytearray(width - 2) + bytearray((_E,))
+
+    if height == 1:
+        return bytearray(mask | _N | _S for mask in row)
+
+    top = bytearray(mask | _N for mask in row)
+    bottom = bytearray(mask | _S for mask in row)
+    return top + row * (height - 2) + bottom
+
+
+def _backtrack(
+    maze: Maze,
+    rng: random.Random,
+    start: int,
+    directions: Sequence[int],
+) -> None:
+    """Newest-cell growing tree: the recursive backtracker.
+
+    Same output as `grow_tree` with the newest policy, with the four
+    neighbour tests unrolled, border masks looked up in a table and
+    no allocation per step.
+    """
+    walls = maze._walls
+    flags = maze._flags
+    visited = bytearray(bytes(flags).translate(_VISITED_TABLE))
+    edges = border_masks(maze.width, maze.height)
+
+    offsets = tuple(maze._offsets[direction] for direction in directions)
+    masks = tuple(DIR_MASKS[direction] for direction in directions)
+    opposites = tuple(OPPOSITE_MASKS[direction] for direction in directions)
+    o0, o1, o2, o3 = offsets
+    m0, m1, m2, m3 = masks
+
+    found = array("i", bytes(16))
+    randrange = rng.randrange
+    stack = array("i", [start])
+    push = stack.append
+    pop = stack.pop
+    visited[start] = 1
+    flags[start] |= FLAG_VISITED
+    carved = 0
+
+    while stack:
+        cell = stack[-1]
+        edge = edges[cell]
+        count = 0
+        if not edge & m0 and not visited[cell + o0]:
+            found[0] = 0
+            count = 1
+        if not edge & m1 and not visited[cell + o1]:
+            found[count] = 1
+            count += 1
+        if not edge & m2 and not visited[cell + o2]:
+            found[count] = 2
+            count += 1
+        if not edge & m3 and not visited[cell + o3]:
+            found[count] = 3
+            count += 1
+
+        if count:
+            move = found[randrange(count)]
+            neighbor = cell + offsets[move]
+            walls[cell] &= ~masks[move]
+            walls[neighbor] &= ~opposites[move]
+            visited[neighbor] = 1
+            flags[neighbor] |= FLAG_VISITED
+            push(neighbor)
+            carved += 1
+        else:
+            pop()
+
+    maze.version += carved
+
+
+def iter_grow_tree(
+    maze: Maze,
+    rng: random.Random,
+    start: int,
+    policy: str = NEWEST,
+    directions: Sequence[int] = (EAST, WEST, SOUTH, NORTH),
+) -> Iterator[Tuple[int, int]]:
+    """Carve a spanning tree step by step, like `grow_tree`.
+
+    Each carve is applied to the maze and yielded before the next one
+    is drawn. The random stream is consumed exactly like `grow_tree`,
+    so a fully consumed iterator leaves the same maze; `grow_tree`
+    keeps its own copy of the loop so one-shot generation does not
+    pay for the generator. ``version`` is not updated; callers count
+    the steps.
+
+    Args:
+        maze (Maze): Maze to carve.
+        rng (random.Random): Random source.
+        start (int): Cell id of the first active cell.
+        policy (str, optional): Cell-selection policy, see
+            `parse_policy`. Defaults to "newest".
+        directions (Sequence[int], optional): Order in which
+            neighbours are listed. Defaults to E, W, S, N.
+
+    Yields:
+        Tuple[int, int]: ``(cell_id, direction)`` of every removed
+        wall, from the active cell towards the new cell.
+
+    Raises:
+        ValueError: If the policy is invalid.
+    """
+    kind, ratio = parse_policy(policy)
+
+    width = maze.width
+    size = width * maze.height
+    walls = maze._walls
+    flags = maze._flags
+    visited = bytearray(bytes(flags).translate(_VISITED_TABLE))
+
+    last_row = size - width
+    moves: Tuple[Tuple[int, int, int, int], ...] = tuple(
+        (maze._offsets[direction],
+         DIR_MASKS[direction], OPPOSITE_MASKS[direction], direction)
+        for direction in directions
+    )
+
+    # Preallocated neighbour buffer: cell ids and their move index
+    found = array("i", bytes(4 * len(moves)))
+    found_move = array("i", bytes(4 * len(moves)))
+
+    active = array("i", [start])
+    head = 0
+    visited[start] = 1
+    flags[start] |= FLAG_VISITED
+
+    while len(active) > head:
+        if kind == NEWEST:
+            position = len(active) - 1
+        elif kind == OLDEST:
+            position = head
+        elif kind == RANDOM or rng.random() < ratio:
+            position = head + rng.randrange(len(active) - head)
+        else:
+            position = len(active) - 1
+
+        cell = active[position]
+        x = cell % width
+        # Walls of the cell on the maze border
+        edge = ((_N if cell < width else 0)
+                | (_S if cell >= last_row else 0)
+                | (_W if x == 0 else 0)
+                | (_E if x == width - 1 else 0))
+        count = 0
+        for move, (offset, mask, _, _) in enumerate(moves):
+            if not edge & mask and not visited[cell + offset]:
+                found[count] = cell + offset
+                found_move[count] = move
+                count += 1
+
+        if count:
+            chosen = rng.randrange(count)
+            neighbor = found[chosen]
+            _, mask, opposite, direction = moves[found_move[chosen]]
+            walls[cell] &= ~mask
+            walls[neighbor] &= ~opposite
+            visited[neighbor] = 1
+            flags[neighbor] |= FLAG_VISITED
+            active.append(neighbor)
+            yield cell, direction
+        elif position == len(active) - 1:
+            active.pop()
+        elif position == head:
+            head += 1
+        else:
+            # Random and mixed picks: swap-remove in O(1). The last
+            # cell fills the gap, so for the mixed policy "newest"
+            # means the most recent cell still at the end of the set.
+            active[position] = active.pop()
+
+
+def grow_tree(
+    maze: Maze,
+    rng: random.Random,
+    start: int,
+    policy: str = NEWEST,
+    directions: Sequence[int] = (EAST, WEST, SOUTH, NORTH),
+) -> None:
+    """Carve a spanning tree of the unvisited cells from a start cell.
+
+    Visited and fixed cells (fixed cells are always visited) are
+    never entered. Neighbours are collected in ``directions`` order
+    and one is drawn with ``rng.randrange``, so with the newest
+    policy the random stream is consumed exactly like a classic
+    recursive backtracker using ``rng.choice``.
+
+    Args:
+        maze (Maze): Maze to carve.
+        rng (random.Random): Random source.
+        start (int): Cell id of the first active cell.
+        policy (str, optional): Cell-selection policy, see
+            `parse_policy`. Defaults to "newest".
+        directions (Sequence[int], optional): Order in which
+            neighbours are listed. Defaults to E, W, S, N.
+
+    Raises:
+        ValueError: If the policy is invalid.
+    """
+    kind, ratio = parse_policy(policy)
+    if kind == NEWEST and len(directions) == 4:
+        _backtrack(maze, rng, start, directions)
+        return
+
+    # Same loop as `iter_grow_tree`, kept free of generator overhead
+    width = maze.width
+    size = width * maze.height
+    walls = maze._walls
+    flags = maze._flags
+    visited = bytearray(bytes(flags).translate(_VISITED_TABLE))
+
+    last_row = size - width
+    moves: Tuple[Tuple[int, int, int], ...] = tuple(
+        (maze._offsets[direction],
+         DIR_MASKS[direction], OPPOSITE_MASKS[direction])
+        for direction in directions
+    )
+
+    # Preallocated neighbour buffer: cell ids and their move index
+    found = array("i", bytes(4 * len(moves)))
+    found_move = array("i", bytes(4 * len(moves)))
+
+    active = array("i", [start])
+    head = 0
+    visited[start] = 1
+    flags[start] |= FLAG_VISITED
+    carved = 0
+
+    while len(active) > head:
+        if kind == NEWEST:
+            position = len(active) - 1
+        elif kind == OLDEST:
+            position = head
+        elif kind == RANDOM or rng.random() < ratio:
+            position = head + rng.randrange(len(active) - head)
+        else:
+            position = len(active) - 1
+
+        cell = active[position]
+        x = cell % width
+        # Walls of the cell on the maze border
+        edge = ((_N if cell < width else 0)
+                | (_S if cell >= last_row else 0)
+                | (_W if x == 0 else 0)
+                | (_E if x == width - 1 else 0))
+        count = 0
+        for move, (offset, mask, _) in enumerate(moves):
+            if not edge & mask and not visited[cell + offset]:
+                found[count] = cell + offset
+                found_move[count] = move
+                count += 1
+
+        if count:
+            chosen = rng.randrange(count)
+            neighbor = found[chosen]
+            _, mask, opposite = moves[found_move[chosen]]
+            walls[cell] &= ~mask
+            walls[neighbor] &= ~opposite
+            visited[neighbor] = 1
+            flags[neighbor] |= FLAG_VISITED
+            active.append(neighbor)
+            carved += 1
+        elif position == len(active) - 1:
+            active.pop()
+        elif position == head:
+            head += 1
+        else:
+            # Random and mixed picks: swap-remove, as in iter_grow_tree
+            active[position] = active.pop()
+
+    maze.version += carved
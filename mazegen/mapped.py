@@ -0,0 +1,210 @@
+"""Memory-mapped, lazily decoded view over saved hex maze files."""
+
+import mmap
+from typing import Any, Dict, Iterator, Tuple
+
+from .constants import ALL_WALLS, FLAG_FIXED, FLAG_VISITED, HEX_DIGITS
+from .maze import Maze
+
+# Maps an ASCII hex digit (either case) back to its wall nibble
+_HEX_DECODE = bytes.maketrans(
+    HEX_DIGITS + HEX_DIGITS.lower(), bytes(range(16)) * 2
+)
+
+
+class _HexWalls:
+    """Wall buffer that decodes hex digits of a mapped file on access."""
+
+    __slots__ = ("_buffer", "_width", "_size", "_writable")
+
+    def __init__(self, buffer: mmap.mmap, width: int, size: int,
+                 writable: bool) -> None:
+        self._buffer = buffer
+        self._width = width
+        self._size = size
+        self._writable = writable
+
+    def _offset(self, index: int) -> int:
+        if not 0 <= index < self._size:
+            raise IndexError("cell index out of range")
+        # Each row is followed by a newline in the file
+        return index + index // self._width
+
+    def __getitem__(self, index: int) -> int:
+        return _HEX_DECODE[self._buffer[self._offset(index)]]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        if not self._writable:
+            raise TypeError("Mapped maze is read-only")
+        self._buffer[self._offset(index)] = HEX_DIGITS[value & ALL_WALLS]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        for index in range(self._size):
+            yield self[index]
+
+
+class _InferredFlags:
+    """Flag buffer derived from the walls of a mapped file.
+
+    Hex files do not store flags, so fully closed cells are reported
+    as fixed (and visited), like the cells of the '42' logo. In
+    copy-on-write mode, written flags are kept in a private overlay.
+    """
+
+    __slots__ = ("_walls", "_overlay", "_writable")
+
+    def __init__(self, walls: _HexWalls, writable: bool) -> None:
+        self._walls = walls
+        self._overlay: Dict[int, int] = {}
+        self._writable = writable
+
+    def __getitem__(self, index: int) -> int:
+        flags = self._overlay.get(index)
+        if flags is not None:
+            return flags
+        if self._walls[index] == ALL_WALLS:
+            return FLAG_FIXED | FLAG_VISITED
+        return 0
+
+    def __setitem__(self, index: int, value: int) -> None:
+        if not self._writable:
+            raise TypeError("Mapped maze is read-only")
+        self._overlay[index] = value
+
+    def __len__(self) -> int:
+        return len(self._walls)
+
+    def __iter__(self) -> Iterator[int]:
+        for index in range(len(self)):
+            yield self[index]
+
+
+class MappedMaze(Maze):
+    """Maze backed by an ``mmap`` of a file written by ``save_hex``.
+
+    Rows of the hex format have a fixed width, so the offset of any
+    cell is computed directly and decoded only when it is read. The
+    whole file is never parsed, which lets the solver and renderers
+    work on archived mazes far larger than memory.
+
+    By default the view is read-only and any wall change raises
+    ``TypeError``. With ``copy_on_write=True`` changes are allowed but
+    stay private to the mapping; the file is never modified.
+
+    Attributes:
+        solution (str): Direction string stored after the exit line.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        copy_on_write: bool = False,
+        perfect: bool = True,
+        seed: int = 0,
+    ) -> None:
+        """Map a hex maze file.
+
+        Args:
+            file_path (str): Path of a file written by ``save_hex``.
+            copy_on_write (bool, optional): Allow private changes.
+                Defaults to False.
+            perfect (bool, optional): Perfect flag to report, since
+                the file does not store it. Defaults to True.
+            seed (int, optional): Seed to report. Defaults to 0.
+
+        Raises:
+            ValueError: If the file is not in the hex maze format.
+        """
+        access = mmap.ACCESS_COPY if copy_on_write else mmap.ACCESS_READ
+        with open(file_path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=access)
+        self._writable = copy_on_write
+
+        try:
+            width, height, entry, exit, solution = self._read_layout()
+        except ValueError:
+            self._mmap.close()
+            raise
+
+        self.solution = solution
+        super().__init__(width, height, perfect, seed, entry, exit,
+                         compact=True)
+
+    def _read_layout(
+        self,
+    ) -> Tuple[int, int, Tuple[int, int], Tuple[int, int], str]:
+        """Locate the grid and parse the footer of the mapped file."""
+        mm = self._mmap
+        width = mm.find(b"\n")
+        grid_end = mm.find(b"\n\n")
+        if width <= 0 or grid_end < 0 or (grid_end + 1) % (width + 1):
+            raise ValueError("Invalid hex maze file")
+
+        self._grid_size = grid_end + 1
+        height = self._grid_size // (width + 1)
+
+        footer = mm[grid_end + 2:].decode("ascii").split("\n")
+        try:
+            entry = _parse_pos(footer[0])
+            exit = _parse_pos(footer[1])
+        except (IndexError, ValueError):
+            raise ValueError("Invalid hex maze file: bad entry or exit")
+        solution = footer[2] if len(footer) > 2 else ""
+        return width, height, entry, exit, solution
+
+    def _init_storage(self) -> None:
+        """Use decoding views over the mapped file as buffers."""
+        walls = _HexWalls(self._mmap, self.width,
+                          self.width * self.height, self._writable)
+        self._walls = walls
+        self._flags = _InferredFlags(walls, self._writable)
+
+    def to_hex_bytes(self) -> bytes:
+        """Return the grid rows straight from the mapped file.
+
+        Returns:
+            bytes: Hex rows, each ending with a newline.
+        """
+        return self._mmap[:self._grid_size]
+
+    def to_numpy(self) -> Tuple[Any, Any]:
+        """Decode the mapped grid into ``uint8`` arrays.
+
+        The hex digits are decoded with one vectorised table lookup.
+        The arrays are copies: writing to them does not change the
+        view. Requires NumPy.
+
+        Returns:
+            Tuple[ndarray, ndarray]: ``(walls, flags)``.
+        """
+        from .arrays import require_numpy
+
+        require_numpy()
+        import numpy as np
+
+        rows = np.frombuffer(self._mmap, dtype=np.uint8,
+                             count=self._grid_size)
+        digits = rows.reshape(self.height, self.width + 1)[:, :self.width]
+        walls = np.frombuffer(_HEX_DECODE, dtype=np.uint8)[digits]
+        flags = np.where(walls == ALL_WALLS,
+                         FLAG_FIXED | FLAG_VISITED, 0).astype(np.uint8)
+        return walls, flags
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mmap.close()
+
+    def __enter__(self) -> "MappedMaze":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _parse_pos(line: str) -> Tuple[int, int]:
+    """Parse an ``x,y`` footer line."""
+    x, y = line.split(",")
+    return int(x), int(y)
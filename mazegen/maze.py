@@ -1,8 +1,25 @@
 """Maze structure and utility methods."""
 
-from typing import List, Tuple
-
-from .cell import Cell
+from typing import Any, List, Optional, Tuple
+
+from .cell import ByteBuffer, Cell
+from .constants import (
+    ALL_WALLS,
+    DIR_DX,
+    DIR_DY,
+    DIR_MASKS,
+    DIRECTIONS,
+    EAST,
+    FLAG_FIXED,
+    FLAG_VISITED,
+    FORBIDDEN_ROOMS,
+    HEX_ENCODE,
+    NORTH,
+    OPPOSITE_MASKS,
+    SOUTH,
+    WEST,
+)
+from .fileio import write_bytes
 
 
 class Maze:
@@ -12,6 +29,12 @@ class Maze:
     entry/exit points, and utility methods to manipulate
     and analyze the maze.
 
+    Walls and per-cell flags live in two flat ``bytearray`` buffers
+    indexed by ``y * width + x``. ``Cell`` objects are views over
+    those buffers: by default they are built once, on first access,
+    and reused; in compact mode they are never stored and
+    ``get_cell`` returns a fresh view on every call.
+
     Attributes:
         width (int): Width of the maze.
         height (int): Height of the maze.
@@ -19,7 +42,11 @@ class Maze:
         seed (int): Random seed used for generation.
         entry (Tuple[int, int]): Entry coordinates.
         exit (Tuple[int, int]): Exit coordinates.
-        grid (List[List[Cell]]): 2D grid of cells.
+        algorithm (str): Algorithm that generated the maze, if any.
+        compact (bool): Whether cell views are created on demand only.
+        version (int): Mutation counter, increased by every wall or
+            fixed-cell change made through the maze or its cells.
+        grid (List[List[Cell]]): 2D grid of cell views.
     """
 
     def __init__(
@@ -30,6 +57,7 @@ class Maze:
         seed: int = 1,
         entry: Tuple[int, int] = (0, 0),
         exit: Tuple[int, int] = (0, 0),
+        compact: bool = False,
     ) -> None:
         """Initialize the maze.
 
@@ -43,6 +71,8 @@ class Maze:
                 Defaults to (0, 0).
             exit (Tuple[int, int], optional): Exit position.
                 Defaults to bottom-right if not provided.
+            compact (bool, optional): Never keep per-cell objects.
+                Defaults to False.
         """
         self.width = width
         self.height = height
@@ -50,11 +80,59 @@ class Maze:
         self.seed = seed
         self.entry = entry
         self.exit = exit or (width - 1, height - 1)
+        self.compact = compact
+        self.algorithm = ""
+        self.version = 0
 
-        self.grid: List[List[Cell]] = [
-            [Cell(x, y) for x in range(width)]
-            for y in range(height)
-        ]
+        self._init_storage()
+        self._grid: Optional[List[List[Cell]]] = None
+        # Index offsets towards N, E, S, W neighbours
+        self._offsets = (-width, 1, width, -1)
+
+    def _init_storage(self) -> None:
+        """Allocate the wall and flag buffers, all walls closed."""
+        size = self.width * self.height
+        self._walls: ByteBuffer = bytearray((ALL_WALLS,)) * size
+        self._flags: ByteBuffer = bytearray(size)
+
+    @property
+    def grid(self) -> List[List[Cell]]:
+        """2D grid of cell views, built on first access.
+
+        Returns:
+            List[List[Cell]]: Rows of cells.
+        """
+        if self._grid is None:
+            width = self.width
+            self._grid = [
+                [Cell(x, y, self, y * width + x) for x in range(width)]
+                for y in range(self.height)
+            ]
+        return self._grid
+
+    def cell_id(self, x: int, y: int) -> int:
+        """Return the flat buffer index of a position.
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+
+        Returns:
+            int: Index ``y * width + x``.
+        """
+        return y * self.width + x
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """Return the coordinates of a flat buffer index.
+
+        Args:
+            index (int): Cell index.
+
+        Returns:
+            Tuple[int, int]: Position (x, y).
+        """
+        y, x = divmod(index, self.width)
+        return x, y
 
     def get_cell(self, x: int, y: int) -> Cell:
         """Return the cell at given coordinates.
@@ -73,6 +151,8 @@ class Maze:
             raise IndexError(
                 f"Cell coordinates out of bounds: ({x}, {y})"
             )
+        if self.compact:
+            return Cell(x, y, self, y * self.width + x)
         return self.grid[y][x]
 
     def get_neighbors(self, cell: Cell) -> List[Cell]:
@@ -94,6 +174,155 @@ class Maze:
 
         return neighbors
 
+    def neighbor_idx(self, index: int, direction: int) -> int:
+        """Return the index of the neighbour in a direction.
+
+        Args:
+            index (int): Cell index.
+            direction (int): Direction index (NORTH..WEST).
+
+        Returns:
+            int: Neighbour index, or -1 if it is outside the maze.
+        """
+        y, x = divmod(index, self.width)
+        nx = x + DIR_DX[direction]
+        ny = y + DIR_DY[direction]
+        if 0 <= nx < self.width and 0 <= ny < self.height:
+            return index + self._offsets[direction]
+        return -1
+
+    def direction_between(self, index1: int, index2: int) -> int:
+        """Return the direction leading from one cell to an adjacent one.
+
+        Args:
+            index1 (int): First cell index.
+            index2 (int): Second cell index.
+
+        Returns:
+            int: Direction index, or -1 if the cells are not adjacent.
+        """
+        delta = index2 - index1
+        if delta == 1:
+            return EAST if index2 % self.width else -1
+        if delta == -1:
+            return WEST if index1 % self.width else -1
+        if delta == self.width:
+            return SOUTH
+        if delta == -self.width:
+            return NORTH
+        return -1
+
+    def has_wall_idx(self, index: int, direction: int) -> bool:
+        """Check a wall of a cell using integer indices.
+
+        Args:
+            index (int): Cell index.
+            direction (int): Direction index.
+
+        Returns:
+            bool: True if the wall is present.
+        """
+        return bool(self._walls[index] & DIR_MASKS[direction])
+
+    def remove_wall_idx(self, index: int, direction: int) -> None:
+        """Remove the wall between a cell and its neighbour.
+
+        Fast path without bounds checks: the neighbour in
+        ``direction`` must exist.
+
+        Args:
+            index (int): Cell index.
+            direction (int): Direction index.
+        """
+        walls = self._walls
+        walls[index] &= ~DIR_MASKS[direction]
+        walls[index + self._offsets[direction]] &= ~OPPOSITE_MASKS[direction]
+        self.version += 1
+
+    def add_wall_idx(self, index: int, direction: int) -> None:
+        """Add the wall between a cell and its neighbour.
+
+        Fast path without bounds checks: the neighbour in
+        ``direction`` must exist.
+
+        Args:
+            index (int): Cell index.
+            direction (int): Direction index.
+        """
+        walls = self._walls
+        walls[index] |= DIR_MASKS[direction]
+        walls[index + self._offsets[direction]] |= OPPOSITE_MASKS[direction]
+        self.version += 1
+
+    def remove_wall_between_idx(self, index1: int, index2: int) -> None:
+        """Remove the wall between two adjacent cells given by index.
+
+        Args:
+            index1 (int): First cell index.
+            index2 (int): Second cell index.
+
+        Raises:
+            ValueError: If cells are not adjacent.
+        """
+        direction = self.direction_between(index1, index2)
+        if direction < 0:
+            raise ValueError("Cells are not adjacent")
+        self.remove_wall_idx(index1, direction)
+
+    def add_wall_between_idx(self, index1: int, index2: int) -> None:
+        """Add a wall between two adjacent cells given by index.
+
+        Args:
+            index1 (int): First cell index.
+            index2 (int): Second cell index.
+
+        Raises:
+            ValueError: If cells are not adjacent.
+        """
+        direction = self.direction_between(index1, index2)
+        if direction < 0:
+            raise ValueError("Cells are not adjacent")
+        self.add_wall_idx(index1, direction)
+
+    def is_fixed_idx(self, index: int) -> bool:
+        """Check whether the cell at an index is fixed.
+
+        Args:
+            index (int): Cell index.
+
+        Returns:
+            bool: True if the cell is fixed.
+        """
+        return bool(self._flags[index] & FLAG_FIXED)
+
+    def set_fixed_idx(self, index: int) -> None:
+        """Mark the cell at an index as fixed and visited.
+
+        Args:
+            index (int): Cell index.
+        """
+        self._flags[index] |= FLAG_FIXED | FLAG_VISITED
+        self.version += 1
+
+    def is_visited_idx(self, index: int) -> bool:
+        """Check whether the cell at an index has been visited.
+
+        Args:
+            index (int): Cell index.
+
+        Returns:
+            bool: True if visited.
+        """
+        return bool(self._flags[index] & FLAG_VISITED)
+
+    def set_visited_idx(self, index: int) -> None:
+        """Mark the cell at an index as visited.
+
+        Args:
+            index (int): Cell index.
+        """
+        self._flags[index] |= FLAG_VISITED
+
     def has_wall_between(self, cell1: Cell, cell2: Cell) -> bool:
         """Check if a wall exists between two adjacent cells.
 
@@ -104,19 +333,13 @@ class Maze:
         Returns:
             bool: True if a wall exists.
         """
-        dx = cell2.x - cell1.x
-        dy = cell2.y - cell1.y
-
-        if dx == 1:
-            return cell1.has_wall("E")
-        if dx == -1:
-            return cell1.has_wall("W")
-        if dy == 1:
-            return cell1.has_wall("S")
-        if dy == -1:
-            return cell1.has_wall("N")
-
-        return True
+        direction = self.direction_between(
+            self.cell_id(cell1.x, cell1.y),
+            self.cell_id(cell2.x, cell2.y),
+        )
+        if direction < 0:
+            return True
+        return cell1.has_wall(DIRECTIONS[direction])
 
     def remove_wall_between(self, cell1: Cell, cell2: Cell) -> None:
         """Remove the wall between two adjacent cells.
@@ -128,23 +351,10 @@ class Maze:
         Raises:
             ValueError: If cells are not adjacent.
         """
-        dx = cell2.x - cell1.x
-        dy = cell2.y - cell1.y
-
-        if dx == 1 and dy == 0:
-            cell1.remove_wall("E")
-            cell2.remove_wall("W")
-        elif dx == -1 and dy == 0:
-            cell1.remove_wall("W")
-            cell2.remove_wall("E")
-        elif dx == 0 and dy == 1:
-            cell1.remove_wall("S")
-            cell2.remove_wall("N")
-        elif dx == 0 and dy == -1:
-            cell1.remove_wall("N")
-            cell2.remove_wall("S")
-        else:
-            raise ValueError("Cells are not adjacent")
+        self.remove_wall_between_idx(
+            self.cell_id(cell1.x, cell1.y),
+            self.cell_id(cell2.x, cell2.y),
+        )
 
     def add_wall_between(self, cell1: Cell, cell2: Cell) -> None:
         """Add a wall between two adjacent cells.
@@ -152,22 +362,14 @@ class Maze:
         Args:
             cell1 (Cell): First cell.
             cell2 (Cell): Second cell.
+
+        Raises:
+            ValueError: If cells are not adjacent.
         """
-        dx = cell2.x - cell1.x
-        dy = cell2.y - cell1.y
-
-        if dx == 1:
-            cell1.add_wall("E")
-            cell2.add_wall("W")
-        elif dx == -1:
-            cell1.add_wall("W")
-            cell2.add_wall("E")
-        elif dy == 1:
-            cell1.add_wall("S")
-            cell2.add_wall("N")
-        elif dy == -1:
-            cell1.add_wall("N")
-            cell2.add_wall("S")
+        self.add_wall_between_idx(
+            self.cell_id(cell1.x, cell1.y),
+            self.cell_id(cell2.x, cell2.y),
+        )
 
     def has_open_area(self, w: int, h: int) -> bool:
         """Check if the maze contains an open rectangular area.
@@ -181,68 +383,168 @@ class Maze:
         """
         for y in range(self.height - h + 1):
             for x in range(self.width - w + 1):
-                open_area = True
-
-                for dy in range(h):
-                    for dx in range(w - 1):
-                        c1 = self.get_cell(x + dx, y + dy)
-                        c2 = self.get_cell(x + dx + 1, y + dy)
-
-                        if self.has_wall_between(c1, c2):
-                            open_area = False
-                            break
-                    if not open_area:
-                        break
-
-                if not open_area:
-                    continue
-
-                for dy in range(h - 1):
-                    for dx in range(w):
-                        c1 = self.get_cell(x + dx, y + dy)
-                        c2 = self.get_cell(x + dx, y + dy + 1)
-
-                        if self.has_wall_between(c1, c2):
-                            open_area = False
-                            break
-                    if not open_area:
-                        break
-
-                if open_area:
+                if self.has_open_area_at(x, y, w, h):
                     return True
 
         return False
 
+    def has_open_area_at(self, x: int, y: int, w: int, h: int) -> bool:
+        """Check if one rectangular window has no inner walls.
+
+        Args:
+            x (int): Left column of the window.
+            y (int): Top row of the window.
+            w (int): Width of the window.
+            h (int): Height of the window.
+
+        Returns:
+            bool: True if every wall inside the window is open.
+        """
+        walls = self._walls
+        east = DIR_MASKS[EAST]
+        south = DIR_MASKS[SOUTH]
+
+        for row in range(y, y + h):
+            start = row * self.width + x
+            for index in range(start, start + w - 1):
+                if walls[index] & east:
+                    return False
+
+        for row in range(y, y + h - 1):
+            start = row * self.width + x
+            for index in range(start, start + w):
+                if walls[index] & south:
+                    return False
+
+        return True
+
     def has_invalid_room(self) -> bool:
         """Check if the maze contains forbidden room shapes.
 
         Returns:
             bool: True if an invalid room exists.
         """
-        forbidden = [(3, 3), (2, 4), (4, 2)]
-
-        for w, h in forbidden:
+        for w, h in FORBIDDEN_ROOMS:
             if self.has_open_area(w, h):
                 return True
 
         return False
 
-    def save_hex(self, file_path: str) -> None:
+    def has_invalid_room_near(self, index: int, direction: int) -> bool:
+        """Check forbidden room shapes around a single wall.
+
+        Only the windows that contain both the cell and its
+        neighbour in ``direction`` are scanned, so the cost does not
+        depend on the maze size. If the maze had no invalid room
+        before that wall was opened, the result equals
+        ``has_invalid_room()``.
+
+        Args:
+            index (int): Cell index.
+            direction (int): EAST or SOUTH.
+
+        Returns:
+            bool: True if a window across the wall is fully open.
+        """
+        cx, cy = self.position(index)
+        span_x = 1 if direction == EAST else 0
+        span_y = 1 if direction == SOUTH else 0
+
+        for w, h in FORBIDDEN_ROOMS:
+            x_min = max(0, cx + span_x - w + 1)
+            x_max = min(cx, self.width - w)
+            y_min = max(0, cy + span_y - h + 1)
+            y_max = min(cy, self.height - h)
+
+            for y in range(y_min, y_max + 1):
+                for x in range(x_min, x_max + 1):
+                    if self.has_open_area_at(x, y, w, h):
+                        return True
+
+        return False
+
+    def to_numpy(self) -> Tuple[Any, Any]:
+        """Return walls and flags as ``uint8`` arrays of shape (h, w).
+
+        The arrays are zero-copy views: writing to them changes the
+        maze without updating ``version``, so increase it after such
+        writes. Requires NumPy.
+
+        Returns:
+            Tuple[ndarray, ndarray]: ``(walls, flags)``.
+        """
+        from .arrays import buffers_to_numpy
+
+        return buffers_to_numpy(self)
+
+    @classmethod
+    def from_numpy(
+        cls,
+        walls: Any,
+        fixed: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> "Maze":
+        """Build a maze from a 2D array of wall bitmasks.
+
+        Requires NumPy.
+
+        Args:
+            walls (ndarray): ``(height, width)`` array of values 0-15.
+            fixed (Optional[ndarray]): Boolean mask of fixed cells.
+            **kwargs: Extra ``Maze`` arguments.
+
+        Returns:
+            Maze: New maze holding a copy of the walls.
+        """
+        from .arrays import from_numpy
+
+        return from_numpy(walls, fixed, **kwargs)
+
+    def to_hex_bytes(self) -> bytes:
+        """Encode the wall grid as hexadecimal rows.
+
+        The whole wall buffer is translated in one pass with a
+        16-entry lookup table; rows are then joined with newlines.
+
+        Returns:
+            bytes: One line of hex digits per row, each ending
+            with a newline.
+        """
+        encoded = bytes(self._walls).translate(HEX_ENCODE)
+        width = self.width
+        rows = [
+            encoded[start:start + width]
+            for start in range(0, len(encoded), width)
+        ]
+        rows.append(b"")
+        return b"\n".join(rows)
+
+    def save_hex(
+        self,
+        file_path: str,
+        solution: Optional[str] = None,
+        atomic: bool = False,
+    ) -> None:
         """Save the maze to a file in hexadecimal format.
 
         The file contains the maze grid followed by entry
-        and exit coordinates.
+        and exit coordinates and, if given, the solution as a
+        direction string. Everything is written in a single
+        buffered write.
 
         Args:
             file_path (str): Output file path.
+            solution (Optional[str]): Direction string to append.
+            atomic (bool, optional): Replace the file atomically.
+                Defaults to False.
         """
-        with open(file_path, "w", encoding="utf-8") as file:
-            for y in range(self.height):
-                row = ""
-                for x in range(self.width):
-                    cell = self.get_cell(x, y)
-                    row += cell.to_hex()
-                file.write(row + "\n")
-
-            file.write(f"\n{self.entry[0]},{self.entry[1]}\n")
-            file.write(f"{self.exit[0]},{self.exit[1]}\n")
+        footer = (
+            f"\n{self.entry[0]},{self.entry[1]}\n"
+            f"{self.exit[0]},{self.exit[1]}\n"
+            f"{solution or ''}"
+        )
+        write_bytes(
+            file_path,
+            self.to_hex_bytes() + footer.encode("utf-8"),
+            atomic,
+        )
@@ -1,10 +1,51 @@
 """Maze generation algorithms and utilities."""
 
 import random
-from typing import Dict, List, Tuple
-
-from .cell import Cell
+from array import array
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from .bulk import generate_binary_tree, generate_sidewinder
+from .constants import EAST, NORTH, SOUTH, WEST
+from .disjoint_set import DisjointSet
+from .eller import iter_eller_rows
+from .growing_tree import DEFAULT_POLICY, NEWEST, RANDOM, grow_tree, \
+    iter_grow_tree, parse_policy
 from .maze import Maze
+from .steps import Step, replay_steps
+
+# Cells of the '42' logo, drawn in the centre of the maze
+LOGO_42 = (
+    (1, 0, 1, 0, 1, 1, 1),
+    (1, 0, 1, 0, 0, 0, 1),
+    (1, 1, 1, 0, 1, 1, 1),
+    (0, 0, 1, 0, 1, 0, 0),
+    (0, 0, 1, 0, 1, 1, 1),
+)
+
+
+def logo_42_cells(width: int, height: int) -> List[Tuple[int, int]]:
+    """Return the positions covered by the '42' logo.
+
+    Args:
+        width (int): Maze width.
+        height (int): Maze height.
+
+    Returns:
+        List[Tuple[int, int]]: Logo positions, empty if the maze is
+        smaller than 9x7.
+    """
+    if width < 9 or height < 7:
+        return []
+
+    start_x = (width - len(LOGO_42[0])) // 2
+    start_y = (height - len(LOGO_42)) // 2
+
+    return [
+        (start_x + x, start_y + y)
+        for y, row in enumerate(LOGO_42)
+        for x, val in enumerate(row)
+        if val == 1
+    ]
 
 
 class InvalidEntryOrExit(Exception):
@@ -19,29 +60,66 @@ class MazeGenerator:
     such as DFS (backtracking), Prim, and Kruskal. It also supports
     adding custom patterns (e.g., the '42' logo) and non-perfect mazes.
 
+    Every generator owns its random number generator, so several
+    generators can run concurrently (threads or processes) and each
+    one still produces seed-identical output.
+
     Attributes:
         _seed (int): Seed used for random generation.
+        _rng (random.Random): Generator-private source of randomness.
+        policy (str): Cell-selection policy of the "growing_tree"
+            algorithm.
     """
 
-    def __init__(self, seed: int) -> None:
+    def __init__(
+        self,
+        seed: int,
+        rng: Optional[random.Random] = None,
+        policy: str = DEFAULT_POLICY,
+    ) -> None:
         """Initialize the maze generator.
 
         Args:
             seed (int): Random seed. If 0, randomness is not fixed.
+            rng (Optional[random.Random]): Random source to use, e.g.
+                a ``random.Random`` subclass. It is reseeded with
+                ``seed`` before each generation. Defaults to a new
+                ``random.Random``.
+            policy (str, optional): Cell-selection policy of the
+                "growing_tree" algorithm ("newest", "random",
+                "oldest" or "mixed:<ratio>"). Defaults to
+                `DEFAULT_POLICY`.
+
+        Raises:
+            ValueError: If the policy is invalid.
         """
+        parse_policy(policy)
         self._seed = seed
+        self._rng = rng if rng is not None else random.Random()
+        self.policy = policy
+
+    @property
+    def rng(self) -> random.Random:
+        """Random source used by this generator.
+
+        Returns:
+            random.Random: The generator-private RNG.
+        """
+        return self._rng
 
     def generate_maze(self, maze: Maze, algorithm: str) -> None:
         """Generate a maze using the specified algorithm.
 
         Args:
             maze (Maze): Maze instance to modify.
-            algorithm (str): Algorithm name ("dfs", "prim", "kruskal").
+            algorithm (str): Algorithm name ("dfs", "prim", "kruskal",
+                "eller", "growing_tree", "binary_tree", "sidewinder").
 
         Raises:
             ValueError: If the algorithm is unknown.
         """
         algorithm = algorithm.lower()
+        maze.algorithm = algorithm
 
         if algorithm in ("dfs", "backtracking"):
             self._generate_dfs(maze)
@@ -49,12 +127,72 @@ class MazeGenerator:
             self._generate_prim(maze)
         elif algorithm == "kruskal":
             self._generate_kruskal(maze)
+        elif algorithm == "eller":
+            self._generate_eller(maze)
+        elif algorithm == "growing_tree":
+            self._generate_growing_tree(maze)
+        elif algorithm == "binary_tree":
+            self._generate_bulk(maze, generate_binary_tree)
+        elif algorithm == "sidewinder":
+            self._generate_bulk(maze, generate_sidewinder)
+        else:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+
+    def generate_steps(self, maze: Maze, algorithm: str) -> Iterator[Step]:
+        """Generate a maze step by step.
+
+        Every wall removal is applied to the maze, with ``version``
+        increased, before it is yielded, so a consumer can draw the
+        maze after each step. Once exhausted, the maze is the one
+        `generate_maze` builds with the same seed. Growing-tree
+        algorithms ("dfs", "prim", "growing_tree") carve lazily; the
+        others run on a scratch copy first and are replayed (see
+        `steps`). `generate_maze` does not pay for the events.
+
+        Args:
+            maze (Maze): Maze instance to modify.
+            algorithm (str): Algorithm name, as in `generate_maze`.
+
+        Yields:
+            Step: ``(cell_id, direction)`` of every removed wall.
+
+        Raises:
+            ValueError: If the algorithm is unknown.
+        """
+        algorithm = algorithm.lower()
+
+        if algorithm in ("dfs", "backtracking"):
+            tree: Optional[Tuple[str, Tuple[int, ...]]] = (
+                NEWEST, (EAST, WEST, SOUTH, NORTH))
+        elif algorithm == "prim":
+            tree = (RANDOM, (NORTH, SOUTH, EAST, WEST))
+        elif algorithm == "growing_tree":
+            tree = (self.policy, (EAST, WEST, SOUTH, NORTH))
+        elif algorithm in ("kruskal", "eller", "binary_tree", "sidewinder"):
+            tree = None
         else:
             raise ValueError(f"Unknown algorithm: {algorithm}")
 
+        maze.algorithm = algorithm
+        if tree is None:
+            yield from replay_steps(
+                maze, lambda scratch: self.generate_maze(scratch, algorithm))
+            return
+
+        self._init_random()
+        start = self._random_free_cell(maze)
+        policy, directions = tree
+        for step in iter_grow_tree(maze, self._rng, start, policy,
+                                   directions):
+            maze.version += 1
+            yield step
+
+        if not maze.perfect:
+            yield from replay_steps(maze, self._carve_rooms)
+
     def _init_random(self) -> None:
-        """Initialize the random seed."""
-        random.seed(None if self._seed == 0 else self._seed)
+        """Reseed the generator-private RNG."""
+        self._rng.seed(None if self._seed == 0 else self._seed)
 
     def _carve_rooms(self, maze: Maze, attempts: int = 20) -> None:
         """Carve random rooms into a non-perfect maze.
@@ -64,174 +202,171 @@ class MazeGenerator:
             attempts (int, optional): Number of attempts. Defaults to 20.
         """
         room_sizes = [(2, 2), (2, 3), (3, 2)]
+        rng = self._rng
+
+        # The local check below only sees windows across the opened
+        # wall, which is exact as long as the maze starts valid: a
+        # freshly generated perfect maze has no open area at all.
 
-        def try_remove(cell: Cell, neighbor: Cell) -> None:
-            if neighbor.is_fixed():
+        def try_remove(index: int, direction: int) -> None:
+            neighbor = index + (1 if direction == EAST else maze.width)
+            if (maze.is_fixed_idx(neighbor)
+                    or not maze.has_wall_idx(index, direction)):
                 return
 
-            maze.remove_wall_between(cell, neighbor)
+            maze.remove_wall_idx(index, direction)
 
-            if maze.has_invalid_room():
-                maze.add_wall_between(cell, neighbor)
+            if maze.has_invalid_room_near(index, direction):
+                maze.add_wall_idx(index, direction)
 
         def carve_one() -> None:
-            w, h = random.choice(room_sizes)
-            x = random.randint(0, maze.width - w)
-            y = random.randint(0, maze.height - h)
+            w, h = rng.choice(room_sizes)
+            x = rng.randint(0, maze.width - w)
+            y = rng.randint(0, maze.height - h)
 
             for dy in range(h):
                 for dx in range(w):
-                    cell = maze.get_cell(x + dx, y + dy)
+                    index = maze.cell_id(x + dx, y + dy)
 
-                    if cell.is_fixed():
+                    if maze.is_fixed_idx(index):
                         continue
 
                     if dx < w - 1:
-                        right = maze.get_cell(x + dx + 1, y + dy)
-                        try_remove(cell, right)
+                        try_remove(index, EAST)
 
                     if dy < h - 1:
-                        down = maze.get_cell(x + dx, y + dy + 1)
-                        try_remove(cell, down)
+                        try_remove(index, SOUTH)
 
         for _ in range(attempts):
             carve_one()
 
     def _generate_dfs(self, maze: Maze) -> None:
-        """Generate a maze using Depth-First Search (backtracking)."""
-        self._init_random()
+        """Generate a maze using Depth-First Search (backtracking).
 
-        start_x = random.randint(0, maze.width - 1)
-        start_y = random.randint(0, maze.height - 1)
+        A growing tree that always extends the newest cell.
+        """
+        self._init_random()
+        rng = self._rng
 
-        current_cell = maze.get_cell(start_x, start_y)
-        current_cell.visited = True
+        start = self._random_free_cell(maze)
+        grow_tree(maze, rng, start, NEWEST, (EAST, WEST, SOUTH, NORTH))
 
-        stack: List[Cell] = [current_cell]
-        directions: List[Tuple[int, int]] = [
-            (1, 0), (-1, 0), (0, 1), (0, -1)
-        ]
+        if not maze.perfect:
+            self._carve_rooms(maze)
 
-        while stack:
-            current_cell = stack[-1]
-            unvisited_neighbors: List[Cell] = []
+    def _generate_prim(self, maze: Maze) -> None:
+        """Generate a maze using Prim's algorithm.
 
-            for dx, dy in directions:
-                nx = current_cell.x + dx
-                ny = current_cell.y + dy
+        A growing tree that extends a random active cell.
+        """
+        self._init_random()
+        rng = self._rng
 
-                if 0 <= nx < maze.width and 0 <= ny < maze.height:
-                    neighbor = maze.get_cell(nx, ny)
-                    if not neighbor.visited:
-                        unvisited_neighbors.append(neighbor)
-
-            if unvisited_neighbors:
-                chosen = random.choice(unvisited_neighbors)
-                maze.remove_wall_between(current_cell, chosen)
-                chosen.visited = True
-                stack.append(chosen)
-            else:
-                stack.pop()
+        start = self._random_free_cell(maze)
+        grow_tree(maze, rng, start, RANDOM, (NORTH, SOUTH, EAST, WEST))
 
         if not maze.perfect:
             self._carve_rooms(maze)
 
-    def _generate_prim(self, maze: Maze) -> None:
-        """Generate a maze using Prim's algorithm."""
+    def _generate_growing_tree(self, maze: Maze) -> None:
+        """Generate a maze using the growing tree with `policy`."""
         self._init_random()
+        rng = self._rng
+
+        start = self._random_free_cell(maze)
+        grow_tree(maze, rng, start, self.policy)
 
-        directions = [(0, -1), (0, 1), (1, 0), (-1, 0)]
+        if not maze.perfect:
+            self._carve_rooms(maze)
 
+    def _random_free_cell(self, maze: Maze) -> int:
+        """Draw random cells until one is not fixed."""
+        rng = self._rng
         while True:
-            x = random.randint(0, maze.width - 1)
-            y = random.randint(0, maze.height - 1)
-            start = maze.get_cell(x, y)
-            if not start.is_fixed():
-                break
+            x = rng.randint(0, maze.width - 1)
+            y = rng.randint(0, maze.height - 1)
+            start = maze.cell_id(x, y)
+            if not maze.is_fixed_idx(start):
+                return start
+
+    def _generate_kruskal(self, maze: Maze) -> None:
+        """Generate a maze using Kruskal's algorithm.
+
+        Edges are packed as ``cell_id * 2 + k`` with k = 0 for the
+        east wall and k = 1 for the south wall of the cell.
+        """
+        self._init_random()
+        rng = self._rng
 
-        start.visited = True
-        frontier: List[Cell] = []
+        width = maze.width
+        height = maze.height
+        edges = array("q")
 
-        def add_frontier(cell: Cell) -> None:
-            for dx, dy in directions:
-                nx = cell.x + dx
-                ny = cell.y + dy
+        for y in range(height):
+            for x in range(width):
+                index = y * width + x
 
-                if 0 <= nx < maze.width and 0 <= ny < maze.height:
-                    neighbor = maze.get_cell(nx, ny)
-                    if not neighbor.visited and neighbor not in frontier:
-                        frontier.append(neighbor)
+                if maze.is_fixed_idx(index):
+                    continue
 
-        add_frontier(start)
+                if x < width - 1 and not maze.is_fixed_idx(index + 1):
+                    edges.append(index * 2)
 
-        while frontier:
-            current = frontier.pop(random.randrange(len(frontier)))
+                if y < height - 1 and not maze.is_fixed_idx(index + width):
+                    edges.append(index * 2 + 1)
 
-            visited_neighbors = []
-            for dx, dy in directions:
-                nx = current.x + dx
-                ny = current.y + dy
+        rng.shuffle(edges)
 
-                if 0 <= nx < maze.width and 0 <= ny < maze.height:
-                    neighbor = maze.get_cell(nx, ny)
-                    if neighbor.visited and not neighbor.is_fixed():
-                        visited_neighbors.append(neighbor)
+        sets = DisjointSet(width * height)
 
-            if visited_neighbors:
-                chosen = random.choice(visited_neighbors)
-                maze.remove_wall_between(current, chosen)
+        for edge in edges:
+            c1 = edge >> 1
+            if edge & 1:
+                c2 = c1 + width
+                direction = SOUTH
+            else:
+                c2 = c1 + 1
+                direction = EAST
 
-            current.visited = True
-            add_frontier(current)
+            if sets.union(c1, c2):
+                maze.remove_wall_idx(c1, direction)
+                maze.set_visited_idx(c1)
+                maze.set_visited_idx(c2)
 
         if not maze.perfect:
             self._carve_rooms(maze)
 
-    def _generate_kruskal(self, maze: Maze) -> None:
-        """Generate a maze using Kruskal's algorithm."""
+    def _generate_eller(self, maze: Maze) -> None:
+        """Generate a maze using Eller's algorithm, row by row."""
         self._init_random()
 
-        edges: List[Tuple[Cell, Cell]] = []
-
-        for y in range(maze.height):
-            for x in range(maze.width):
-                cell = maze.get_cell(x, y)
-
-                if cell.is_fixed():
-                    continue
-
-                if x < maze.width - 1:
-                    right = maze.get_cell(x + 1, y)
-                    if not right.is_fixed():
-                        edges.append((cell, right))
-
-                if y < maze.height - 1:
-                    down = maze.get_cell(x, y + 1)
-                    if not down.is_fixed():
-                        edges.append((cell, down))
-
-        random.shuffle(edges)
-
-        parent: Dict[Cell, Cell] = {
-            maze.get_cell(x, y): maze.get_cell(x, y)
-            for y in range(maze.height)
-            for x in range(maze.width)
-        }
+        width = maze.width
+        fixed = [
+            maze.position(index)
+            for index in range(width * maze.height)
+            if maze.is_fixed_idx(index)
+        ]
 
-        def find(cell: Cell) -> Cell:
-            if parent[cell] != cell:
-                parent[cell] = find(parent[cell])
-            return parent[cell]
+        walls = maze._walls
+        rows = iter_eller_rows(width, maze.height, self._rng, fixed)
+        for y, row in enumerate(rows):
+            base = y * width
+            for x, value in enumerate(row):
+                walls[base + x] = value
+                maze.set_visited_idx(base + x)
+        maze.version += 1
 
-        def union(c1: Cell, c2: Cell) -> None:
-            parent[find(c2)] = find(c1)
+        if not maze.perfect:
+            self._carve_rooms(maze)
 
-        for c1, c2 in edges:
-            if find(c1) != find(c2):
-                union(c1, c2)
-                maze.remove_wall_between(c1, c2)
-                c1.visited = True
-                c2.visited = True
+    def _generate_bulk(
+        self,
+        maze: Maze,
+        generate: Callable[[Maze, random.Random], None],
+    ) -> None:
+        """Generate a maze with one of the bulk algorithms of `bulk`."""
+        self._init_random()
+        generate(maze, self._rng)
 
         if not maze.perfect:
             self._carve_rooms(maze)
@@ -248,31 +383,15 @@ class MazeGenerator:
         Raises:
             InvalidEntryOrExit: If entry/exit overlaps the logo.
         """
-        if maze.width < 9 or maze.height < 7:
+        cells = logo_42_cells(maze.width, maze.height)
+        if not cells:
             print("Size not enough for the 42 logo")
             return False
 
-        pattern = [
-            [1, 0, 1, 0, 1, 1, 1],
-            [1, 0, 1, 0, 0, 0, 1],
-            [1, 1, 1, 0, 1, 1, 1],
-            [0, 0, 1, 0, 1, 0, 0],
-            [0, 0, 1, 0, 1, 1, 1],
-        ]
-
-        start_x = (maze.width - len(pattern[0])) // 2
-        start_y = (maze.height - len(pattern)) // 2
-
-        for y, row in enumerate(pattern):
-            for x, val in enumerate(row):
-                if val == 1:
-                    pos = (start_x + x, start_y + y)
-
-                    if pos == maze.entry or pos == maze.exit:
-                        raise InvalidEntryOrExit()
+        for pos in cells:
+            if pos == maze.entry or pos == maze.exit:
+                raise InvalidEntryOrExit()
 
-                    cell = maze.get_cell(*pos)
-                    cell.set_as_fixed()
-                    cell.visited = True
+            maze.set_fixed_idx(maze.cell_id(*pos))
 
         return True
@@ -1,82 +1,449 @@
 """Maze solving utilities."""
 
+import heapq
+from array import array
 from collections import deque
-from typing import Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Tuple
 
+from mazegen.constants import DIR_MASKS, EAST, FLAG_FIXED, NORTH, SOUTH, WEST
 from mazegen.maze import Maze
 
 Pos = Tuple[int, int]
 
+# Order in which neighbours are explored
+_DIRECTIONS = (NORTH, SOUTH, WEST, EAST)
+_MOVES = tuple((direction, DIR_MASKS[direction]) for direction in _DIRECTIONS)
 
-def shortest_path(maze: Maze) -> Optional[List[Pos]]:
-    """Compute the shortest path in a maze using BFS.
 
-    This function finds the shortest path from the maze entry
-    to the exit using Breadth-First Search (BFS).
+def shortest_path(maze: Maze, method: str = "bfs") -> Optional[List[Pos]]:
+    """Compute the shortest path in a maze.
+
+    Available methods:
+        - "bfs": Breadth-First Search from the entry.
+        - "bidirectional": BFS from both ends, meeting in the middle.
+        - "astar": A* search with the Manhattan distance heuristic.
+
+    All methods return a path of the same length; the searches from
+    both ends or towards the exit usually explore far fewer cells.
 
     Args:
         maze (Maze): Maze instance to solve.
+        method (str, optional): Search method. Defaults to "bfs".
 
     Returns:
         Optional[List[Pos]]: List of positions representing the path
         from entry to exit, or None if no path exists.
+
+    Raises:
+        ValueError: If the method is unknown.
     """
-    start = maze.entry
-    goal = maze.exit
+    try:
+        search = SOLVERS[method]
+    except KeyError:
+        raise ValueError(f"Unknown solver method: {method}")
 
-    if (
-        maze.get_cell(*start).is_fixed()
-        or maze.get_cell(*goal).is_fixed()
-    ):
+    start = maze.cell_id(*maze.entry)
+    goal = maze.cell_id(*maze.exit)
+
+    if maze.is_fixed_idx(start) or maze.is_fixed_idx(goal):
         return None
 
+    return search(maze, start, goal)
+
+
+def _build_path(maze: Maze, parents: array, index: int) -> List[Pos]:
+    """Follow parent links back to the root, return root-first path."""
+    path: List[Pos] = []
+    while index >= 0:
+        path.append(maze.position(index))
+        index = parents[index]
+    path.reverse()
+    return path
+
+
+def _bfs(maze: Maze, start: int, goal: int) -> Optional[List[Pos]]:
+    """Breadth-First Search from start to goal."""
+    walls = maze._walls
+    flags = maze._flags
+    neighbor_idx = maze.neighbor_idx
+
+    parents = array("i", [-1]) * (maze.width * maze.height)
+    visited = bytearray(len(parents))
+    visited[start] = 1
     queue = deque([start])
-    prev: Dict[Pos, Optional[Pos]] = {start: None}
 
     while queue:
-        x, y = queue.popleft()
+        current = queue.popleft()
 
-        if (x, y) == goal:
-            break
+        if current == goal:
+            return _build_path(maze, parents, goal)
 
-        cell = maze.get_cell(x, y)
-        candidates = [
-            ("N", (x, y - 1)),
-            ("S", (x, y + 1)),
-            ("W", (x - 1, y)),
-            ("E", (x + 1, y)),
-        ]
-
-        for direction, (nx, ny) in candidates:
-            if not (0 <= nx < maze.width and 0 <= ny < maze.height):
+        cell = walls[current]
+        for direction, mask in _MOVES:
+            if cell & mask:
                 continue
 
-            if cell.has_wall(direction):
+            neighbor = neighbor_idx(current, direction)
+            if neighbor < 0 or visited[neighbor]:
+                continue
+            if flags[neighbor] & FLAG_FIXED:
                 continue
 
-            neighbor = maze.get_cell(nx, ny)
-            if neighbor.is_fixed():
+            visited[neighbor] = 1
+            parents[neighbor] = current
+            queue.append(neighbor)
+
+    return None
+
+
+def _bidirectional(maze: Maze, start: int, goal: int) -> Optional[List[Pos]]:
+    """BFS from both ends, always growing the smaller frontier.
+
+    Each cell belongs to the side that reached it first (``side`` is
+    1 for the entry, 2 for the exit), so one parent and one depth
+    array serve both searches. When a whole level has been expanded
+    and touched the other side, the shortest crossing edge is used.
+    """
+    if start == goal:
+        return [maze.position(start)]
+
+    walls = maze._walls
+    flags = maze._flags
+    neighbor_idx = maze.neighbor_idx
+
+    size = maze.width * maze.height
+    parents = array("i", [-1]) * size
+    depth = array("i", bytes(4 * size))
+    side = bytearray(size)
+    side[start] = 1
+    side[goal] = 2
+    frontiers = {1: [start], 2: [goal]}
+
+    while frontiers[1] and frontiers[2]:
+        own = 1 if len(frontiers[1]) <= len(frontiers[2]) else 2
+        other = 3 - own
+        best = -1
+        meet = (-1, -1)
+        next_level: List[int] = []
+
+        for current in frontiers[own]:
+            cell = walls[current]
+            for direction, mask in _MOVES:
+                if cell & mask:
+                    continue
+
+                neighbor = neighbor_idx(current, direction)
+                if neighbor < 0 or flags[neighbor] & FLAG_FIXED:
+                    continue
+
+                mark = side[neighbor]
+                if mark == other:
+                    length = depth[current] + depth[neighbor]
+                    if best < 0 or length < best:
+                        best = length
+                        meet = (current, neighbor)
+                elif not mark:
+                    side[neighbor] = own
+                    depth[neighbor] = depth[current] + 1
+                    parents[neighbor] = current
+                    next_level.append(neighbor)
+
+        if best >= 0:
+            near, far = meet if own == 1 else meet[::-1]
+            path = _build_path(maze, parents, near)
+            path.extend(_build_path(maze, parents, far)[::-1])
+            return path
+
+        frontiers[own] = next_level
+
+    return None
+
+
+def _astar(maze: Maze, start: int, goal: int) -> Optional[List[Pos]]:
+    """A* search guided by the Manhattan distance to the goal.
+
+    The heuristic is consistent on a grid, so a cell never needs to
+    be expanded twice and is closed the first time it is popped.
+    """
+    walls = maze._walls
+    flags = maze._flags
+    neighbor_idx = maze.neighbor_idx
+    width = maze.width
+    goal_x, goal_y = maze.position(goal)
+
+    size = maze.width * maze.height
+    parents = array("i", [-1]) * size
+    cost = array("i", [size]) * size
+    closed = bytearray(size)
+    cost[start] = 0
+    heap = [(0, start)]
+
+    while heap:
+        _, current = heapq.heappop(heap)
+        if closed[current]:
+            continue
+        if current == goal:
+            return _build_path(maze, parents, goal)
+        closed[current] = 1
+
+        cell = walls[current]
+        step = cost[current] + 1
+        for direction, mask in _MOVES:
+            if cell & mask:
                 continue
 
-            pos = (nx, ny)
-            if pos in prev:
+            neighbor = neighbor_idx(current, direction)
+            if neighbor < 0 or closed[neighbor]:
+                continue
+            if flags[neighbor] & FLAG_FIXED or step >= cost[neighbor]:
                 continue
 
-            prev[pos] = (x, y)
-            queue.append(pos)
+            cost[neighbor] = step
+            parents[neighbor] = current
+            y, x = divmod(neighbor, width)
+            heapq.heappush(
+                heap, (step + abs(x - goal_x) + abs(y - goal_y), neighbor)
+            )
 
-    if goal not in prev:
-        return None
+    return None
 
-    path: List[Pos] = []
-    current: Optional[Pos] = goal
 
-    while current is not None:
-        path.append(current)
-        current = prev[current]
+SOLVERS: Dict[str, Callable[[Maze, int, int], Optional[List[Pos]]]] = {
+    "bfs": _bfs,
+    "bidirectional": _bidirectional,
+    "astar": _astar,
+}
 
-    path.reverse()
-    return path
+# Last solved path of each live maze, keyed by its state
+_PathKey = Tuple[int, Pos, Pos, str]
+_path_cache: "WeakKeyDictionary[Maze, Tuple[_PathKey, Optional[List[Pos]]]]"
+_path_cache = WeakKeyDictionary()
+
+
+def cached_shortest_path(
+    maze: Maze,
+    method: str = "bfs",
+) -> Optional[List[Pos]]:
+    """Compute the shortest path, reusing the result of an unchanged maze.
+
+    The result is stored per maze together with its ``version``,
+    entry, exit and the method, so any wall change invalidates it
+    and a stale path is never returned. Mazes are held weakly.
+
+    Args:
+        maze (Maze): Maze instance to solve.
+        method (str, optional): Search method. Defaults to "bfs".
+
+    Returns:
+        Optional[List[Pos]]: A new list with the path, or None if no
+        path exists.
+
+    Raises:
+        ValueError: If the method is unknown.
+    """
+    key = (maze.version, maze.entry, maze.exit, method)
+    cached = _path_cache.get(maze)
+    if cached is None or cached[0] != key:
+        cached = (key, shortest_path(maze, method))
+        _path_cache[maze] = cached
+
+    path = cached[1]
+    return None if path is None else list(path)
+
+
+class DistanceField:
+    """Shortest distances from one or more sources to every cell.
+
+    One BFS fills a flat ``array('i')`` of distances and one of
+    parent indices, after which any number of targets can be
+    queried in time proportional to the length of their path. With
+    several sources, every cell gets the distance to its nearest
+    source and paths start from that source.
+
+    Fixed cells and cells without a path to any source have a
+    distance of -1.
+
+    Attributes:
+        maze (Maze): Maze the field was computed on.
+        sources (Tuple[Pos, ...]): Source positions.
+    """
+
+    def __init__(
+        self,
+        maze: Maze,
+        source: Optional[Pos] = None,
+        sources: Optional[Iterable[Pos]] = None,
+    ) -> None:
+        """Run the BFS from the given sources.
+
+        Args:
+            maze (Maze): Maze to explore.
+            source (Optional[Pos]): Single source position.
+                Defaults to the maze entry if no sources are given.
+            sources (Optional[Iterable[Pos]]): Several source
+                positions for a multi-source BFS.
+
+        Raises:
+            ValueError: If both ``source`` and ``sources`` are given
+                or a source is outside the maze.
+        """
+        if source is not None and sources is not None:
+            raise ValueError("Give either source or sources, not both")
+        if sources is None:
+            sources = (maze.entry if source is None else source,)
+
+        self.maze = maze
+        self.sources = tuple(sources)
+        for x, y in self.sources:
+            if not (0 <= x < maze.width and 0 <= y < maze.height):
+                raise ValueError(f"Source out of bounds: ({x}, {y})")
+
+        size = maze.width * maze.height
+        self._distances = array("i", [-1]) * size
+        self._parents = array("i", [-1]) * size
+        self._fill()
+
+    def _fill(self) -> None:
+        """Breadth-first fill of the distance and parent arrays."""
+        maze = self.maze
+        walls = maze._walls
+        flags = maze._flags
+        neighbor_idx = maze.neighbor_idx
+        distances = self._distances
+        parents = self._parents
+
+        queue: Deque[int] = deque()
+        for x, y in self.sources:
+            index = maze.cell_id(x, y)
+            if distances[index] < 0 and not flags[index] & FLAG_FIXED:
+                distances[index] = 0
+                queue.append(index)
+
+        while queue:
+            current = queue.popleft()
+            cell = walls[current]
+            step = distances[current] + 1
+
+            for direction, mask in _MOVES:
+                if cell & mask:
+                    continue
+
+                neighbor = neighbor_idx(current, direction)
+                if neighbor < 0 or distances[neighbor] >= 0:
+                    continue
+                if flags[neighbor] & FLAG_FIXED:
+                    continue
+
+                distances[neighbor] = step
+                parents[neighbor] = current
+                queue.append(neighbor)
+
+    def _index(self, pos: Pos) -> int:
+        """Return the cell index of a position, checking bounds."""
+        x, y = pos
+        if not (0 <= x < self.maze.width and 0 <= y < self.maze.height):
+            raise IndexError(f"Cell coordinates out of bounds: {pos}")
+        return self.maze.cell_id(x, y)
+
+    def distance_to(self, pos: Pos) -> int:
+        """Return the number of steps from the nearest source.
+
+        Args:
+            pos (Pos): Target position.
+
+        Returns:
+            int: Distance, or -1 if the target is unreachable.
+
+        Raises:
+            IndexError: If the position is outside the maze.
+        """
+        return self._distances[self._index(pos)]
+
+    def path_to(self, pos: Pos) -> Optional[List[Pos]]:
+        """Return a shortest path from the nearest source to a target.
+
+        Args:
+            pos (Pos): Target position.
+
+        Returns:
+            Optional[List[Pos]]: Positions from the source to the
+            target, or None if the target is unreachable.
+
+        Raises:
+            IndexError: If the position is outside the maze.
+        """
+        index = self._index(pos)
+        if self._distances[index] < 0:
+            return None
+        return _build_path(self.maze, self._parents, index)
+
+    def source_of(self, pos: Pos) -> Optional[Pos]:
+        """Return the source nearest to a target.
+
+        Args:
+            pos (Pos): Target position.
+
+        Returns:
+            Optional[Pos]: Source position, or None if unreachable.
+
+        Raises:
+            IndexError: If the position is outside the maze.
+        """
+        index = self._index(pos)
+        if self._distances[index] < 0:
+            return None
+        parents = self._parents
+        while parents[index] >= 0:
+            index = parents[index]
+        return self.maze.position(index)
+
+    def distances_to(self, positions: Iterable[Pos]) -> List[int]:
+        """Return the distances of many targets.
+
+        Args:
+            positions (Iterable[Pos]): Target positions.
+
+        Returns:
+            List[int]: Distance of each target, -1 if unreachable.
+        """
+        return [self.distance_to(pos) for pos in positions]
+
+    def paths_to(
+        self,
+        positions: Iterable[Pos],
+    ) -> List[Optional[List[Pos]]]:
+        """Return shortest paths to many targets.
+
+        Args:
+            positions (Iterable[Pos]): Target positions.
+
+        Returns:
+            List[Optional[List[Pos]]]: Path to each target, None
+            if unreachable.
+        """
+        return [self.path_to(pos) for pos in positions]
+
+    def farthest(self) -> Tuple[Optional[Pos], int]:
+        """Return the reachable cell farthest from the sources.
+
+        Returns:
+            Tuple[Optional[Pos], int]: Position and distance, or
+            ``(None, -1)`` if no source is a free cell.
+        """
+        distances = self._distances
+        best = max(distances, default=-1)
+        if best < 0:
+            return None, -1
+        return self.maze.position(distances.index(best)), best
+
+    def reachable_count(self) -> int:
+        """Return the number of cells reachable from the sources.
+
+        Returns:
+            int: Count of cells with a distance.
+        """
+        return len(self._distances) - self._distances.count(-1)
 
 
 def path_to_directions(path: List[Pos]) -> str:
@@ -118,16 +485,20 @@ def save_solution(
     maze: Maze,
     path: Optional[List[Pos]],
     file_path: str,
+    atomic: bool = False,
 ) -> bool:
     """Save the maze solution to a file.
 
-    The maze is first saved in hexadecimal format, followed by
-    the shortest path encoded as a direction string.
+    The maze is saved in hexadecimal format, followed by
+    the shortest path encoded as a direction string, in a
+    single write.
 
     Args:
         maze (Maze): Maze instance.
         path (Optional[List[Pos]]): Path to save.
         file_path (str): Output file path.
+        atomic (bool, optional): Replace the file atomically.
+            Defaults to False.
 
     Returns:
         bool: True if the solution was saved, False otherwise.
@@ -135,11 +506,6 @@ def save_solution(
     if not path:
         return False
 
-    maze.save_hex(file_path)
-
-    directions = path_to_directions(path)
-
-    with open(file_path, "a", encoding="utf-8") as file:
-        file.write(directions)
+    maze.save_hex(file_path, path_to_directions(path), atomic)
 
     return True
@@ -0,0 +1,116 @@
+"""Step-wise replay of maze generation.
+
+`MazeGenerator.generate_steps` carves growing-tree mazes live (see
+`growing_tree.iter_grow_tree`). The other algorithms write whole rows
+or arrays at once, so they run on a scratch copy of the maze and
+their wall removals are replayed on the real maze one step at a time:
+
+* removals made through ``remove_wall_idx`` (Kruskal, room carving)
+  are replayed in the order they happened; a wall put back with
+  ``add_wall_idx`` cancels its removal;
+* removals written directly to the wall buffer (Eller, binary tree,
+  sidewinder) come first, in row-major order, which is the order
+  these row-by-row algorithms carve in.
+"""
+
+from typing import Callable, Iterator, List, Tuple
+
+from .constants import DIR_MASKS, EAST, OPPOSITE, SOUTH
+from .maze import Maze
+
+Step = Tuple[int, int]
+
+_E = DIR_MASKS[EAST]
+_S = DIR_MASKS[SOUTH]
+
+
+class _RecordingMaze(Maze):
+    """Scratch maze logging the walls removed through its methods."""
+
+    def __init__(self, maze: Maze) -> None:
+        super().__init__(maze.width, maze.height, perfect=maze.perfect,
+                         seed=maze.seed, entry=maze.entry, exit=maze.exit,
+                         compact=True)
+        self._walls = bytearray(maze._walls)
+        self._flags = bytearray(maze._flags)
+        self.removed: List[Step] = []
+
+    def remove_wall_idx(self, index: int, direction: int) -> None:
+        # Removing an open wall is not a step
+        if self.has_wall_idx(index, direction):
+            self.removed.append((index, direction))
+        super().remove_wall_idx(index, direction)
+
+    def add_wall_idx(self, index: int, direction: int) -> None:
+        super().add_wall_idx(index, direction)
+        step = (index, direction)
+        # Room carving puts a wall back right after removing it
+        for position in range(len(self.removed) - 1, -1, -1):
+            if self.removed[position] == step:
+                del self.removed[position]
+                break
+
+
+def _direct_steps(before: bytes, scratch: _RecordingMaze) -> List[Step]:
+    """Return the removals that did not go through `remove_wall_idx`,
+    as east and south walls in row-major order."""
+    logged = set()
+    for index, direction in scratch.removed:
+        neighbor = index + scratch._offsets[direction]
+        if direction in (EAST, SOUTH):
+            logged.add((index, direction))
+        else:
+            logged.add((neighbor, OPPOSITE[direction]))
+
+    width = scratch.width
+    last_row = width * (scratch.height - 1)
+    after = scratch._walls
+    steps: List[Step] = []
+    for index, (old, new) in enumerate(zip(before, after)):
+        opened = old & ~new
+        if not opened:
+            continue
+        if (opened & _E and index % width != width - 1
+                and (index, EAST) not in logged):
+            steps.append((index, EAST))
+        if (opened & _S and index < last_row
+                and (index, SOUTH) not in logged):
+            steps.append((index, SOUTH))
+    return steps
+
+
+def replay_steps(
+    maze: Maze,
+    generate: Callable[[Maze], None],
+) -> Iterator[Step]:
+    """Run a one-shot generation on a scratch copy and replay it.
+
+    Each wall removal is applied to ``maze`` (updating ``version``
+    and the visited flags of both cells) before it is yielded. When
+    the iterator is exhausted, the flags of ``maze`` match the
+    scratch copy exactly.
+
+    Args:
+        maze (Maze): Maze to carve.
+        generate (Callable[[Maze], None]): One-shot generation to run
+            on the scratch copy.
+
+    Yields:
+        Step: ``(cell_id, direction)`` of every removed wall.
+    """
+    scratch = _RecordingMaze(maze)
+    before = bytes(scratch._walls)
+    generate(scratch)
+
+    offsets = maze._offsets
+    for steps in (_direct_steps(before, scratch), scratch.removed):
+        for index, direction in steps:
+            maze.remove_wall_idx(index, direction)
+            maze.set_visited_idx(index)
+            maze.set_visited_idx(index + offsets[direction])
+            yield index, direction
+
+    flags = maze._flags
+    for index, flag in enumerate(scratch._flags):
+        if flags[index] != flag:
+            flags[index] = flag
@@ -0,0 +1,431 @@
+"""Tiled multi-core maze generation.
+
+The maze is split into rectangular tiles that are generated
+independently on a process pool, each with a seed derived from the
+master seed, so the result does not depend on the number of workers.
+Workers write their tile straight into shared memory. The tiles are
+then joined by opening a random spanning set of seam walls (Kruskal
+over the tile regions), so a perfect maze stays perfect.
+
+Seams are crossed by few passages, which gives the maze a visible
+block structure; it is meant for very large mazes generated in
+bounded wall-clock time.
+"""
+
+import hashlib
+from bisect import bisect_right
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, cast
+
+from .cell import ByteBuffer
+from .constants import DIR_MASKS, EAST, FLAG_FIXED, SOUTH
+from .disjoint_set import DisjointSet
+from .growing_tree import DEFAULT_POLICY, grow_tree, parse_policy
+from .maze import Maze
+from .maze_generator import MazeGenerator
+
+# Default tile side; fixed so that the output does not depend on the
+# number of workers
+DEFAULT_TILE_SIZE = 256
+# Tiles sent to a worker at once, relative to the tiles per worker
+TILES_PER_CHUNK = 4
+
+_E = DIR_MASKS[EAST]
+_S = DIR_MASKS[SOUTH]
+
+
+class Tile(NamedTuple):
+    """Rectangle of the maze generated by one task.
+
+    Attributes:
+        number (int): Tile number, row-major.
+        x (int): Left column.
+        y (int): Top row.
+        width (int): Tile width.
+        height (int): Tile height.
+    """
+
+    number: int
+    x: int
+    y: int
+    width: int
+    height: int
+
+
+class _TileJob(NamedTuple):
+    """Everything a worker needs to generate one tile."""
+
+    tile: Tile
+    shm_name: str
+    maze_width: int
+    maze_height: int
+    algorithm: str
+    perfect: bool
+    seed: int
+    policy: str
+
+
+class _TileResult(NamedTuple):
+    """Regions of a tile, as seen from its border.
+
+    ``labels`` maps border cell ids (maze-wide) to a region number,
+    or is None when the whole tile is one region.
+    """
+
+    number: int
+    regions: int
+    labels: Optional[Dict[int, int]]
+
+
+def derive_seed(seed: int, index: int) -> int:
+    """Derive the seed of a tile from the master seed.
+
+    Args:
+        seed (int): Master seed.
+        index (int): Tile number.
+
+    Returns:
+        int: A non-zero seed, independent for every tile.
+    """
+    digest = hashlib.blake2b(f"{seed}:{index}".encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), "little") or 1
+
+
+def _bounds(length: int, tile: int) -> List[int]:
+    """Split ``length`` into about ``length / tile`` even parts."""
+    parts = max(1, round(length / tile))
+    return [length * part // parts for part in range(parts + 1)]
+
+
+def split_tiles(
+    width: int,
+    height: int,
+    tile_width: int,
+    tile_height: int,
+) -> List[Tile]:
+    """Split a maze into tiles of about the given size, row-major.
+
+    The maze is cut into even columns and rows, so no tile is much
+    smaller than the others.
+
+    Args:
+        width (int): Maze width.
+        height (int): Maze height.
+        tile_width (int): Approximate tile width.
+        tile_height (int): Approximate tile height.
+
+    Returns:
+        List[Tile]: Tiles covering the maze.
+
+    Raises:
+        ValueError: If a tile size is not positive.
+    """
+    if tile_width <= 0 or tile_height <= 0:
+        raise ValueError("Tile size must be positive")
+
+    columns = _bounds(width, tile_width)
+    rows = _bounds(height, tile_height)
+    tiles: List[Tile] = []
+    for top, bottom in zip(rows, rows[1:]):
+        for left, right in zip(columns, columns[1:]):
+            tiles.append(Tile(len(tiles), left, top,
+                              right - left, bottom - top))
+    return tiles
+
+
+def _tile_rows(tile: Tile, maze_width: int) -> Iterator[Tuple[int, int]]:
+    """Yield the maze-wide start index and tile start index of each row."""
+    for row in range(tile.height):
+        yield (tile.y + row) * maze_width + tile.x, row * tile.width
+
+
+def _label_regions(maze: Maze) -> Tuple[int, array]:
+    """Label the connected regions of free cells of a tile.
+
+    Returns:
+        Tuple[int, array]: Number of regions, and region of every
+        cell (-1 for fixed cells).
+    """
+    width = maze.width
+    size = width * maze.height
+    walls = maze._walls
+    flags = maze._flags
+    labels = array("i", [-1]) * size
+    stack = array("i")
+    regions = 0
+
+    for start in range(size):
+        if labels[start] >= 0 or flags[start] & FLAG_FIXED:
+            continue
+        labels[start] = regions
+        stack.append(start)
+        while stack:
+            index = stack.pop()
+            x = index % width
+            cell = walls[index]
+            for neighbor, is_open in (
+                (index + 1, x < width - 1 and not cell & _E),
+                (index - 1, x > 0 and not walls[index - 1] & _E),
+                (index + width, index + width < size and not cell & _S),
+                (index - width, index >= width
+                 and not walls[index - width] & _S),
+            ):
+                if is_open and labels[neighbor] < 0:
+                    labels[neighbor] = regions
+                    stack.append(neighbor)
+        regions += 1
+
+    return regions, labels
+
+
+def _join_regions(maze: Maze, rng: random.Random) -> Tuple[int, array]:
+    """Join the regions of a tile that are separated by walls only.
+
+    Regions left apart by the generator (around fixed cells) are
+    joined by opening random walls between them, as Kruskal would.
+    Regions separated by fixed cells stay apart; they may still be
+    joined through other tiles.
+
+    Returns:
+        Tuple[int, array]: Number of remaining regions, and region
+        of every cell (-1 for fixed cells).
+    """
+    width = maze.width
+    size = width * maze.height
+    regions, labels = _label_regions(maze)
+    if regions < 2:
+        return regions, labels
+
+    edges = array("q")
+    for index in range(size):
+        label = labels[index]
+        if label < 0:
+            continue
+        if (index + 1) % width and labels[index + 1] not in (-1, label):
+            edges.append(index * 2)
+        if index + width < size and labels[index + width] not in (-1, label):
+            edges.append(index * 2 + 1)
+
+    rng.shuffle(edges)
+    sets = DisjointSet(regions)
+    for edge in edges:
+        index = edge >> 1
+        if edge & 1:
+            other, direction = index + width, SOUTH
+        else:
+            other, direction = index + 1, EAST
+        if sets.union(labels[index], labels[other]):
+            maze.remove_wall_idx(index, direction)
+
+    roots: Dict[int, int] = {}
+    for index in range(size):
+        if labels[index] >= 0:
+            root = sets.find(labels[index])
+            labels[index] = roots.setdefault(root, len(roots))
+    return len(roots), labels
+
+
+def _copy_into(target: ByteBuffer, data: memoryview) -> None:
+    """Overwrite a whole cell buffer with bytes from shared memory."""
+    if isinstance(target, bytearray):
+        target[:] = data
+    else:
+        for index, value in enumerate(data):
+            target[index] = value
+
+
+def _generate_tile(job: _TileJob) -> _TileResult:
+    """Generate one tile into shared memory (runs in a worker)."""
+    tile = job.tile
+    width = tile.width
+    size = job.maze_width * job.maze_height
+    shm = SharedMemory(name=job.shm_name)
+    try:
+        buffer = cast(memoryview, shm.buf)
+        flags = bytearray(width * tile.height)
+        for shared, local in _tile_rows(tile, job.maze_width):
+            flags[local:local + width] = \
+                buffer[size + shared:size + shared + width]
+
+        maze = Maze(width, tile.height, perfect=job.perfect, compact=True)
+        maze._flags = flags
+        fixed = any(flag & FLAG_FIXED for flag in flags)
+        regions = 0
+        labels = array("i")
+        if not all(flag & FLAG_FIXED for flag in flags):
+            generator = MazeGenerator(job.seed, policy=job.policy)
+            generator.generate_maze(maze, job.algorithm)
+
+            # Regions cut off by fixed cells get their own tree; the
+            # search resumes in place, without copying the flags
+            pending = flags.find(0)
+            while pending >= 0:
+                grow_tree(maze, generator.rng, pending)
+                pending = flags.find(0, pending)
+
+            if fixed:
+                regions, labels = _join_regions(maze, generator.rng)
+
+        walls = bytes(maze._walls)
+        flags = bytearray(maze._flags)
+        for shared, local in _tile_rows(tile, job.maze_width):
+            buffer[shared:shared + width] = walls[local:local + width]
+            buffer[size + shared:size + shared + width] = \
+                flags[local:local + width]
+    finally:
+        shm.close()
+
+    if not fixed:
+        return _TileResult(tile.number, 1, None)
+    if regions == 0:
+        return _TileResult(tile.number, 0, {})
+
+    border: Dict[int, int] = {}
+    for shared, local in _tile_rows(tile, job.maze_width):
+        row = local // width
+        columns = (range(width) if row in (0, tile.height - 1)
+                   else (0, width - 1))
+        for x in columns:
+            if labels[local + x] >= 0:
+                border[shared + x] = labels[local + x]
+    return _TileResult(tile.number, regions, border)
+
+
+def _seam_edges(maze: Maze, tiles: List[Tile]) -> array:
+    """List the walls on tile seams between free cells.
+
+    Edges are packed as ``cell_id * 2 + k`` with k = 0 for the east
+    wall and k = 1 for the south wall of the cell.
+    """
+    width = maze.width
+    flags = maze._flags
+    edges = array("q")
+
+    for tile in tiles:
+        right = tile.x + tile.width
+        bottom = tile.y + tile.height
+        if right < width:
+            for y in range(tile.y, bottom):
+                cell = y * width + right - 1
+                if not (flags[cell] | flags[cell + 1]) & FLAG_FIXED:
+                    edges.append(cell * 2)
+        if bottom < maze.height:
+            for x in range(tile.x, right):
+                cell = (bottom - 1) * width + x
+                if not (flags[cell] | flags[cell + width]) & FLAG_FIXED:
+                    edges.append(cell * 2 + 1)
+
+    return edges
+
+
+def _stitch(
+    maze: Maze,
+    tiles: List[Tile],
+    results: List[_TileResult],
+    rng: random.Random,
+) -> None:
+    """Open a random spanning set of seam walls between tile regions."""
+    width = maze.width
+    columns = sorted({tile.x for tile in tiles})
+    rows = sorted({tile.y for tile in tiles})
+
+    first = array("q", [0]) * len(results)
+    total = 0
+    for result in results:
+        first[result.number] = total
+        total += result.regions
+
+    def region(cell: int) -> int:
+        y, x = divmod(cell, width)
+        index = ((bisect_right(rows, y) - 1) * len(columns)
+                 + bisect_right(columns, x) - 1)
+        labels = results[index].labels
+        return first[index] + (labels[cell] if labels is not None else 0)
+
+    edges = _seam_edges(maze, tiles)
+    rng.shuffle(edges)
+    sets = DisjointSet(total)
+
+    for edge in edges:
+        cell = edge >> 1
+        if edge & 1:
+            other, direction = cell + width, SOUTH
+        else:
+            other, direction = cell + 1, EAST
+        if sets.union(region(cell), region(other)):
+            maze.remove_wall_idx(cell, direction)
+
+
+def generate_tiled(
+    maze: Maze,
+    algorithm: str = "dfs",
+    seed: int = 0,
+    workers: Optional[int] = None,
+    tile_size: int = DEFAULT_TILE_SIZE,
+    policy: str = DEFAULT_POLICY,
+) -> None:
+    """Generate a maze in tiles on several processes.
+
+    Fixed cells (e.g. the '42' logo) must be set before calling. The
+    output depends on the seed and tile size only, not on the number
+    of workers. Mazes smaller than a tile are generated in one piece.
+
+    Args:
+        maze (Maze): Maze with all walls closed to generate into.
+        algorithm (str, optional): Algorithm used inside every tile.
+            Defaults to "dfs".
+        seed (int, optional): Master seed, 0 for unseeded.
+            Defaults to 0.
+        workers (Optional[int]): Worker processes, CPU count if None.
+        tile_size (int, optional): Approximate side of the square
+            tiles. Defaults to `DEFAULT_TILE_SIZE`.
+        policy (str, optional): Cell-selection policy of the
+            "growing_tree" algorithm. Defaults to `DEFAULT_POLICY`.
+
+    Raises:
+        ValueError: If the algorithm is unknown, the tile size is
+            not positive or the policy is invalid.
+    """
+    parse_policy(policy)
+    workers = workers or os.cpu_count() or 1
+    if seed == 0:
+        seed = random.SystemRandom().getrandbits(63)
+
+    tiles = split_tiles(maze.width, maze.height, tile_size, tile_size)
+    size = maze.width * maze.height
+    maze.algorithm = algorithm.lower()
+
+    shm = SharedMemory(create=True, size=2 * size)
+    try:
+        buffer = cast(memoryview, shm.buf)
+        buffer[:size] = bytes(maze._walls)
+        buffer[size:] = bytes(maze._flags)
+        jobs = [
+            _TileJob(tile, shm.name, maze.width, maze.height,
+                     algorithm, maze.perfect,
+                     derive_seed(seed, tile.number), policy)
+            for tile in tiles
+        ]
+
+        if workers == 1 or len(jobs) < 2:
+            results = list(map(_generate_tile, jobs))
+        else:
+            chunksize = max(1, len(jobs) // (workers * TILES_PER_CHUNK))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(_generate_tile, jobs, chunksize=chunksize)
+                )
+
+        _copy_into(maze._walls, buffer[:size])
+        _copy_into(maze._flags, buffer[size:])
+        del buffer
+    finally:
+        shm.close()
+        shm.unlink()
+
+    maze.version += 1
+    _stitch(maze, tiles, results, random.Random(derive_seed(seed, -1)))
@@ -0,0 +1,406 @@
+"""Validation of generated mazes, from Python or the command line.
+
+Usage:
+    python -m mazegen.validate PATH [PATH ...] [--imperfect] [--workers N]
+
+PATH may be a hex (``.txt``) or binary (``.bin``) maze file, or a
+directory searched recursively for such files. Requires NumPy.
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Iterator, List, NamedTuple, Optional, Tuple
+
+from .arrays import require_numpy
+from .binary import MAGIC, load_binary
+from .constants import (
+    ALL_WALLS,
+    DIR_MASKS,
+    DIRECTIONS,
+    DIR_DX,
+    DIR_DY,
+    EAST,
+    FLAG_FIXED,
+    FORBIDDEN_ROOMS,
+    NORTH,
+    SOUTH,
+    WEST,
+)
+from .mapped import MappedMaze
+from .maze import Maze
+from .maze_generator import logo_42_cells
+
+MAZE_EXTENSIONS = (".txt", ".bin")
+
+# Positions listed per violation before the report is truncated
+_MAX_EXAMPLES = 5
+
+_N = DIR_MASKS[NORTH]
+_E = DIR_MASKS[EAST]
+_S = DIR_MASKS[SOUTH]
+_W = DIR_MASKS[WEST]
+
+
+class Violation(NamedTuple):
+    """One failed property of a maze.
+
+    Attributes:
+        check (str): Name of the failed check.
+        message (str): Human readable description.
+    """
+
+    check: str
+    message: str
+
+
+def _positions(mask: Any, dx: int = 0, dy: int = 0) -> str:
+    """Describe the first positions set in a boolean mask."""
+    import numpy as np
+
+    ys, xs = np.nonzero(mask)
+    shown = ", ".join(
+        f"({x + dx}, {y + dy})"
+        for x, y in zip(xs[:_MAX_EXAMPLES], ys[:_MAX_EXAMPLES])
+    )
+    if len(xs) > _MAX_EXAMPLES:
+        shown += ", ..."
+    return shown
+
+
+def _label_components(open_e: Any, open_s: Any) -> Tuple[Any, int]:
+    """Label connected cells with a vectorised union-find.
+
+    An edge counts as open when the east (or south) wall of the
+    left (or upper) cell is open, so the graph is undirected even if
+    the two sides of a wall disagree. Every round hooks each root to
+    the smallest root across its open edges, then compresses all
+    paths by pointer jumping; the number of components at least
+    halves per round, so there are O(log n) whole-array rounds.
+
+    Args:
+        open_e (ndarray): ``(h, w - 1)`` mask of open east walls.
+        open_s (ndarray): ``(h - 1, w)`` mask of open south walls.
+
+    Returns:
+        Tuple[ndarray, int]: ``(h, w)`` component labels numbered
+        from 0, and the number of components.
+    """
+    import numpy as np
+
+    height = open_s.shape[0] + 1
+    width = open_e.shape[1] + 1
+    cells = np.arange(height * width, dtype=np.int64).reshape(height, width)
+    first = np.concatenate((cells[:, :-1][open_e], cells[:-1, :][open_s]))
+    second = np.concatenate((cells[:, 1:][open_e], cells[1:, :][open_s]))
+
+    labels = cells.ravel().copy()
+    while True:
+        left = labels[first]
+        right = labels[second]
+        differ = left != right
+        if not differ.any():
+            break
+        low = np.minimum(left[differ], right[differ])
+        high = np.maximum(left[differ], right[differ])
+        np.minimum.at(labels, high, low)
+        while True:
+            jumped = labels[labels]
+            if (jumped == labels).all():
+                break
+            labels = jumped
+        # Only edges between different components matter next round
+        first = first[differ]
+        second = second[differ]
+
+    roots, numbered = np.unique(labels, return_inverse=True)
+    return numbered.reshape(height, width), len(roots)
+
+
+def _check_solution(maze: Maze, walls: Any, solution: str) -> Optional[str]:
+    """Follow a direction string from the entry, return an error."""
+    x, y = maze.entry
+    for step, letter in enumerate(solution):
+        direction = DIRECTIONS.find(letter)
+        if direction < 0:
+            return f"invalid direction {letter!r} at step {step}"
+        if walls[y, x] & DIR_MASKS[direction]:
+            return f"step {step} ({letter}) from ({x}, {y}) hits a wall"
+        x += DIR_DX[direction]
+        y += DIR_DY[direction]
+        if not (0 <= x < maze.width and 0 <= y < maze.height):
+            return f"step {step} leaves the maze"
+    if (x, y) != maze.exit:
+        return f"ends at ({x}, {y}) instead of the exit {maze.exit}"
+    return None
+
+
+def _unexpected_fixed(maze: Maze) -> Optional[Violation]:
+    """Report fixed cells outside the '42' logo of the maze size.
+
+    Hex files do not store flags, so `MappedMaze` infers every fully
+    closed cell as fixed, which would exclude an isolated cell from
+    the connectivity check. Only the logo cells are fixed in a
+    generated maze; any other closed cell is cut off from the rest.
+    """
+    import numpy as np
+
+    _, flags = maze.to_numpy()
+    extra = (flags & FLAG_FIXED) != 0
+    for x, y in logo_42_cells(maze.width, maze.height):
+        extra[y, x] = False
+    count = int(np.count_nonzero(extra))
+    if not count:
+        return None
+    return Violation(
+        "connected",
+        f"{count} closed cells outside the logo at {_positions(extra)}",
+    )
+
+
+def validate_maze(
+    maze: Maze,
+    perfect: Optional[bool] = None,
+    solution: Optional[str] = None,
+) -> List[Violation]:
+    """Check every structural property of a maze.
+
+    Checks: walls agree between neighbours, the outer border is
+    closed, fixed cells are closed, no forbidden open area
+    (3x3, 2x4, 4x2) exists, all free cells are connected, the maze
+    has no loops when perfect, the entry and exit are valid and
+    reachable, and the solution (if given) is a valid walk.
+
+    Args:
+        maze (Maze): Maze to validate.
+        perfect (Optional[bool]): Require a loop-free maze.
+            Defaults to ``maze.perfect``.
+        solution (Optional[str]): Direction string to verify.
+
+    Returns:
+        List[Violation]: Every violation found; empty if valid.
+    """
+    require_numpy()
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    if perfect is None:
+        perfect = maze.perfect
+
+    walls, flags = maze.to_numpy()
+    fixed = (flags & FLAG_FIXED) != 0
+    violations: List[Violation] = []
+
+    def report(check: str, mask: Any, what: str,
+               dx: int = 0, dy: int = 0) -> None:
+        count = int(np.count_nonzero(mask))
+        if count:
+            violations.append(Violation(
+                check, f"{count} {what}: {_positions(mask, dx, dy)}"
+            ))
+
+    open_e = (walls[:, :-1] & _E) == 0
+    open_s = (walls[:-1, :] & _S) == 0
+
+    report("consistency", open_e != ((walls[:, 1:] & _W) == 0),
+           "east/west walls disagree at")
+    report("consistency", open_s != ((walls[1:, :] & _N) == 0),
+           "south/north walls disagree at")
+
+    border = np.zeros(walls.shape, dtype=bool)
+    border[0, :] |= (walls[0, :] & _N) == 0
+    border[-1, :] |= (walls[-1, :] & _S) == 0
+    border[:, 0] |= (walls[:, 0] & _W) == 0
+    border[:, -1] |= (walls[:, -1] & _E) == 0
+    report("border", border, "open border walls at")
+
+    report("fixed", fixed & (walls != ALL_WALLS), "open fixed cells at")
+
+    for w, h in FORBIDDEN_ROOMS:
+        if maze.width < w or maze.height < h:
+            continue
+        rows_open = sliding_window_view(open_e, (h, w - 1)).all(
+            axis=(-2, -1))
+        cols_open = sliding_window_view(open_s, (h - 1, w)).all(
+            axis=(-2, -1))
+        report("room", rows_open & cols_open,
+               f"open {w}x{h} areas with top-left corner at")
+
+    label_grid, components = _label_components(open_e, open_s)
+    free_labels = np.unique(label_grid[~fixed])
+    if len(free_labels) > 1:
+        violations.append(Violation(
+            "connected", f"free cells form {len(free_labels)} regions"
+        ))
+
+    open_edges = int(np.count_nonzero(open_e) + np.count_nonzero(open_s))
+    loops = open_edges - (maze.width * maze.height - components)
+    if perfect and loops:
+        violations.append(Violation(
+            "perfect", f"{loops} independent loops in a perfect maze"
+        ))
+
+    endpoints_ok = True
+    for name, (x, y) in (("entry", maze.entry), ("exit", maze.exit)):
+        if not (0 <= x < maze.width and 0 <= y < maze.height):
+            violations.append(Violation(
+                "endpoints", f"{name} ({x}, {y}) is out of bounds"
+            ))
+            endpoints_ok = False
+        elif fixed[y, x]:
+            violations.append(Violation(
+                "endpoints", f"{name} ({x}, {y}) is a fixed cell"
+            ))
+            endpoints_ok = False
+
+    if endpoints_ok:
+        (ex, ey), (xx, xy) = maze.entry, maze.exit
+        if label_grid[ey, ex] != label_grid[xy, xx]:
+            violations.append(Violation(
+                "endpoints", "exit is not reachable from the entry"
+            ))
+        if solution is not None:
+            error = _check_solution(maze, walls, solution)
+            if error is not None:
+                violations.append(Violation("solution", error))
+
+    return violations
+
+
+def validate_file(
+    file_path: str,
+    perfect: Optional[bool] = None,
+) -> List[Violation]:
+    """Validate a hex or binary maze file.
+
+    The format is detected from the file content. Hex files do not
+    record the perfect flag, so it is taken from ``perfect``
+    (default True); binary files use their stored flag unless
+    ``perfect`` is given. Hex files do not record fixed cells
+    either, so closed cells outside the '42' logo are reported as
+    disconnected.
+
+    Args:
+        file_path (str): Path of the maze file.
+        perfect (Optional[bool]): Require a loop-free maze.
+
+    Returns:
+        List[Violation]: Every violation found.
+    """
+    try:
+        with open(file_path, "rb") as file:
+            is_binary = file.read(len(MAGIC)) == MAGIC
+
+        if is_binary:
+            maze, solution = load_binary(file_path)
+            return validate_maze(maze, perfect, solution)
+
+        with MappedMaze(file_path) as mapped:
+            violations = validate_maze(
+                mapped,
+                True if perfect is None else perfect,
+                mapped.solution or None,
+            )
+            extra = _unexpected_fixed(mapped)
+            if extra is not None:
+                violations.append(extra)
+            return violations
+    except (OSError, ValueError) as e:
+        return [Violation("format", str(e))]
+
+
+def find_maze_files(paths: List[str]) -> List[str]:
+    """Expand directories into the maze files they contain.
+
+    Args:
+        paths (List[str]): Files and directories.
+
+    Returns:
+        List[str]: Sorted maze file paths.
+    """
+    files: List[str] = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+        for root, _, names in os.walk(path):
+            files.extend(
+                os.path.join(root, name) for name in names
+                if name.endswith(MAZE_EXTENSIONS)
+            )
+    return sorted(files)
+
+
+def _validate_one(
+    job: Tuple[str, Optional[bool]],
+) -> Tuple[str, List[Violation]]:
+    """Validate a single file inside a worker process."""
+    file_path, perfect = job
+    return file_path, validate_file(file_path, perfect)
+
+
+def validate_files(
+    files: List[str],
+    perfect: Optional[bool] = None,
+    workers: Optional[int] = None,
+) -> Iterator[Tuple[str, List[Violation]]]:
+    """Validate many files on a process pool.
+
+    Args:
+        files (List[str]): Maze files.
+        perfect (Optional[bool]): Require loop-free mazes.
+        workers (Optional[int]): Worker processes, CPU count if None.
+
+    Yields:
+        Tuple[str, List[Violation]]: File path and its violations,
+        in input order.
+    """
+    workers = workers or os.cpu_count() or 1
+    jobs = [(path, perfect) for path in files]
+    if workers == 1 or len(jobs) < 2:
+        yield from map(_validate_one, jobs)
+        return
+
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_validate_one, jobs, chunksize=chunksize)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point.
+
+    Returns:
+        int: 0 if every maze is valid, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m mazegen.validate",
+        description="Validate generated maze files.",
+    )
+    parser.add_argument("paths", nargs="+",
+                        help="maze files or directories")
+    parser.add_argument("--imperfect", action="store_true",
+                        help="allow loops (non-perfect mazes)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    perfect = False if args.imperfect else None
+    files = find_maze_files(args.paths)
+    invalid = 0
+
+    for path, violations in validate_files(files, perfect, args.workers):
+        if not violations:
+            print(f"OK      {path}")
+            continue
+        invalid += 1
+        print(f"INVALID {path}")
+        for violation in violations:
+            print(f"    [{violation.check}] {violation.message}")
+
+    print(f"\n{len(files) - invalid}/{len(files)} valid")
+    return 1 if invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,7 +4,7 @@ import time
 from typing import List, Optional, Tuple
 
 from mazegen.maze import Maze
-from mazegen.solver import shortest_path, save_solution
+from mazegen.solver import cached_shortest_path, save_solution
 from mazegen.maze_generator import MazeGenerator, InvalidEntryOrExit
 
 from .render import Render
@@ -60,8 +60,6 @@ class AsciiRender(Render):
         self.logo_42_color = "\x1b[35m"
         self.path_color = "\x1b[93m"
 
-        self._cached_path: Optional[List[Pos]] = None
-
     def run(
         self,
         maze: Maze,
@@ -90,16 +88,14 @@ class AsciiRender(Render):
             seed (int, optional): Random seed. Defaults to 1.
             apply_logo_42 (bool, optional): Apply logo overlay.
         """
-        save_solution(maze, shortest_path(maze), self.file_path)
+        save_solution(maze, cached_shortest_path(maze), self.file_path)
 
         while True:
             self._clear()
 
             path = None
             if self.show_path:
-                if self._cached_path is None:
-                    self._cached_path = shortest_path(maze)
-                path = self._cached_path
+                path = cached_shortest_path(maze)
 
             self.draw_maze(maze, path=path)
             self._print_menu()
@@ -127,32 +123,20 @@ class AsciiRender(Render):
 
                 generator.generate_maze(new_maze, algorithm)
                 maze = new_maze
-                self._cached_path = None
+                path = cached_shortest_path(maze)
 
-                save_solution(
-                    maze,
-                    shortest_path(maze),
-                    self.file_path,
-                )
+                save_solution(maze, path, self.file_path)
 
-                if self.show_path:
-                    self._cached_path = shortest_path(maze)
-                    if self.animate_path and self._cached_path:
-                        self._animate_path_once(
-                            maze,
-                            self._cached_path,
-                        )
+                if self.show_path and self.animate_path and path:
+                    self._animate_path_once(maze, path)
 
             elif cmd == "p":
                 self.show_path = not self.show_path
 
                 if self.show_path:
-                    self._cached_path = shortest_path(maze)
-                    if self.animate_path and self._cached_path:
-                        self._animate_path_once(
-                            maze,
-                            self._cached_path,
-                        )
+                    path = cached_shortest_path(maze)
+                    if self.animate_path and path:
+                        self._animate_path_once(maze, path)
 
             elif cmd == "c":
                 self.wall_palette_index = (
@@ -5,7 +5,7 @@ from typing import List, Optional, Tuple
 import pygame
 
 from mazegen.maze import Maze
-from mazegen.solver import shortest_path, save_solution
+from mazegen.solver import cached_shortest_path, save_solution
 from mazegen.maze_generator import MazeGenerator, InvalidEntryOrExit
 
 from .render import Render
@@ -64,6 +64,9 @@ class PygameRender(Render):
         self.path_anim_index = 0
         self.path_step_ms = 25
         self._last_path_step_ms = 0
+        # Solved path of the displayed maze, by (id(maze), version)
+        self._path: Optional[List[Pos]] = None
+        self._path_key: Optional[Tuple[int, int]] = None
 
         # Colors
         self.bg = (20, 20, 20)
@@ -82,13 +85,21 @@ class PygameRender(Render):
         ]
         self.wall_palette_index = 0
 
-        self._cached_path: Optional[List[Pos]] = None
-
         self.menu_height = 90
         self.menu_bg = (10, 10, 10)
         self.menu_text = (230, 230, 230)
         self.menu_accent = (160, 160, 160)
 
+        # Frame caches: walls and logo are pre-rendered once per maze
+        # and palette, the path is drawn cell by cell on an overlay
+        self._static: Optional[pygame.Surface] = None
+        self._static_key: Optional[Tuple[object, ...]] = None
+        self._overlay: Optional[pygame.Surface] = None
+        self._overlay_key: Optional[Tuple[object, ...]] = None
+        self._overlay_count = 0
+        self._frame_screen: Optional[pygame.Surface] = None
+        self._frame_key: Optional[Tuple[object, ...]] = None
+
     @property
     def wall(self) -> Tuple[int, int, int]:
         """Return the current wall color.
@@ -101,15 +112,12 @@ class PygameRender(Render):
     def _start_path_animation(self, maze: Maze) -> None:
         """Initialize and start path animation.
 
-        Computes the shortest path if not already cached and
-        resets the animation state.
+        Resets the animation state; the path itself comes from the
+        solver cache.
 
         Args:
             maze (Maze): Maze instance.
         """
-        if self._cached_path is None:
-            self._cached_path = shortest_path(maze)
-
         self.path_animating = True
         self.path_anim_index = 0
         self._last_path_step_ms = pygame.time.get_ticks()
@@ -152,7 +160,7 @@ class PygameRender(Render):
         pygame.display.set_caption("Maze (Pygame Render)")
 
         clock = pygame.time.Clock()
-        save_solution(maze, shortest_path(maze), self.output_file)
+        save_solution(maze, cached_shortest_path(maze), self.output_file)
 
         running = True
         while running:
@@ -160,6 +168,9 @@ class PygameRender(Render):
                 if event.type == pygame.QUIT:
                     running = False
 
+                if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                    self.invalidate()
+
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         running = False
@@ -192,11 +203,10 @@ class PygameRender(Render):
                             generator.generate_maze(new_maze, algorithm)
 
                             maze = new_maze
-                            self._cached_path = None
 
                             save_solution(
                                 maze,
-                                shortest_path(maze),
+                                cached_shortest_path(maze),
                                 self.output_file,
                             )
 
@@ -226,43 +236,145 @@ class PygameRender(Render):
                             not self.colorize_logo_42
                         )
 
-            screen.fill(self.bg)
-            self._draw_grid_and_walls(screen, maze)
-
-            if self.show_path:
-                if self._cached_path is None:
-                    self._cached_path = shortest_path(maze)
-
-                if self._cached_path:
-                    if self.path_animating:
-                        now = pygame.time.get_ticks()
-                        if (
-                            now - self._last_path_step_ms
-                            >= self.path_step_ms
-                        ):
-                            self._last_path_step_ms = now
-                            self.path_anim_index += 1
-
-                            if self.path_anim_index >= len(
-                                self._cached_path
-                            ):
-                                self.path_anim_index = len(
-                                    self._cached_path
-                                )
-                                self.path_animating = False
+            dirty = self.render_frame(screen, maze)
+            if dirty:
+                pygame.display.update(dirty)
+            clock.tick(self.fps)
 
-                    partial_path = self._cached_path[
-                        : self.path_anim_index
-                    ]
-                    self._draw_path(screen, maze, partial_path)
+        pygame.quit()
 
-            self._draw_entry_exit(screen, maze)
-            self._draw_menu(screen, maze)
+    def invalidate(self) -> None:
+        """Force the next frame to be redrawn completely."""
+        self._frame_key = None
 
-            pygame.display.flip()
-            clock.tick(self.fps)
+    def render_frame(
+        self,
+        screen: pygame.Surface,
+        maze: Maze,
+    ) -> List[pygame.Rect]:
+        """Draw one frame: maze, path, entry/exit and menu.
 
-        pygame.quit()
+        Advances the path animation when it is running. The walls and
+        logo come from a cached surface, rebuilt when the maze or the
+        colors change, and the path is kept on an overlay. When
+        nothing but the path changed since the previous frame on the
+        same surface, only the new path cells are drawn. Does not
+        update the display, so it also works on offscreen surfaces.
+
+        Args:
+            screen (pygame.Surface): Surface to draw on.
+            maze (Maze): Maze instance to render.
+
+        Returns:
+            List[pygame.Rect]: Areas of ``screen`` that changed, to
+            pass to ``pygame.display.update``.
+        """
+        static = self._static_surface(maze)
+        overlay = self._path_overlay(maze)
+        new_cells = self._advance_path(maze, overlay)
+
+        key = (static, overlay, self.show_path, self.wall_palette_index)
+        if screen is self._frame_screen and key == self._frame_key:
+            for rect in new_cells:
+                screen.blit(overlay, rect, rect)
+            return new_cells
+
+        self._frame_screen = screen
+        self._frame_key = key
+        screen.fill(self.bg)
+        screen.blit(static, (0, 0))
+        if self.show_path:
+            screen.blit(overlay, (0, 0))
+        self._draw_entry_exit(screen, maze)
+        self._draw_menu(screen, maze)
+        return [screen.get_rect()]
+
+    def _maze_size_px(self, maze: Maze) -> Tuple[int, int]:
+        """Return the size in pixels of the maze area, menu excluded."""
+        return (self.margin * 2 + maze.width * self.cell_size,
+                self.margin * 2 + maze.height * self.cell_size)
+
+    def _static_surface(self, maze: Maze) -> pygame.Surface:
+        """Return the cached background, walls and logo of a maze.
+
+        Args:
+            maze (Maze): Maze instance.
+
+        Returns:
+            pygame.Surface: The maze area, rebuilt only when the maze,
+            its version or the colors changed.
+        """
+        key = (maze, maze.version, self.wall,
+               self.colorize_logo_42, self.cell_size)
+        if self._static is None or key != self._static_key:
+            self._static = pygame.Surface(self._maze_size_px(maze))
+            self._static.fill(self.bg)
+            self._draw_grid_and_walls(self._static, maze)
+            self._static_key = key
+        return self._static
+
+    def _path_overlay(self, maze: Maze) -> pygame.Surface:
+        """Return the transparent overlay holding the drawn path cells.
+
+        It is cleared when the maze changes or the path animation
+        restarts.
+
+        Args:
+            maze (Maze): Maze instance.
+
+        Returns:
+            pygame.Surface: The path overlay.
+        """
+        key = (maze, maze.version, self.cell_size)
+        if (self._overlay is None or key != self._overlay_key
+                or self.path_anim_index < self._overlay_count):
+            self._overlay = pygame.Surface(self._maze_size_px(maze),
+                                           pygame.SRCALPHA)
+            self._overlay_key = key
+            self._overlay_count = 0
+            self.invalidate()
+        return self._overlay
+
+    def _advance_path(
+        self,
+        maze: Maze,
+        overlay: pygame.Surface,
+    ) -> List[pygame.Rect]:
+        """Advance the path animation and draw its new cells.
+
+        Args:
+            maze (Maze): Maze instance.
+            overlay (pygame.Surface): Path overlay to draw on.
+
+        Returns:
+            List[pygame.Rect]: Rectangles of the cells drawn, empty
+            when the path is hidden.
+        """
+        if not self.show_path:
+            return []
+
+        key = (id(maze), maze.version)
+        if key != self._path_key:
+            self._path = cached_shortest_path(maze)
+            self._path_key = key
+        path = self._path
+        if not path:
+            return []
+
+        if self.path_animating:
+            now = pygame.time.get_ticks()
+            if now - self._last_path_step_ms >= self.path_step_ms:
+                self._last_path_step_ms = now
+                self.path_anim_index += 1
+
+                if self.path_anim_index >= len(path):
+                    self.path_anim_index = len(path)
+                    self.path_animating = False
+
+        end = min(self.path_anim_index, len(path))
+        new_cells = path[self._overlay_count:end]
+        self._overlay_count = max(self._overlay_count, end)
+        return self._draw_path(overlay, maze, new_cells)
 
     def _draw_grid_and_walls(self, screen: pygame.Surface, maze: Maze) -> None:
         """Draw all cells and walls of the maze.
@@ -334,27 +446,38 @@ class PygameRender(Render):
                 cell_rect(maze.exit).inflate(-cs // 3, -cs // 3),
             )
 
-    def _draw_path(self, screen: pygame.Surface,
-                   maze: Maze, path: Optional[List[Pos]]) -> None:
+    def _draw_path(self, screen: pygame.Surface, maze: Maze,
+                   path: Optional[List[Pos]]) -> List[pygame.Rect]:
         """Draw the path through the maze.
 
+        The entry and exit cells are skipped: their markers cover the
+        path square.
+
         Args:
             screen (pygame.Surface): Pygame surface to draw on.
             maze (Maze): Maze instance.
             path (Optional[List[Pos]]): List
             of positions (x, y) forming the path.
+
+        Returns:
+            List[pygame.Rect]: Rectangles drawn.
         """
         if not path:
-            return
+            return []
 
         cs = self.cell_size
         m = self.margin
+        rects = []
 
         for (x, y) in path:
+            if (x, y) == maze.entry or (x, y) == maze.exit:
+                continue
             x0 = m + x * cs
             y0 = m + y * cs
             rect = pygame.Rect(x0, y0, cs, cs).inflate(-cs // 2, -cs // 2)
             pygame.draw.rect(screen, self.path_color, rect)
+            rects.append(rect)
+        return rects
 
     def _draw_menu(self, screen: pygame.Surface, maze: Maze) -> None:
         """Draw the bottom menu with controls and current state.
@@ -0,0 +1,89 @@
+"""Bulk wall operations on mazes whose storage is not a bytearray."""
+
+from pathlib import Path
+
+import pytest
+
+from mazegen.constants import EAST, NORTH, WEST
+from mazegen.mapped import MappedMaze
+from mazegen.maze import Maze
+
+pytest.importorskip("numpy")
+from mazegen import arrays  # noqa: E402
+
+_N = 0b0001
+_E = 0b0010
+_W = 0b1000
+
+
+@pytest.fixture
+def hex_file(tmp_path: Path) -> str:
+    """A 4x3 maze with open rows, the north wall of cell 1 missing and
+    the wall between cells 4 and 5 open on one side only."""
+    maze = Maze(4, 3, entry=(0, 0), exit=(3, 2))
+    for index in range(maze.width * maze.height):
+        if (index + 1) % maze.width:
+            maze.remove_wall_idx(index, EAST)
+    maze._walls[1] &= ~_N
+    maze._walls[5] |= _W
+    path = tmp_path / "maze.txt"
+    maze.save_hex(str(path))
+    return str(path)
+
+
+def test_repair_walls_writes_back_to_mapped_maze(hex_file: str) -> None:
+    with MappedMaze(hex_file, copy_on_write=True) as maze:
+        version = maze.version
+
+        assert arrays.repair_walls(maze) == 1
+        assert maze.has_wall_idx(4, EAST)
+        assert maze.has_wall_idx(5, WEST)
+        assert maze.version > version
+
+
+def test_seal_border_writes_back_to_mapped_maze(hex_file: str) -> None:
+    with MappedMaze(hex_file, copy_on_write=True) as maze:
+        arrays.seal_border(maze)
+
+        assert all(maze.has_wall_idx(x, NORTH) for x in range(maze.width))
+
+
+def test_mask_fixed_matches_regular_maze(hex_file: str) -> None:
+    with MappedMaze(hex_file, copy_on_write=True) as mapped:
+        # A mapped maze infers fixed cells from closed cells
+        mapped._walls[6] = 0b1111
+        regular = Maze(mapped.width, mapped.height)
+        regular._walls = bytearray(mapped._walls)
+        regular.set_fixed_idx(6)
+
+        arrays.mask_fixed(mapped)
+        arrays.mask_fixed(regular)
+
+        assert list(mapped._walls) == list(regular._walls)
+
+
+def test_read_only_mapped_maze_raises(hex_file: str) -> None:
+    with MappedMaze(hex_file) as maze:
+        version = maze.version
+
+        with pytest.raises(TypeError):
+            arrays.seal_border(maze)
+        assert maze.version == version
+        assert not maze.has_wall_idx(1, NORTH)
+
+
+def test_no_op_keeps_version() -> None:
+    maze = Maze(5, 4)
+    version = maze.version
+
+    arrays.seal_border(maze)
+    arrays.mask_fixed(maze)
+    assert arrays.repair_walls(maze) == 0
+    assert maze.version == version
+
+
+def test_read_only_check_happens_before_work(hex_file: str) -> None:
+    with MappedMaze(hex_file) as maze:
+        # No cell is fixed, so mask_fixed would not change anything
+        with pytest.raises(TypeError):
+            arrays.mask_fixed(maze)
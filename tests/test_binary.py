@@ -0,0 +1,59 @@
+"""Round-trip of the compact binary maze format."""
+
+from pathlib import Path
+
+import pytest
+
+from mazegen.binary import load_binary, save_binary
+from mazegen.maze import Maze
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solver import path_to_directions, shortest_path
+
+
+@pytest.mark.parametrize("width, height", [(1, 1), (9, 7), (31, 12)])
+@pytest.mark.parametrize("perfect", [True, False])
+def test_round_trip(tmp_path: Path, width: int, height: int,
+                    perfect: bool) -> None:
+    maze = Maze(width, height, perfect=perfect or width * height < 4,
+                seed=7, entry=(0, 0), exit=(width - 1, height - 1))
+    generator = MazeGenerator(7)
+    if width >= 9 and height >= 7:
+        generator.set_logo_42(maze)
+    generator.generate_maze(maze, "kruskal")
+    path = shortest_path(maze)
+    assert path is not None
+    solution = path_to_directions(path)
+
+    file_path = str(tmp_path / "maze.bin")
+    save_binary(maze, file_path, solution)
+    loaded, loaded_solution = load_binary(file_path)
+
+    assert bytes(loaded._walls) == bytes(maze._walls)
+    assert [loaded.is_fixed_idx(i) for i in range(width * height)] == \
+        [maze.is_fixed_idx(i) for i in range(width * height)]
+    assert (loaded.width, loaded.height) == (width, height)
+    assert (loaded.entry, loaded.exit) == (maze.entry, maze.exit)
+    assert loaded.perfect == maze.perfect
+    assert loaded.algorithm == "kruskal"
+    assert loaded_solution == solution
+
+
+def test_without_solution(tmp_path: Path) -> None:
+    maze = Maze(4, 3)
+    file_path = str(tmp_path / "maze.bin")
+    save_binary(maze, file_path)
+
+    _, solution = load_binary(file_path)
+    assert solution is None
+
+
+def test_rejects_bad_solution(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        save_binary(Maze(4, 3), str(tmp_path / "maze.bin"), "NX")
+
+
+def test_rejects_other_files(tmp_path: Path) -> None:
+    file_path = tmp_path / "maze.bin"
+    file_path.write_bytes(b"not a maze")
+    with pytest.raises(ValueError):
+        load_binary(str(file_path))
@@ -0,0 +1,49 @@
+"""Agreement between the shortest-path methods."""
+
+from typing import List, Tuple
+
+import pytest
+
+from mazegen.maze import Maze
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solver import SOLVERS, shortest_path
+
+
+def _is_walk(maze: Maze, path: List[Tuple[int, int]]) -> bool:
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        index = maze.cell_id(x1, y1)
+        direction = maze.direction_between(index, maze.cell_id(x2, y2))
+        if direction < 0 or maze.has_wall_idx(index, direction):
+            return False
+    return True
+
+
+@pytest.mark.parametrize("algorithm", ["dfs", "prim", "kruskal", "eller"])
+@pytest.mark.parametrize("perfect", [True, False])
+@pytest.mark.parametrize("seed", [1, 7, 42])
+def test_methods_agree(algorithm: str, perfect: bool, seed: int) -> None:
+    maze = Maze(25, 18, perfect=perfect, seed=seed,
+                entry=(0, 0), exit=(24, 17))
+    generator = MazeGenerator(seed)
+    generator.set_logo_42(maze)
+    generator.generate_maze(maze, algorithm)
+
+    paths = {method: shortest_path(maze, method) for method in SOLVERS}
+    lengths = {method: len(path or []) for method, path in paths.items()}
+
+    assert len(set(lengths.values())) == 1, lengths
+    for path in paths.values():
+        assert path is not None
+        assert path[0] == maze.entry and path[-1] == maze.exit
+        assert _is_walk(maze, path)
+
+
+def test_unreachable_exit() -> None:
+    maze = Maze(3, 3, entry=(0, 0), exit=(2, 2))
+    for method in SOLVERS:
+        assert shortest_path(maze, method) is None
+
+
+def test_unknown_method() -> None:
+    with pytest.raises(ValueError):
+        shortest_path(Maze(3, 3), "dijkstra")
@@ -0,0 +1,60 @@
+"""Step-wise generation replays exactly what generate_maze builds."""
+
+import pytest
+
+from mazegen.constants import DIR_MASKS
+from mazegen.maze import Maze
+from mazegen.maze_generator import MazeGenerator
+
+ALGORITHMS = ["dfs", "prim", "growing_tree", "kruskal", "eller",
+              "binary_tree", "sidewinder"]
+
+
+def _new_maze(perfect: bool, seed: int) -> Maze:
+    maze = Maze(21, 13, perfect=perfect, seed=seed,
+                entry=(0, 0), exit=(20, 12))
+    MazeGenerator(seed).set_logo_42(maze)
+    return maze
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+@pytest.mark.parametrize("perfect", [True, False])
+@pytest.mark.parametrize("seed", [3, 11])
+def test_replay_matches_generate_maze(algorithm: str, perfect: bool,
+                                      seed: int) -> None:
+    expected = _new_maze(perfect, seed)
+    MazeGenerator(seed).generate_maze(expected, algorithm)
+
+    maze = _new_maze(perfect, seed)
+    version = maze.version
+    steps = 0
+    for index, direction in MazeGenerator(seed).generate_steps(
+            maze, algorithm):
+        steps += 1
+        # Each step is applied before it is yielded
+        assert not maze.has_wall_idx(index, direction)
+        assert maze.version - version == steps
+
+    assert bytes(maze._walls) == bytes(expected._walls)
+    assert bytes(maze._flags) == bytes(expected._flags)
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_every_step_opens_a_closed_wall(algorithm: str) -> None:
+    maze = _new_maze(False, 5)
+    walls = bytearray(maze._walls)
+    for index, direction in MazeGenerator(5).generate_steps(maze, algorithm):
+        assert walls[index] & DIR_MASKS[direction]
+        walls[index] &= ~DIR_MASKS[direction]
+
+
+def test_perfect_maze_step_count() -> None:
+    maze = _new_maze(True, 9)
+    free = sum(not maze.is_fixed_idx(i) for i in range(21 * 13))
+    steps = list(MazeGenerator(9).generate_steps(maze, "kruskal"))
+    assert len(steps) == free - 1
+
+
+def test_unknown_algorithm() -> None:
+    with pytest.raises(ValueError):
+        next(MazeGenerator(1).generate_steps(_new_maze(True, 1), "nope"))
@@ -0,0 +1,109 @@
+"""validate_maze finds deliberately broken properties."""
+
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from mazegen.constants import DIR_MASKS, EAST, NORTH, SOUTH, WEST
+from mazegen.maze import Maze
+from mazegen.maze_generator import MazeGenerator
+from mazegen.solver import path_to_directions, shortest_path
+
+pytest.importorskip("numpy")
+from mazegen.validate import validate_file, validate_maze  # noqa: E402
+
+
+def _maze(perfect: bool = True) -> Maze:
+    maze = Maze(20, 15, perfect=perfect, seed=4, entry=(0, 0), exit=(19, 14))
+    generator = MazeGenerator(4)
+    generator.set_logo_42(maze)
+    generator.generate_maze(maze, "dfs")
+    return maze
+
+
+def _checks(maze: Maze, perfect: Optional[bool] = None,
+            solution: Optional[str] = None) -> List[str]:
+    return [violation.check
+            for violation in validate_maze(maze, perfect, solution)]
+
+
+def _free_cell(maze: Maze) -> int:
+    """A free inner cell whose east neighbour is free too."""
+    for index in range(maze.width * maze.height):
+        x, y = maze.position(index)
+        if (0 < x < maze.width - 2 and 0 < y < maze.height - 1
+                and not maze.is_fixed_idx(index)
+                and not maze.is_fixed_idx(index + 1)):
+            return index
+    raise AssertionError("no free cell")
+
+
+@pytest.mark.parametrize("perfect", [True, False])
+def test_generated_maze_is_valid(perfect: bool) -> None:
+    maze = _maze(perfect)
+    path = shortest_path(maze)
+    assert path is not None
+    assert validate_maze(maze, solution=path_to_directions(path)) == []
+
+
+def test_one_sided_wall() -> None:
+    maze = _maze()
+    index = _free_cell(maze)
+    maze._walls[index] ^= DIR_MASKS[EAST]
+    assert "consistency" in _checks(maze)
+
+
+def test_open_border() -> None:
+    maze = _maze()
+    maze._walls[3] &= ~DIR_MASKS[NORTH]
+    assert "border" in _checks(maze)
+
+
+def test_isolated_cell() -> None:
+    maze = _maze()
+    index = _free_cell(maze)
+    for direction in (NORTH, EAST, SOUTH, WEST):
+        maze.add_wall_idx(index, direction)
+    assert "connected" in _checks(maze)
+
+
+def test_loop_in_perfect_maze() -> None:
+    maze = _maze()
+    index = next(i for i in range(maze.width * (maze.height - 1))
+                 if maze.has_wall_idx(i, SOUTH)
+                 and not maze.is_fixed_idx(i)
+                 and not maze.is_fixed_idx(i + maze.width))
+    maze.remove_wall_idx(index, SOUTH)
+    assert "perfect" in _checks(maze)
+    assert "perfect" not in _checks(maze, perfect=False)
+
+
+def test_open_room() -> None:
+    maze = Maze(6, 6, entry=(0, 0), exit=(5, 5))
+    for index in range(36):
+        x, y = maze.position(index)
+        if x < 5:
+            maze.remove_wall_idx(index, EAST)
+        if y < 5:
+            maze.remove_wall_idx(index, SOUTH)
+    assert "room" in _checks(maze, perfect=False)
+
+
+def test_bad_solution() -> None:
+    maze = _maze()
+    assert "solution" in _checks(maze, solution="N")
+
+
+def test_isolated_cell_in_hex_file(tmp_path: Path) -> None:
+    maze = _maze()
+    path = str(tmp_path / "maze.txt")
+    maze.save_hex(path)
+    assert validate_file(path) == []
+
+    index = _free_cell(maze)
+    for direction in (NORTH, EAST, SOUTH, WEST):
+        maze.add_wall_idx(index, direction)
+    maze.save_hex(path)
+    assert "connected" in [violation.check
+                           for violation in validate_file(path)]